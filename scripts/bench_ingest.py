@@ -0,0 +1,85 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from scripts.bench_reconcile import make_pair
+from src.handlers.csv_handler import CSVHandler
+from src.handlers.excel_handler import HAS_CALAMINE, ExcelHandler
+
+
+def write_csv(path: str, size_mb: int, cols: int):
+    """Appends blocks of the synthetic A side until the file reaches size_mb."""
+    block, _ = make_pair(100000, cols)
+    block.to_csv(path, index=False)
+    start = int(block["Deal Id"].max()) + 1
+    while os.path.getsize(path) < size_mb * 1024 * 1024:
+        block["Deal Id"] = range(start, start + len(block))
+        block.to_csv(path, index=False, header=False, mode="a")
+        start += len(block)
+
+
+def timed_read(label: str, read, path: str):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = read(path)
+    print(f"{label:>24}: {time.perf_counter() - start:7.2f}s  rows={len(df)}")
+    return df
+
+
+def bench_excel(path: str, columns: list = None):
+    """pd.read_excel (openpyxl) vs the handler's automatically chosen reader, whole sheet and projected."""
+    engines = ["pandas", "openpyxl"] + (["calamine"] if HAS_CALAMINE else [])
+    frames = {}
+    for engine in engines:
+        handler = ExcelHandler(engine=engine)
+        frames[engine] = timed_read(f"excel {engine}", handler.read, path)
+        if columns:
+            timed_read(f"excel {engine} {len(columns)} cols", lambda p: handler.read(p, columns=columns), path)
+    pd.testing.assert_frame_equal(frames["pandas"], frames["openpyxl"])
+    print("Frames identical")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingestion speed: CSV parsers (Python sniffing vs C/pyarrow) or Excel readers.")
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--path", help="Existing CSV (or .xlsx) to read instead of a generated one")
+    parser.add_argument("--columns", help="Comma-separated projection timed on .xlsx files")
+    parser.add_argument("--skip-python", action="store_true", help="Only time the fast path")
+    args = parser.parse_args()
+
+    path = args.path
+    if path and path.lower().endswith(".xlsx"):
+        bench_excel(path, args.columns.split(",") if args.columns else None)
+        return
+    if path is None:
+        path = os.path.join(tempfile.gettempdir(), f"bench_ingest_{args.size_mb}mb.csv")
+        if not os.path.exists(path):
+            print(f"Writing {args.size_mb} MB test file {path} ...")
+            write_csv(path, args.size_mb, args.cols)
+    print(f"File: {path} ({os.path.getsize(path) / 1024 / 1024:.0f} MB)")
+
+    # Parse only (clean_data is the same for both and timed separately)
+    handler = CSVHandler()
+    fast = timed_read("parse c", lambda p: pd.read_csv(p, **handler._read_args(p)), path)
+    if CSVHandler(engine="pyarrow").engine == "pyarrow":
+        arrow = CSVHandler(engine="pyarrow")
+        timed_read("parse pyarrow", lambda p: pd.read_csv(p, **arrow._read_args(p)), path)
+    if not args.skip_python:
+        slow = timed_read("parse python", lambda p: pd.read_csv(p, sep=None, engine='python'), path)
+        pd.testing.assert_frame_equal(fast, slow)
+        print("Frames identical")
+        del slow
+    timed_read("clean_data", lambda p: handler.clean_data(fast), path)
+
+
+if __name__ == "__main__":
+    main()
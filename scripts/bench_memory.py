@@ -0,0 +1,54 @@
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KB on Linux (bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_once(rows: int, cols: int, copy: bool):
+    """One reconciliation in this process; prints the peak RSS before and after it."""
+    from scripts.bench_reconcile import make_pair
+    from src.core.reconciler import ReconEngine
+
+    df_a, df_b = make_pair(rows, cols)
+    mapping = {c: c for c in df_a.columns if c != "Deal Id"}
+    mapping["Deal Id"] = "Trade Id"
+    inputs_mb = peak_rss_mb()
+
+    start = time.perf_counter()
+    result = ReconEngine(df_a, df_b, copy=copy).reconcile("Deal Id", mapping, tolerance=0.01)
+    elapsed = time.perf_counter() - start
+
+    peak_mb = peak_rss_mb()
+    print(f"{'copy' if copy else 'zero-copy':>9}: inputs={inputs_mb:.0f}MB peak={peak_mb:.0f}MB "
+          f"recon_overhead={peak_mb - inputs_mb:.0f}MB time={elapsed:.2f}s mismatches={result.mismatches}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Peak RSS of ReconEngine.reconcile with and without copying the inputs.")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--variant", choices=["copy", "zero-copy"], help="Run a single variant in this process")
+    args = parser.parse_args()
+
+    if args.variant:
+        run_once(args.rows, args.cols, copy=args.variant == "copy")
+        return
+
+    # ru_maxrss never goes down, so every variant gets a fresh interpreter
+    for variant in ["copy", "zero-copy"]:
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--rows", str(args.rows), "--cols", str(args.cols),
+                        "--variant", variant], check=True)
+
+
+if __name__ == "__main__":
+    main()
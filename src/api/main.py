@@ -1,5 +1,6 @@
 from src.core.coordinator import ReconCoordinator
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from typing import List
 from fastapi.responses import FileResponse
 import shutil
 import os
@@ -18,7 +19,13 @@ async def reconcile_files(
     file_a: UploadFile = File(...),
     file_b: UploadFile = File(...),
     key_column: str = Form(...),
-    mapping_json: str = Form(...)
+    mapping_json: str = Form(...),
+    workers: int = Form(1),
+    duplicates: str = Form("first"),
+    fuzzy: bool = Form(False),
+    group_by: str = Form(""),
+    measures: str = Form(""),
+    drill_down: bool = Form(False)
 ):
     path_a = os.path.join(UPLOAD_DIR, file_a.filename)
     path_b = os.path.join(UPLOAD_DIR, file_b.filename)
@@ -30,10 +37,58 @@ async def reconcile_files(
         with open(path_b, "wb") as buffer:
             shutil.copyfileobj(file_b.file, buffer)
 
-        # In a real API, we'd use the provided mapping_json
-        # For now, we use the coordinator's full flow
-        coordinator.run_full_recon(path_a, path_b, key_column, output_path)
+        mapping = json.loads(mapping_json)
+        measure_cols = [m.strip() for m in measures.split(",") if m.strip()]
+        coordinator.run_full_recon(path_a, path_b, key_column, mapping, output_path, workers=max(1, workers), duplicates=duplicates, fuzzy=fuzzy,
+                                   group_by=group_by or None, measures=measure_cols, drill_down=drill_down)
         
         return FileResponse(output_path, filename="recon_report.xlsx")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/quick-check")
+async def quick_check_files(
+    file_a: UploadFile = File(...),
+    file_b: UploadFile = File(...),
+    key_column: str = Form(...),
+    mapping_json: str = Form(...),
+    sample_fraction: float = Form(0.05),
+    max_breaks: int = Form(0)
+):
+    path_a = os.path.join(UPLOAD_DIR, file_a.filename)
+    path_b = os.path.join(UPLOAD_DIR, file_b.filename)
+    
+    try:
+        with open(path_a, "wb") as buffer:
+            shutil.copyfileobj(file_a.file, buffer)
+        with open(path_b, "wb") as buffer:
+            shutil.copyfileobj(file_b.file, buffer)
+
+        mapping = json.loads(mapping_json)
+        return coordinator.run_quick_check(path_a, path_b, key_column, mapping, sample_fraction=sample_fraction, max_breaks=max_breaks or None)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/reconcile-multi")
+async def reconcile_multi_files(
+    files: List[UploadFile] = File(...),
+    key_column: str = Form(...),
+    mappings_json: str = Form(...)
+):
+    output_path = os.path.join(OUTPUT_DIR, "reconciliation_report_multi.xlsx")
+    
+    try:
+        paths = []
+        for upload in files:
+            path = os.path.join(UPLOAD_DIR, upload.filename)
+            with open(path, "wb") as buffer:
+                shutil.copyfileobj(upload.file, buffer)
+            paths.append(path)
+
+        # One mapping per source after the first (reference) file
+        mappings = json.loads(mappings_json)
+        coordinator.run_multi_recon(paths, key_column, mappings, output_path)
+        
+        return FileResponse(output_path, filename="recon_report_multi.xlsx")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+from src.core.compare import to_float
+
+# Decimals kept on the reported group totals (float sums pick up noise like 1000.0000000002)
+TOTAL_DECIMALS = 6
+
+
+def measure_values(values: np.ndarray, column: str, group: str) -> np.ndarray:
+    """float64 cells of a measure column; cells float() rejects count as 0 and are reported once."""
+    parsed, floats = to_float(values)
+    rejected = ~parsed & ~pd.isna(values)
+    if rejected.any():
+        print(f"Warning: {int(rejected.sum())} non-numeric cells in measure '{column}' of Group {group} are counted as 0")
+    return np.where(np.isnan(floats), 0.0, floats)
+
+
+def aggregate_measures(group_keys: np.ndarray, measures: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Sums every measure per group key in one vectorized groupby.
+    Returns a frame indexed by group key with one column per measure plus '_rows' (rows per group).
+    """
+    frame = pd.DataFrame(measures)
+    frame["_rows"] = 1
+    frame.index = pd.Index(group_keys, dtype=object)
+    return frame.groupby(level=0, sort=False).sum()
+
+
+def align_groups(totals_a: pd.DataFrame, totals_b: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Positions of the groups present on both sides plus the groups only one side has."""
+    pos_b = totals_b.index.get_indexer(totals_a.index)
+    in_b = pos_b >= 0
+    return {
+        "rows_a": np.flatnonzero(in_b),
+        "rows_b": pos_b[in_b],
+        "only_in_a": totals_a.index[~in_b].to_numpy(dtype=object),
+        "only_in_b": totals_b.index[~totals_b.index.isin(totals_a.index)].to_numpy(dtype=object),
+    }
+
+
+def rounded_totals(values: np.ndarray) -> List[float]:
+    return np.round(values.astype(np.float64), TOTAL_DECIMALS).tolist()
@@ -0,0 +1,136 @@
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Coordinator of the current pool process (built once per process, reused for its pairs)
+_worker_coordinator = None
+
+# Pool workers are started fresh instead of forked: batches run from the desktop app's worker QThread,
+# and forking a multithreaded process can leave a child stuck on a lock another thread held.
+# Spawned workers import the caller's main module, so scripts using concurrency/workers > 1 need
+# the usual `if __name__ == "__main__":` guard (run_aura.py, scripts/ and the API already have it)
+POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def default_concurrency() -> int:
+    """Pairs run at the same time by default: leave one core for the UI/OS, cap at 8."""
+    return max(1, min(8, (os.cpu_count() or 2) - 1))
+
+
+def run_pair(coordinator, job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs one pair of a batch and never raises: the outcome records SUCCESS with the report path,
+    or FAILED with the error, so one bad pair cannot abort the rest.
+    """
+    outcome = {"index": job["index"], "file_a": job["file_a"], "file_b": job["file_b"], "output": job["output_path"]}
+    start = time.perf_counter()
+    try:
+        key_col, mapping = job["key_col"], job["mapping"]
+        if job.get("auto_map"):
+            df_a, df_b = coordinator.read_pair(job["file_a"], job["file_b"])
+            key_col = coordinator.mapper.suggest_primary_key(df_a)
+            mapping = coordinator.mapper.suggest_mapping(df_a.columns.tolist(), df_b.columns.tolist())
+
+        coordinator.run_full_recon(job["file_a"], job["file_b"], key_col, mapping, job["output_path"], **job["options"])
+        outcome["status"] = "SUCCESS"
+        # Same list the background writer appends the "report" stage to once the file is written
+        outcome["stages"] = coordinator.last_timer.stages
+    except Exception as e:
+        outcome["status"] = "FAILED"
+        outcome["error"] = str(e)
+        outcome["traceback"] = traceback.format_exc()
+        print(f"Warning: Pair {os.path.basename(job['file_a'])} / {os.path.basename(job['file_b'])} failed: {e}")
+    outcome["seconds"] = round(time.perf_counter() - start, 2)
+    return outcome
+
+
+def _run_pair_in_pool(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Process pool entry point."""
+    global _worker_coordinator
+    if _worker_coordinator is None:
+        from src.core.coordinator import ReconCoordinator
+        _worker_coordinator = ReconCoordinator()
+    return run_pair(_worker_coordinator, job)
+
+
+class BatchScheduler:
+    """
+    Runs many A/B pairs (global reconciliation) in a process pool.
+    Failures are isolated per pair and every finished pair is reported through on_progress.
+    """
+
+    def __init__(self, coordinator, concurrency: int = None):
+        self.coordinator = coordinator
+        self.concurrency = max(1, int(concurrency or default_concurrency()))
+
+    def run(self, pairs: List[Tuple[str, str]], key_col: str, mapping: Dict[str, str], options: Dict[str, Any] = None,
+            auto_map: bool = False, output_dir: str = "",
+            on_progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Reconciles every (file_a, file_b) pair with run_full_recon(**options).
+        on_progress(done, total, outcome) is called in this process after each pair.
+        Returns the outcomes in pair order.
+        """
+        options = dict(options or {})
+        if self.concurrency > 1 and options.get("workers", 1) > 1:
+            # Pairs already run in parallel, sharding each pair as well would oversubscribe the CPUs
+            print("DEBUG: Batch runs pairs in parallel, comparing each pair with a single worker")
+            options["workers"] = 1
+
+        jobs = [{
+            "index": i, "file_a": file_a, "file_b": file_b, "key_col": key_col, "mapping": mapping, "auto_map": auto_map,
+            "output_path": os.path.join(output_dir, f"Recon_Report_{os.path.basename(file_a)}.xlsx"), "options": options,
+        } for i, (file_a, file_b) in enumerate(pairs)]
+
+        outcomes = [None] * len(jobs)
+        done = 0
+        if self.concurrency == 1 or len(jobs) == 1:
+            # In-process, one pair after another (no pool start-up cost). Reports go to the background
+            # writer so the next pair is read and reconciled while the previous report is written;
+            # a pair is only reported through on_progress once its report is on disk.
+            pending = None
+            for job in jobs:
+                job["options"] = dict(options, background_report=True)
+                outcomes[job["index"]] = run_pair(self.coordinator, job)
+                if pending is not None:
+                    done = self._finish_pair(pending, done, len(jobs), on_progress)
+                pending = outcomes[job["index"]]
+            if pending is not None:
+                self._finish_pair(pending, done, len(jobs), on_progress)
+        else:
+            self._run_pool(jobs, outcomes, on_progress)
+
+        failed = sum(1 for o in outcomes if o["status"] != "SUCCESS")
+        print(f"DEBUG: Batch finished, {len(jobs) - failed} of {len(jobs)} pairs succeeded")
+        return outcomes
+
+    def _finish_pair(self, outcome: Dict[str, Any], done: int, total: int, on_progress: Optional[Callable] = None) -> int:
+        """Waits for the pair's background report, marks the pair FAILED if it could not be written, then reports it."""
+        error = self.coordinator.wait_report(outcome["output"])
+        if outcome["status"] == "SUCCESS" and error:
+            outcome["status"] = "FAILED"
+            outcome["error"] = f"Report could not be written: {error}"
+        done += 1
+        if on_progress:
+            on_progress(done, total, outcome)
+        return done
+
+    def _run_pool(self, jobs: List[Dict[str, Any]], outcomes: List, on_progress: Optional[Callable] = None):
+        done = 0
+        with ProcessPoolExecutor(max_workers=min(self.concurrency, len(jobs)), mp_context=POOL_CONTEXT) as pool:
+            futures = {pool.submit(_run_pair_in_pool, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    # The worker process itself died (e.g. out of memory)
+                    outcome = {"index": job["index"], "file_a": job["file_a"], "file_b": job["file_b"],
+                               "output": job["output_path"], "status": "FAILED", "error": f"Worker crashed: {e}", "seconds": 0}
+                outcomes[job["index"]] = outcome
+                done += 1
+                if on_progress:
+                    on_progress(done, len(jobs), outcome)
@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Tuple
+from src.core.keys import NUMERIC_PATTERN
+
+# Non-finite literals float() accepts besides plain decimals ("nan", "-inf", "Infinity")
+SPECIAL_FLOAT_PATTERN = r"(?i)[+-]?(?:inf|infinity|nan)"
+
+
+def _scalar_float(v) -> Tuple[bool, float]:
+    try:
+        return True, float(v)
+    except:
+        return False, np.nan
+
+
+def _parse_strings(strs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """float() semantics for an object array of Python strings."""
+    stripped = pd.Series(strs, dtype=object).str.strip()
+    ok = stripped.str.fullmatch(NUMERIC_PATTERN) | stripped.str.fullmatch(SPECIAL_FLOAT_PATTERN)
+    ok = ok.to_numpy(dtype=bool).copy()
+    floats = np.full(len(strs), np.nan)
+    floats[ok] = stripped.to_numpy(dtype=object)[ok].astype(np.float64)
+
+    # float() also accepts digit separators ("1_000"), keep those on the scalar path
+    underscored = np.flatnonzero(~ok & stripped.str.contains("_", regex=False).to_numpy(dtype=bool))
+    for i in underscored:
+        ok[i], floats[i] = _scalar_float(strs[i])
+    return ok, floats
+
+
+def to_float(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized float(v) over an array of cells.
+    Returns (parsed, floats): a mask of cells float() accepts and their float64 values.
+    """
+    n = len(values)
+    if values.dtype.kind in "biuf":
+        return np.ones(n, dtype=bool), values.astype(np.float64)
+
+    parsed = np.zeros(n, dtype=bool)
+    floats = np.full(n, np.nan)
+    if n == 0:
+        return parsed, floats
+
+    kind = pd.api.types.infer_dtype(values, skipna=False)
+    if kind in ("floating", "integer", "mixed-integer-float", "boolean"):
+        return np.ones(n, dtype=bool), values.astype(np.float64)
+
+    if kind == "string":
+        is_str = np.ones(n, dtype=bool)
+    else:
+        is_str = np.array([isinstance(v, str) for v in values], dtype=bool)
+    if is_str.any():
+        parsed[is_str], floats[is_str] = _parse_strings(values[is_str])
+
+    # Anything else (None, numbers mixed with text, timestamps...) is rare: scalar path
+    for i in np.flatnonzero(~is_str):
+        parsed[i], floats[i] = _scalar_float(values[i])
+    return parsed, floats
+
+
+def to_text(values: np.ndarray) -> np.ndarray:
+    """Vectorized str(v).strip() over an array of cells."""
+    if len(values) and pd.api.types.infer_dtype(values, skipna=False) == "string":
+        return pd.Series(values, dtype=object).str.strip().to_numpy(dtype=object)
+    return np.array([str(v).strip() for v in values], dtype=object)
+
+
+def fold_text(values: np.ndarray) -> np.ndarray:
+    """Case-insensitive text form where '/' and '-' are treated alike (date formats)."""
+    folded = pd.Series(to_text(values), dtype=object).str.lower().str.replace("/", "-", regex=False)
+    return folded.to_numpy(dtype=object)
+
+
+def translate(values: np.ndarray, translations: Dict[str, str]) -> np.ndarray:
+    """Replaces cells whose stripped text appears in the translation table (e.g. SGP -> Singapore)."""
+    if not translations or len(values) == 0:
+        return values
+    if pd.api.types.infer_dtype(values, skipna=True) == "string":
+        # Text columns repeat a lot: look up every distinct value once
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        uniques = np.asarray(uniques, dtype=object)
+        translated = pd.Series(to_text(uniques), dtype=object).map(translations).to_numpy(dtype=object).take(codes)
+        null = codes < 0
+        if null.any():
+            translated[null] = pd.Series(to_text(values[null]), dtype=object).map(translations).to_numpy(dtype=object)
+    else:
+        translated = pd.Series(to_text(values), dtype=object).map(translations).to_numpy(dtype=object)
+    hit = ~pd.isna(translated)
+    if not hit.any():
+        return values
+    out = values.astype(object)
+    out[hit] = translated[hit]
+    return out
+
+
+def inspect_cells(values: np.ndarray, parse: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Callable]:
+    """
+    Profiles a column of cells for comparison.
+    Returns (null, parsed, floats, text) where text(mask) lazily builds the folded text of the masked cells.
+    Text columns repeat a lot (currencies, books, statuses), so they are evaluated once per distinct value.
+    With parse=False the float parsing is skipped and parsed/floats are None.
+    """
+    n = len(values)
+    if values.dtype.kind in "biuf":
+        floats = values.astype(np.float64)
+        return np.isnan(floats), np.ones(n, dtype=bool), floats, lambda mask: fold_text(values[mask])
+
+    if n == 0 or pd.api.types.infer_dtype(values, skipna=True) != "string":
+        parsed, floats = to_float(values) if parse else (None, None)
+        return pd.isna(values), parsed, floats, lambda mask: fold_text(values[mask])
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    uniques = np.asarray(uniques, dtype=object)
+    null = codes < 0
+    parsed = floats = None
+    if parse:
+        parsed_u, floats_u = _parse_strings(uniques)
+        parsed, floats = parsed_u[codes], floats_u[codes]
+
+        # Nulls share one code: NaN parses as a float, None/pd.NA do not
+        if null.any():
+            parsed[null], floats[null] = to_float(values[null])
+
+    folded = []
+    def text(mask):
+        if not folded:
+            folded.append(fold_text(uniques))
+        masked_codes = codes[mask]
+        valid = masked_codes >= 0
+        out = np.empty(len(masked_codes), dtype=object)
+        out[valid] = folded[0][masked_codes[valid]]
+        if not valid.all():
+            out[~valid] = fold_text(values[mask][~valid])
+        return out
+    return null, parsed, floats, text
+
+
+def compare_numeric(values_a: np.ndarray, values_b: np.ndarray, tol: float) -> np.ndarray:
+    """
+    Comparator for columns profiled as numeric: tolerance check on the float values.
+    Cells that do not parse on both sides (stray text, None) are compared as text like compare_values does.
+    """
+    parsed_a, floats_a = to_float(values_a)
+    parsed_b, floats_b = to_float(values_b)
+    numeric = parsed_a & parsed_b
+    breaks = np.zeros(len(values_a), dtype=bool)
+    with np.errstate(invalid="ignore"):
+        breaks[numeric] = np.abs(floats_a[numeric] - floats_b[numeric]) > tol
+    if not numeric.all():
+        rest = np.flatnonzero(~numeric)
+        breaks[rest] = compare_values(values_a[rest], values_b[rest], tol)
+    return breaks
+
+
+def compare_text(values_a: np.ndarray, values_b: np.ndarray, tol: float) -> np.ndarray:
+    """
+    Comparator for columns profiled as text: case-insensitive, '/' and '-' alike.
+    Equal text can never break, so only cells that differ as text are checked for numbers ("1.0" vs "1").
+    """
+    null_a, _, _, text_a = inspect_cells(values_a, parse=False)
+    null_b, _, _, text_b = inspect_cells(values_b, parse=False)
+    candidates = ~(null_a & null_b)
+    breaks = np.zeros(len(values_a), dtype=bool)
+    if candidates.any():
+        breaks[candidates] = text_a(candidates) != text_b(candidates)
+    differing = np.flatnonzero(breaks)
+    if len(differing):
+        breaks[differing] = compare_values(values_a[differing], values_b[differing], tol)
+    return breaks
+
+
+def compare_values(values_a: np.ndarray, values_b: np.ndarray, tol: float) -> np.ndarray:
+    """
+    Compares two aligned arrays of (already translated) cells and returns a break mask.
+    Cells are compared numerically with tolerance when both parse as numbers, otherwise
+    as case-insensitive text where '/' and '-' are treated alike (date formats).
+    Cells that are null on both sides never break.
+    """
+    null_a, parsed_a, floats_a, text_a = inspect_cells(values_a)
+    null_b, parsed_b, floats_b, text_b = inspect_cells(values_b)
+    both_null = null_a & null_b
+    numeric = parsed_a & parsed_b
+
+    breaks = np.zeros(len(values_a), dtype=bool)
+    with np.errstate(invalid="ignore"):
+        breaks[numeric] = np.abs(floats_a[numeric] - floats_b[numeric]) > tol
+
+    textual = ~numeric & ~both_null
+    if textual.any():
+        breaks[textual] = text_a(textual) != text_b(textual)
+
+    breaks[both_null] = False
+    return breaks
@@ -3,9 +3,25 @@ from src.handlers.csv_handler import CSVHandler
 from src.handlers.pdf_handler import PDFHandler
 from src.core.mapping import SemanticMapper
 from src.core.reconciler import ReconEngine
+from src.core.partition import SpillReconciler, estimate_chunk_rows, estimate_partitions
+from src.core.merge_join import SortedMergeReconciler, UnsortedInputError
+from src.core.incremental import DeltaStateStore, reconcile_incremental
+from src.core.translation import TranslationTable
+from src.core.fuzzy import find_probable_matches
+from src.core.sampling import QuickChecker
+from src.core.multiway import MultiSourceReconciler
+from src.core.batch import BatchScheduler
+from src.core.ingest_cache import IngestionCache
+from src.core.pipeline import ReportWriter, StageTimer, read_concurrently
 from src.handlers.excel_reporter import ExcelReporter
+import logging
 import os
-from typing import Any
+import pandas as pd
+from typing import Any, Callable, Iterator
+
+# Run diagnostics (stage timings, fuzzy/quick-check/N-way summaries) for callers that enable logging;
+# stdout belongs to the desktop app and batch callers
+logger = logging.getLogger(__name__)
 
 class ReconCoordinator:
     """Coordinates the end-to-end flow between UI, Handlers, and Engine."""
@@ -16,6 +32,12 @@ class ReconCoordinator:
         self.pdf_handler = PDFHandler()
         self.mapper = SemanticMapper()
         self.reporter = ExcelReporter()
+        self.state_store = DeltaStateStore()
+        self.translations = TranslationTable()
+        self.ingest_cache = IngestionCache()
+        self.report_writer = ReportWriter()
+        # Stage timings of the latest run_full_recon (see src/core/pipeline.py)
+        self.last_timer = None
 
     def get_handler(self, file_path: str):
         ext = os.path.splitext(file_path)[1].lower()
@@ -28,29 +50,212 @@ class ReconCoordinator:
         else:
             raise ValueError(f"Unsupported file format: {ext}")
 
-    def run_full_recon(self, path_a: str, path_b: str, key_col: str, mapping: dict, output_path: str, tolerance: Any = 0.01, accepted_matches: set = None):
-        # 1. Load Data
-        df_a = self.get_handler(path_a).read(path_a)
-        df_b = self.get_handler(path_b).read(path_b)
+    def read_file(self, file_path: str, columns: list = None) -> pd.DataFrame:
+        """
+        Parsed file through the ingestion cache (an unchanged file is only parsed once).
+        columns limits the read to the columns a run needs (see projection()); a full parse
+        that is already cached is projected instead of reading the file again.
+        """
+        handler = self.get_handler(file_path)
+        tag = handler.cache_tag()
+        if columns is None or not handler.native_projection:
+            # e.g. PDF/OCR: cache the whole extraction once and project the cached frame
+            df = self.ingest_cache.read(file_path, lambda: handler.read(file_path), handler=tag)
+            return handler.project(df, columns)
+        full = self.ingest_cache.peek(file_path, handler=tag)
+        if full is not None:
+            return handler.project(full, columns)
+        columns = sorted(set(columns))
+        return self.ingest_cache.read(file_path, lambda: handler.read(file_path, columns=columns),
+                                      columns=tuple(columns), handler=tag)
+
+    @staticmethod
+    def projection(key_col: str, mapping: dict):
+        """Columns of A and of B a run reads: key parts and mapped columns (composite names split too)."""
+        key_parts_a, key_parts_b = ReconEngine.resolve_key_columns(key_col, mapping)
+        # The B key as _run_memory_recon validates it as well
+        cols_a, cols_b = list(key_parts_a), list(key_parts_b) + mapping.get(key_col, key_col).split("+")
+        for col_a, col_b in mapping.items():
+            cols_a += [col_a] + col_a.split("+")
+            cols_b += [col_b] + col_b.split("+")
+        return cols_a, cols_b
+
+    def iter_chunks(self, file_path: str, chunksize: int, columns: list = None) -> Iterator[pd.DataFrame]:
+        """Streams a file as cleaned chunks of at most chunksize rows (see BaseHandler.read_chunks)."""
+        return self.get_handler(file_path).read_chunks(file_path, chunksize, columns)
+
+    def iter_chunk_pair(self, path_a: str, path_b: str, key_col: str, mapping: dict, memory_limit_mb: int):
+        """Chunk streams of A and B sized for memory_limit_mb, reading only the key and mapped columns."""
+        cols_a, cols_b = self.projection(key_col, mapping)
+        return (self.iter_chunks(path_a, estimate_chunk_rows(path_a, memory_limit_mb), cols_a),
+                self.iter_chunks(path_b, estimate_chunk_rows(path_b, memory_limit_mb), cols_b))
 
-        # Load Data Mappings
-        data_map_dict = {}
-        map_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "data_mapping.csv")
-        if os.path.exists(map_file):
+    def read_stage(self, name: str, file_path: str) -> Callable[[], str]:
+        """Stage timing label of a file read, naming the parser it ended up using (e.g. "read A [openpyxl]")."""
+        return lambda: f"{name} [{self.get_handler(file_path).engine_for(file_path)}]"
+
+    def read_pair(self, path_a: str, path_b: str, timer: StageTimer = None, columns_a: list = None, columns_b: list = None):
+        """Reads A and B at the same time (two threads) instead of one after the other."""
+        frames = read_concurrently({"read A": lambda: self.read_file(path_a, columns_a),
+                                    "read B": lambda: self.read_file(path_b, columns_b)}, timer,
+                                   {"read A": self.read_stage("read A", path_a), "read B": self.read_stage("read B", path_b)})
+        return frames["read A"], frames["read B"]
+
+    def run_full_recon(self, path_a: str, path_b: str, key_col: str, mapping: dict, output_path: str, tolerance: Any = 0.01, accepted_matches: set = None,
+                       mode: str = "memory", memory_limit_mb: int = 1024, workers: int = 1, incremental: bool = False,
+                       duplicates: str = "first", fuzzy: bool = False, group_by: str = None, measures: list = None,
+                       drill_down: bool = False, background_report: bool = False):
+        """
+        Reads, reconciles and reports one A/B pair.
+        mode="memory" loads both files fully; mode="spill" streams them through on-disk hash
+        partitions so that peak memory stays around memory_limit_mb regardless of file size.
+        mode="sorted" merge-joins inputs that are already sorted by key in a single streaming pass
+        and falls back to the in-memory hash path if either file turns out to be out of order.
+        workers > 1 compares key-hash shards in parallel processes (memory mode).
+        incremental=True only re-compares keys whose rows changed since the previous run of this
+        pair and reuses earlier results for the rest (memory mode).
+        duplicates="rank"/"best_fit" pairs repeated keys (amendments) instead of keeping the first row per key.
+        fuzzy=True runs a second pass over the orphaned keys and lists probable matches (typos, prefixes).
+        group_by (e.g. "Book+Trade Currency") with measures (e.g. ["Notional"]) reconciles group totals
+        instead of rows (memory mode); drill_down=True then reconciles the rows of breaking groups on key_col.
+        A and B are read concurrently. background_report=True hands the report to the background writer
+        and returns straight away (call flush_reports() before using the file); batches use it so the
+        next pair reconciles while the previous report is written.
+        """
+        timer = StageTimer()
+        self.last_timer = timer
+        # Load Data Mappings (cached, re-read only when data_mapping.csv changes)
+        data_map_dict = self.translations.load()
+
+        if group_by:
+            recon_data = self._run_aggregate_recon(path_a, path_b, key_col, mapping, tolerance, accepted_matches, group_by, measures or [], drill_down, timer=timer)
+        elif mode == "spill":
+            with timer.stage("read + reconcile (streamed)"):
+                recon_data = self._run_spill_recon(path_a, path_b, key_col, mapping, tolerance, accepted_matches, data_map_dict, memory_limit_mb, duplicates=duplicates)
+        elif mode == "sorted":
             try:
-                map_df = pd.read_csv(map_file)
-                for _, row in map_df.iterrows():
-                    col = str(row['Column']).strip()
-                    src = str(row['Source Value']).strip()
-                    tgt = str(row['Target Value']).strip()
-                    if col not in data_map_dict: data_map_dict[col] = {}
-                    data_map_dict[col][src] = tgt
-            except Exception as e:
-                print(f"Warning: Could not load data_mapping.csv: {e}")
-
-        # Pre-process: strip column names
-        df_a.columns = [str(c).strip() for c in df_a.columns]
-        df_b.columns = [str(c).strip() for c in df_b.columns]
+                with timer.stage("read + reconcile (streamed)"):
+                    recon_data = self._run_sorted_recon(path_a, path_b, key_col, mapping, tolerance, accepted_matches, data_map_dict, memory_limit_mb, duplicates=duplicates)
+            except UnsortedInputError as e:
+                logger.debug("%s, falling back to hash reconciliation", e)
+                recon_data = self._run_memory_recon(path_a, path_b, key_col, mapping, tolerance, accepted_matches, workers, duplicates=duplicates, timer=timer)
+        else:
+            recon_data = self._run_memory_recon(path_a, path_b, key_col, mapping, tolerance, accepted_matches, workers, incremental, duplicates=duplicates, timer=timer)
+
+        if fuzzy:
+            matches = find_probable_matches(recon_data.only_in_a.tolist(), recon_data.only_in_b.tolist())
+            recon_data.set_stat("probable_matches", matches)
+            logger.debug("Fuzzy pass found %d probable matches among orphans", len(matches))
+
+        # 4. Generate Report
+        if background_report:
+            self.report_writer.submit(lambda: self.reporter.generate_report(recon_data, output_path), output_path, timer)
+            logger.debug("Stage timings: %s, report queued", timer.summary())
+        else:
+            with timer.stage("report"):
+                self.reporter.generate_report(recon_data, output_path)
+            logger.debug("Stage timings: %s", timer.summary())
+        return output_path
+
+    def flush_reports(self) -> dict:
+        """Waits for reports queued with background_report=True. Returns {output_path: error or None}."""
+        return self.report_writer.flush()
+
+    def wait_report(self, output_path: str):
+        """Waits for one report queued with background_report=True. Returns its error or None."""
+        return self.report_writer.wait(output_path)
+
+    def run_batch(self, pairs: list, key_col: str, mapping: dict, output_dir: str = "", concurrency: int = None,
+                  auto_map: bool = False, on_progress=None, **options) -> list:
+        """
+        Global reconciliation: runs run_full_recon(**options) for every (path_a, path_b) pair in a pool of
+        `concurrency` processes. A failing pair is recorded as FAILED and the others carry on.
+        auto_map=True suggests key and mapping per pair. Returns one outcome dict per pair (see src/core/batch.py).
+        """
+        scheduler = BatchScheduler(self, concurrency=concurrency)
+        return scheduler.run(pairs, key_col, mapping, options=options, auto_map=auto_map, output_dir=output_dir, on_progress=on_progress)
+
+    def run_multi_recon(self, paths: list, key_col: str, mappings: list, output_path: str, tolerance: Any = 0.01, names: list = None):
+        """
+        Reconciles N sources (e.g. front office, back office, custodian) in one pass instead of pairwise runs.
+        paths[0] is the reference; mappings[i] maps its columns to those of paths[i + 1].
+        Every file is read and keyed once; the report shows presence per source and which source disagrees.
+        """
+        if names is None:
+            names = [os.path.splitext(os.path.basename(p))[0] for p in paths]
+        if len(set(names)) != len(names):
+            names = [f"{i + 1}. {n}" for i, n in enumerate(names)]
+
+        # Only the key and mapped columns of every source
+        columns = [self.projection(key_col, m) for m in mappings]
+        wanted = [[c for cols_a, _ in columns for c in cols_a]] + [cols_b for _, cols_b in columns]
+        timer = StageTimer()
+        stages = [f"read {name}" for name in names]
+        loaded = read_concurrently({stage: (lambda i=i: self.read_file(paths[i], wanted[i])) for i, stage in enumerate(stages)}, timer,
+                                   {stage: self.read_stage(stage, path) for stage, path in zip(stages, paths)})
+        frames = [loaded[stage] for stage in stages]
+        reconciler = MultiSourceReconciler(translations=self.translations)
+        with timer.stage("reconcile"):
+            result = reconciler.reconcile(frames, names, key_col, mappings, tolerance=tolerance)
+        logger.debug("N-way recon of %d sources: %d keys in all, %d value breaks", len(paths), result.in_all, len(result.breaks))
+
+        with timer.stage("report"):
+            self.reporter.generate_multi_report(result, output_path)
+        logger.debug("Stage timings: %s", timer.summary())
+        return output_path
+
+    def run_quick_check(self, path_a: str, path_b: str, key_col: str, mapping: dict, tolerance: Any = 0.01, accepted_matches: set = None,
+                        sample_fraction: float = 0.05, max_breaks: int = None, memory_limit_mb: int = 1024) -> dict:
+        """
+        Quick pre-check of a pair without a report: reconciles a deterministic key-hash sample of
+        sample_fraction of the keys, optionally stopping after max_breaks breaks.
+        Returns estimated match/break rates with 95% confidence intervals and sample breaks (see src/core/sampling.py).
+        """
+        chunks_a, chunks_b = self.iter_chunk_pair(path_a, path_b, key_col, mapping, memory_limit_mb)
+        checker = QuickChecker(data_mapping=self.translations.load(), sample_fraction=sample_fraction, max_breaks=max_breaks)
+        result = checker.check(chunks_a, chunks_b, key_col, mapping, tolerance=tolerance, accepted_matches=accepted_matches)
+
+        low, high = result["match_rate_ci"]
+        logger.debug("Quick check compared %d sampled keys, match rate %.2f%% (95%% CI %.2f%% - %.2f%%)%s",
+                     result["compared"], result["match_rate"] * 100, low * 100, high * 100,
+                     "" if result["complete"] else ", stopped early")
+        return result
+
+    def _run_spill_recon(self, path_a, path_b, key_col, mapping, tolerance, accepted_matches, data_map_dict, memory_limit_mb, duplicates="first"):
+        num_partitions = estimate_partitions(os.path.getsize(path_a) + os.path.getsize(path_b), memory_limit_mb)
+        chunks_a, chunks_b = self.iter_chunk_pair(path_a, path_b, key_col, mapping, memory_limit_mb)
+        logger.debug("Spill reconciliation with %d partitions (limit %d MB)", num_partitions, memory_limit_mb)
+
+        spiller = SpillReconciler(num_partitions=num_partitions, data_mapping=data_map_dict)
+        return spiller.reconcile(chunks_a, chunks_b, key_col, mapping, tolerance=tolerance, accepted_matches=accepted_matches, duplicates=duplicates)
+
+    def _run_sorted_recon(self, path_a, path_b, key_col, mapping, tolerance, accepted_matches, data_map_dict, memory_limit_mb, duplicates="first"):
+        chunks_a, chunks_b = self.iter_chunk_pair(path_a, path_b, key_col, mapping, memory_limit_mb)
+        merger = SortedMergeReconciler(data_mapping=data_map_dict)
+        return merger.reconcile(chunks_a, chunks_b, key_col, mapping, tolerance=tolerance, accepted_matches=accepted_matches, duplicates=duplicates)
+
+    def _run_aggregate_recon(self, path_a, path_b, key_col, mapping, tolerance, accepted_matches, group_by, measures, drill_down=False, timer=None):
+        timer = timer or StageTimer()
+        # Group parts and measures (plus the key and mapped columns when drilling down)
+        group_a, group_b = ReconEngine.resolve_key_columns(group_by, mapping)
+        cols_a, cols_b = group_a + list(measures), group_b + [mapping.get(m, m) for m in measures]
+        if drill_down:
+            drill_a, drill_b = self.projection(key_col, mapping)
+            cols_a, cols_b = cols_a + drill_a, cols_b + drill_b
+        df_a, df_b = self.read_pair(path_a, path_b, timer, cols_a, cols_b)
+        if not measures:
+            raise ValueError("Aggregate reconciliation needs at least one measure column")
+        logger.debug("Aggregate reconciliation of %s per %s", measures, group_by)
+
+        engine = ReconEngine(df_a, df_b, translations=self.translations)
+        with timer.stage("reconcile"):
+            return engine.reconcile_aggregate(group_by, measures, mapping, tolerance=tolerance, accepted_matches=accepted_matches,
+                                              drill_down_key=key_col if drill_down else None)
+
+    def _run_memory_recon(self, path_a, path_b, key_col, mapping, tolerance, accepted_matches, workers=1, incremental=False, duplicates="first", timer=None):
+        # 1. Load Data (A and B in parallel, only the key and mapped columns)
+        timer = timer or StageTimer()
+        df_a, df_b = self.read_pair(path_a, path_b, timer, *self.projection(key_col, mapping))
 
         # 2. Validate Key Column exists in the mapping (or is a direct match)
         # Handle composite keys
@@ -67,9 +272,14 @@ class ReconCoordinator:
                  raise ValueError(f"Primary Key part '{k}' not found in Group B")
 
         # 3. Reconcile
-        engine = ReconEngine(df_a, df_b, data_mapping=data_map_dict)
-        recon_data = engine.reconcile(key_col, mapping, tolerance=tolerance, accepted_matches=accepted_matches)
-
-        # 4. Generate Report
-        self.reporter.generate_report(recon_data, output_path)
-        return output_path
+        engine = ReconEngine(df_a, df_b, translations=self.translations)
+        if incremental and duplicates != "first":
+            print("Warning: Incremental runs track one row per key, running a full duplicate-aware comparison")
+        elif incremental:
+            state = self.state_store.load(path_a, path_b, key_col)
+            with timer.stage("reconcile"):
+                recon_data, new_state = reconcile_incremental(engine, key_col, mapping, tolerance=tolerance, accepted_matches=accepted_matches, state=state)
+            self.state_store.save(path_a, path_b, key_col, new_state)
+            return recon_data
+        with timer.stage("reconcile"):
+            return engine.reconcile(key_col, mapping, tolerance=tolerance, accepted_matches=accepted_matches, workers=workers, duplicates=duplicates)
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+from src.core.compare import compare_values
+
+# Formats tried when inferring a date column, in order of preference (day-first before month-first)
+DATE_FORMATS = [
+    "%Y-%m-%d", "%Y/%m/%d", "%Y%m%d",
+    "%d-%m-%Y", "%d/%m/%Y", "%d.%m.%Y",
+    "%m-%d-%Y", "%m/%d/%Y",
+    "%d %B %Y", "%d %b %Y", "%d-%b-%Y", "%d-%b-%y", "%B %d, %Y", "%b %d, %Y",
+    "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M",
+    "%d-%m-%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%m/%d/%Y %H:%M:%S", "%m/%d/%Y %I:%M %p",
+    "%b %d, %Y %I:%M %p", "%B %d, %Y %I:%M %p", "%d %b %Y %H:%M:%S",
+]
+
+# Columns that already hold datetimes (Excel dates) need no format
+NATIVE = "native"
+
+# Day/month order used when a side's own values give no evidence either way (no day above 12)
+DAY_FIRST = True
+
+# Rows searched for candidate formats (day/month evidence is looked for in every distinct value of the column)
+FORMAT_SAMPLE_ROWS = 1000
+
+# Chosen format per (column, file schema); a new extract with the same layout skips the search
+_format_cache: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+
+
+def _parses(sample: np.ndarray, fmt: str) -> bool:
+    try:
+        return bool(pd.to_datetime(sample, format=fmt, errors='coerce').notna().all())
+    except (ValueError, TypeError):
+        return False
+
+
+def _swapped(fmt: str) -> Optional[str]:
+    """The same format with day and month exchanged (%d-%m-%Y <-> %m-%d-%Y), if that is a known format."""
+    if "%d" not in fmt or "%m" not in fmt:
+        return None
+    other = fmt.replace("%d", "\0").replace("%m", "%d").replace("\0", "%m")
+    return other if other in DATE_FORMATS else None
+
+
+def _month_first(fmt: str) -> bool:
+    return "%d" in fmt and "%m" in fmt and fmt.index("%m") < fmt.index("%d")
+
+
+def _strings(sample: np.ndarray) -> Optional[np.ndarray]:
+    """Stripped non-null cells of a text sample, None if it holds anything but strings (or nothing)."""
+    sample = sample[~pd.isna(sample)]
+    if len(sample) == 0 or pd.api.types.infer_dtype(sample, skipna=True) != "string":
+        return None
+    return pd.Series(sample, dtype=object).str.strip().to_numpy(dtype=object)
+
+
+def candidate_formats(sample: np.ndarray) -> List[str]:
+    """Formats under which every non-null cell of the sample parses, preferred first (empty list: not a date column)."""
+    if sample.dtype.kind == "M" or (len(sample) and pd.api.types.infer_dtype(sample, skipna=True) in ("datetime", "datetime64", "date")):
+        return [NATIVE]
+    sample = _strings(sample)
+    if sample is None:
+        return []
+    formats = [fmt for fmt in DATE_FORMATS if _parses(sample, fmt)]
+    return sorted(formats, key=lambda fmt: _month_first(fmt) == DAY_FIRST)
+
+
+def _texts(values: np.ndarray) -> np.ndarray:
+    """Distinct stripped strings of a column."""
+    uniques = pd.unique(values[~pd.isna(values)])
+    return pd.Series(np.asarray(uniques, dtype=object)).map(str).str.strip().unique()
+
+
+def infer_format(values: np.ndarray, cache_key: Tuple = None) -> Optional[Dict]:
+    """
+    Date format of one side's column, from that side's own values only:
+    {"format": ..., "ambiguous_with": the other day/month order or None}. A day above 12 anywhere in the
+    column settles the order; without one the DAY_FIRST convention decides and "ambiguous_with" records
+    the order it ruled out (shown in the comparison plan). None when the column holds no dates.
+    """
+    sample = values[:FORMAT_SAMPLE_ROWS]
+    fmt = _format_cache.get(cache_key) if cache_key else None
+    strings = _strings(sample) if fmt not in (None, NATIVE) else None
+    if strings is None or not _parses(strings, fmt):
+        formats = candidate_formats(sample)
+        if not formats:
+            return None
+        fmt = formats[0]
+        if cache_key:
+            _format_cache[cache_key] = fmt
+    other = _swapped(fmt) if fmt != NATIVE else None
+    if other is None:
+        return {"format": fmt, "ambiguous_with": None}
+
+    texts = _texts(values)
+    fits = pd.to_datetime(texts, format=fmt, errors='coerce').notna()
+    fits_other = pd.to_datetime(texts, format=other, errors='coerce').notna()
+    only_fmt, only_other = bool((fits & ~fits_other).any()), bool((fits_other & ~fits).any())
+    if only_fmt != only_other:
+        # The column itself says which order it uses
+        return {"format": fmt if only_fmt else other, "ambiguous_with": None}
+    if not only_fmt:
+        # No evidence either way: configured default
+        fmt, other = (fmt, other) if _month_first(other) == DAY_FIRST else (other, fmt)
+    return {"format": fmt, "ambiguous_with": other}
+
+
+def to_datetimes(values: np.ndarray, fmt: str) -> np.ndarray:
+    """Parses a whole column with one explicit format; cells that do not fit become NaT."""
+    if fmt == NATIVE:
+        parsed = pd.to_datetime(pd.Series(values), errors='coerce')
+        if getattr(parsed.dtype, "tz", None) is not None:
+            parsed = parsed.dt.tz_localize(None)
+        return parsed.to_numpy(dtype="datetime64[ns]")
+
+    # Dates repeat heavily (trade/settle dates), so every distinct text is parsed once
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    texts = pd.Series(np.asarray(uniques, dtype=object)).map(str).str.strip()
+    parsed = pd.to_datetime(texts, format=fmt, errors='coerce').to_numpy(dtype="datetime64[ns]")
+    out = parsed.take(codes) if len(parsed) else np.full(len(codes), np.datetime64("NaT"), dtype="datetime64[ns]")
+    out[codes < 0] = np.datetime64("NaT")
+    return out
+
+
+def compare_dates(values_a: np.ndarray, values_b: np.ndarray, tol: float, format_a: str, format_b: str) -> np.ndarray:
+    """
+    Compares two date columns as datetime64 arrays, each parsed with its own inferred format
+    (day/month order from the column itself, else DAY_FIRST). Cells that do not parse on both sides
+    fall back to the generic comparator, so they only match when the raw values do.
+    """
+    dates_a = to_datetimes(values_a, format_a)
+    dates_b = to_datetimes(values_b, format_b)
+    both = ~np.isnat(dates_a) & ~np.isnat(dates_b)
+    breaks = np.zeros(len(values_a), dtype=bool)
+    breaks[both] = dates_a[both] != dates_b[both]
+    if not both.all():
+        rest = np.flatnonzero(~both)
+        breaks[rest] = compare_values(values_a[rest], values_b[rest], tol)
+    return breaks
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple
+
+from src.core.compare import to_float
+from src.core.fingerprint import value_row_hashes
+
+# How rows sharing a match key are handled:
+#   first    - keep the first row per key on each side (historical behaviour)
+#   rank     - pair the n-th occurrence in A with the n-th occurrence in B
+#   best_fit - pair rows with identical mapped values first, then the closest remaining rows
+DUPLICATE_MODES = ("first", "rank", "best_fit")
+
+# Largest A x B row product of one key that best_fit scores pair by pair; bigger keys pair by rank
+BEST_FIT_MAX_PAIRS = 10000
+
+
+def occurrence_rank(groups: List[np.ndarray]) -> np.ndarray:
+    """0-based position of every row within its group (groupby/cumcount, no cartesian product)."""
+    n = len(groups[0])
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    frame = pd.DataFrame({i: g for i, g in enumerate(groups)})
+    return frame.groupby(list(frame.columns), sort=False, dropna=False).cumcount().to_numpy()
+
+
+def _rank_join(groups_a: List[np.ndarray], groups_b: List[np.ndarray]) -> np.ndarray:
+    """For every A row, the B row with the same group values and occurrence rank (-1 if none)."""
+    if len(groups_a[0]) == 0 or len(groups_b[0]) == 0:
+        return np.full(len(groups_a[0]), -1, dtype=np.int64)
+    index_b = pd.MultiIndex.from_arrays(groups_b + [occurrence_rank(groups_b)])
+    index_a = pd.MultiIndex.from_arrays(groups_a + [occurrence_rank(groups_a)])
+    return index_b.get_indexer(index_a)
+
+
+def row_distances(columns_a: List[np.ndarray], columns_b: List[np.ndarray], rows_a: np.ndarray, rows_b: np.ndarray) -> np.ndarray:
+    """
+    How far apart each candidate pair (rows_a[i], rows_b[i]) is over the mapped columns: per column the
+    relative difference of two numbers (capped at 1), otherwise 1 for different text and 0 for equal cells.
+    """
+    cost = np.zeros(len(rows_a))
+    for values_a, values_b in zip(columns_a, columns_b):
+        cells_a, cells_b = values_a[rows_a], values_b[rows_b]
+        num_a, floats_a = to_float(cells_a)
+        num_b, floats_b = to_float(cells_b)
+        with np.errstate(invalid="ignore"):
+            relative = np.abs(floats_a - floats_b) / np.maximum(np.maximum(np.abs(floats_a), np.abs(floats_b)), 1.0)
+        relative = np.where(np.isnan(floats_a) & np.isnan(floats_b), 0.0, np.minimum(np.nan_to_num(relative, nan=1.0), 1.0))
+        texts_differ = (pd.Series(cells_a, dtype=object).map(str).str.strip().str.lower().to_numpy()
+                        != pd.Series(cells_b, dtype=object).map(str).str.strip().str.lower().to_numpy())
+        cost += np.where(num_a & num_b, relative, texts_differ)
+    return cost
+
+
+def _pair_nearest(keys_a: np.ndarray, keys_b: np.ndarray, columns_a: List[np.ndarray], columns_b: List[np.ndarray],
+                  free_a: np.ndarray, free_b: np.ndarray, pos_b: np.ndarray):
+    """Greedy nearest match within each key: the closest free (A, B) pair first, until one side runs out."""
+    free_rows_a = pd.DataFrame({"key": keys_a[free_a], "a": free_a})
+    free_rows_b = pd.DataFrame({"key": keys_b[free_b], "b": free_b})
+    combinations = free_rows_a["key"].value_counts().mul(free_rows_b["key"].value_counts(), fill_value=0)
+    # A key with one free row on each side has nothing to choose; huge keys fall back to rank
+    keys = combinations.index[(combinations > 1) & (combinations <= BEST_FIT_MAX_PAIRS)]
+    candidates = free_rows_a[free_rows_a["key"].isin(keys)].merge(free_rows_b[free_rows_b["key"].isin(keys)], on="key")
+    if candidates.empty:
+        return
+    rows_a, rows_b = candidates["a"].to_numpy(), candidates["b"].to_numpy()
+    cost = row_distances(columns_a, columns_b, rows_a, rows_b)
+
+    # Ties keep the occurrence order of both sides
+    taken_b = set()
+    for i in np.lexsort((rows_b, rows_a, cost)):
+        a, b = rows_a[i], rows_b[i]
+        if pos_b[a] < 0 and b not in taken_b:
+            pos_b[a] = b
+            taken_b.add(b)
+
+
+def pair_rows(keys_a: np.ndarray, keys_b: np.ndarray, columns_a: Optional[List[np.ndarray]] = None,
+              columns_b: Optional[List[np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairs the rows of A and B that share a key. Returns (rows_a, rows_b) positional indices, in A order.
+    With the (translated) mapped columns of both sides (best_fit), rows with identical values pair first
+    and the remaining rows of each key pair closest first (see row_distances), so an amended duplicate
+    pairs with its counterpart instead of whichever came first. Everything else pairs by occurrence rank.
+    """
+    pos_b = np.full(len(keys_a), -1, dtype=np.int64)
+    free_a = np.arange(len(keys_a))
+    free_b = np.arange(len(keys_b))
+
+    if columns_a is not None and columns_b is not None:
+        pos_b = _rank_join([keys_a, value_row_hashes(columns_a)], [keys_b, value_row_hashes(columns_b)])
+        free_a = np.flatnonzero(pos_b < 0)
+        free_b = np.setdiff1d(free_b, pos_b[pos_b >= 0], assume_unique=True)
+        _pair_nearest(keys_a, keys_b, columns_a, columns_b, free_a, free_b, pos_b)
+        free_a = np.flatnonzero(pos_b < 0)
+        free_b = np.setdiff1d(free_b, pos_b[pos_b >= 0], assume_unique=True)
+
+    # Whatever is left pairs by occurrence rank within the key
+    rest = _rank_join([keys_a[free_a]], [keys_b[free_b]])
+    paired = rest >= 0
+    pos_b[free_a[paired]] = free_b[rest[paired]]
+
+    rows_a = np.flatnonzero(pos_b >= 0)
+    return rows_a, pos_b[rows_a]
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+from typing import List
+
+# Multiplier used to fold per-column hashes into one row hash (same as pandas' combine step)
+HASH_MULTIPLIER = np.uint64(1000003)
+
+
+def row_fingerprints(df: pd.DataFrame, cols: List[str]) -> np.ndarray:
+    """
+    64-bit hash of each row's values over the given columns (missing columns are ignored).
+    Integers are widened to int64 first: clean_data downcasts them to the narrowest type that fits
+    the file, and an int8 -1 hashes differently from an int16 -1.
+    """
+    cols = [c for c in dict.fromkeys(cols) if c in df.columns]
+    if not cols:
+        return np.zeros(len(df), dtype=np.uint64)
+    frame = df[cols]
+    narrow = {c: np.int64 for c, dtype in frame.dtypes.items()
+              if isinstance(dtype, np.dtype) and dtype.kind == "i" and dtype.itemsize < 8}
+    if narrow:
+        frame = frame.astype(narrow)
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def value_row_hashes(columns: List[np.ndarray]) -> np.ndarray:
+    """
+    64-bit hash of each row over a list of aligned cell arrays (already translated).
+    Numbers are widened to float64 so 5 and 5.0 hash alike; everything else hashes by its str() form.
+    Equal hashes on A and B therefore mean every cell pair would compare equal.
+    """
+    n = len(columns[0]) if columns else 0
+    combined = np.zeros(n, dtype=np.uint64)
+    for values in columns:
+        if values.dtype.kind in "biuf":
+            values = values.astype(np.float64)
+        else:
+            values = values.astype(object)
+        combined = (combined * HASH_MULTIPLIER) ^ pd.util.hash_array(values)
+    return combined
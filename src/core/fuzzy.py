@@ -0,0 +1,156 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+
+# Neighbours looked at on each side of a key in the sorted order (per pass)
+WINDOW = 4
+
+# Shortest key that may count as a whole part of a longer key
+MIN_TOKEN_CHARS = 3
+
+# Score given when one key is a whole separator-delimited part of the other (699296 vs 699296_TZS)
+TOKEN_MATCH_SCORE = 0.95
+
+# Characters compared at each end of a key. Prefix and suffix are measured within these windows, so
+# memory stays bounded however long the longest orphan is; pairs that agree on a whole window are
+# scored exactly on their full strings (see _exact_score)
+KEY_WINDOW = 64
+
+_ALNUM = np.zeros(128, dtype=bool)
+for _c in "abcdefghijklmnopqrstuvwxyz0123456789":
+    _ALNUM[ord(_c)] = True
+
+
+def _char_codes(keys: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """UCS4 code matrices (zero padded, at most KEY_WINDOW wide) of the keys' heads and of their reversed tails."""
+    width = max(1, min(KEY_WINDOW, int(keys.str.len().max())))
+    heads = keys.to_numpy(dtype=f"U{width}")
+    tails = keys.str[::-1].to_numpy(dtype=f"U{width}")
+    return heads.view(np.uint32).reshape(len(keys), width), tails.view(np.uint32).reshape(len(keys), width)
+
+
+def _common_prefix(codes: np.ndarray, i: np.ndarray, j: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    differ = codes[i] != codes[j]
+    prefix = np.where(differ.any(axis=1), differ.argmax(axis=1), codes.shape[1])
+    return np.minimum(prefix, np.minimum(lengths[i], lengths[j]))
+
+
+def _is_separator(codes: np.ndarray, rows: np.ndarray, pos: np.ndarray) -> np.ndarray:
+    """True where the character at pos of the row is not a letter or digit."""
+    inside = pos < codes.shape[1]
+    char = np.zeros(len(rows), dtype=np.uint32)
+    char[inside] = codes[rows[inside], pos[inside]]
+    ascii_ = char < 128
+    sep = np.zeros(len(rows), dtype=bool)
+    sep[ascii_] = ~_ALNUM[char[ascii_]]
+    return sep & inside
+
+
+def _separator_char(c: str) -> bool:
+    return ord(c) < 128 and not _ALNUM[ord(c)]
+
+
+def _exact_score(a: str, b: str, digits: bool) -> float:
+    """Score of one pair on the full strings, same rules as the vectorized pass."""
+    shorter, longer = min(len(a), len(b)), max(len(a), len(b))
+    prefix = len(os.path.commonprefix([a, b]))
+    suffix = len(os.path.commonprefix([a[::-1], b[::-1]]))
+    if digits and prefix < shorter and suffix < shorter:
+        return 0.0
+    score = min(prefix + suffix, shorter) / max(longer, 1)
+    long_key = a if len(a) >= len(b) else b
+    if MIN_TOKEN_CHARS <= shorter < longer and (
+            (prefix == shorter and _separator_char(long_key[shorter]))
+            or (suffix == shorter and _separator_char(long_key[-shorter - 1]))):
+        score = max(score, TOKEN_MATCH_SCORE)
+    return score
+
+
+def _score_neighbours(codes: np.ndarray, rev_codes: np.ndarray, lengths: np.ndarray, side: np.ndarray,
+                      digits: np.ndarray, keys: np.ndarray, min_score: float) -> pd.DataFrame:
+    """Sorted-neighbourhood pass: scores each key against the next WINDOW keys in the order of codes."""
+    width = codes.shape[1]
+    order = np.argsort(codes.view(f"U{width}").ravel(), kind="stable")
+    codes, rev_codes, lengths, side, digits = codes[order], rev_codes[order], lengths[order], side[order], digits[order]
+
+    found = []
+    n = len(order)
+    for offset in range(1, WINDOW + 1):
+        i = np.arange(n - offset)
+        j = i + offset
+        cross = side[i] != side[j]
+        i, j = i[cross], j[cross]
+        if len(i) == 0:
+            continue
+
+        shorter = np.minimum(lengths[i], lengths[j])
+        longer = np.maximum(lengths[i], lengths[j])
+        prefix = _common_prefix(codes, i, j, lengths)
+        suffix = _common_prefix(rev_codes, i, j, lengths)
+
+        # Shared head and tail (a typo in between costs one character)
+        score = np.minimum(prefix + suffix, shorter) / np.maximum(longer, 1)
+
+        # The shorter key is a whole leading/trailing part of the longer one
+        long_row = np.where(lengths[i] >= lengths[j], i, j)
+        head = (prefix == shorter) & _is_separator(codes, long_row, shorter)
+        tail = (suffix == shorter) & _is_separator(rev_codes, long_row, shorter)
+        token = (head | tail) & (shorter >= MIN_TOKEN_CHARS) & (shorter < longer)
+        score = np.where(token, np.maximum(score, TOKEN_MATCH_SCORE), score)
+
+        # Deal numbers one digit apart (12345 vs 12346) are neighbouring trades, not typos: all-digit
+        # keys only pair up when one contains the other at an end (leading zeros, check digits)
+        numeric = digits[i] & digits[j]
+        score = np.where(numeric & (prefix < shorter) & (suffix < shorter), 0.0, score)
+
+        # Agreeing on a whole window says nothing about the rest of a longer key
+        saturated = np.flatnonzero(((prefix >= width) | (suffix >= width)) & (shorter > width))
+        for k in saturated:
+            a, b = keys[order[i[k]]], keys[order[j[k]]]
+            score[k] = _exact_score(a, b, digits[i[k]] and digits[j[k]])
+
+        keep = score >= min_score
+        found.append(pd.DataFrame({"i": order[i[keep]], "j": order[j[keep]], "score": score[keep]}))
+    if not found:
+        return pd.DataFrame({"i": [], "j": [], "score": []})
+    return pd.concat(found, ignore_index=True)
+
+
+def find_probable_matches(only_in_a: List, only_in_b: List, min_score: float = 0.8) -> List[Dict]:
+    """
+    Second pass over orphaned keys: pairs keys of A and B that are probably the same record
+    (typos, prefixes/suffixes like 699296 vs 699296_TZS). Candidates come from sorted-neighbourhood
+    blocking on the keys and on the reversed keys, so the work grows with n log n rather than n^2.
+    Each orphan is used at most once; returns [{"key_a", "key_b", "score"}] best first.
+    """
+    if not only_in_a or not only_in_b:
+        return []
+    keys_a = pd.Series(only_in_a, dtype=object).map(str).str.strip().str.lower().to_numpy(dtype=object)
+    keys_b = pd.Series(only_in_b, dtype=object).map(str).str.strip().str.lower().to_numpy(dtype=object)
+    side = np.concatenate([np.zeros(len(keys_a), dtype=bool), np.ones(len(keys_b), dtype=bool)])
+    keys = pd.Series(np.concatenate([keys_a, keys_b]), dtype=object)
+    codes, rev_codes = _char_codes(keys)
+    lengths = keys.str.len().to_numpy(dtype=np.int64)
+    digits = keys.str.fullmatch(r"\d+").to_numpy(dtype=bool)
+    keys = keys.to_numpy(dtype=object)
+
+    # Forward order catches shared prefixes, reversed order shared suffixes
+    candidates = pd.concat([
+        _score_neighbours(codes, rev_codes, lengths, side, digits, keys, min_score),
+        _score_neighbours(rev_codes, codes, lengths, side, digits, keys, min_score),
+    ], ignore_index=True)
+    if candidates.empty:
+        return []
+
+    # Orient every pair as (A, B) and keep each orphan's best partner only
+    i, j = candidates["i"].to_numpy(dtype=np.int64), candidates["j"].to_numpy(dtype=np.int64)
+    pos_a, pos_b = np.where(side[i], j, i), np.where(side[i], i, j) - len(keys_a)
+    pairs = pd.DataFrame({"a": pos_a, "b": pos_b, "score": candidates["score"].to_numpy()})
+    pairs = pairs.sort_values("score", ascending=False, kind="stable")
+    pairs = pairs.drop_duplicates("a").drop_duplicates("b")
+
+    return [
+        {"key_a": only_in_a[a], "key_b": only_in_b[b], "score": round(float(score), 3)}
+        for a, b, score in zip(pairs["a"], pairs["b"], pairs["score"])
+    ]
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.fingerprint import row_fingerprints
+from src.core.plan import plan_rows
+from src.core.reconciler import ReconEngine
+from src.core.result import ReconResult, concat_breaks, empty_breaks
+
+DEFAULT_STATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "recon_state")
+
+
+class DeltaStateStore:
+    """Persists per-key row fingerprints and breaks of the last run of each A/B pair."""
+
+    def __init__(self, state_dir: str = DEFAULT_STATE_DIR):
+        self.state_dir = state_dir
+
+    def _path(self, path_a: str, path_b: str, key_col: str) -> str:
+        pair_id = hashlib.sha1(f"{os.path.abspath(path_a)}|{os.path.abspath(path_b)}|{key_col}".encode("utf-8")).hexdigest()
+        return os.path.join(self.state_dir, f"{pair_id}.pkl")
+
+    def load(self, path_a: str, path_b: str, key_col: str) -> Optional[Dict]:
+        path = self._path(path_a, path_b, key_col)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Warning: Could not load previous recon state: {e}")
+            return None
+
+    def save(self, path_a: str, path_b: str, key_col: str, state: Dict):
+        os.makedirs(self.state_dir, exist_ok=True)
+        with open(self._path(path_a, path_b, key_col), 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def config_signature(key_col: str, mapping: Dict[str, str], tolerance: Any, data_mapping: Dict, accepted_matches: set) -> str:
+    """Anything besides the data that changes the outcome; a different signature invalidates the previous run."""
+    config = {
+        "key": key_col,
+        "mapping": sorted(mapping.items()),
+        "tolerance": tolerance if isinstance(tolerance, dict) else float(tolerance),
+        "data_mapping": data_mapping,
+        "accepted": sorted(accepted_matches or []),
+    }
+    return hashlib.sha1(json.dumps(config, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _changed_keys(previous: pd.Series, current: pd.Series) -> pd.Index:
+    """Keys that are new or whose fingerprint differs from the previous run."""
+    pos = previous.index.get_indexer(current.index)
+    same = pos >= 0
+    same[same] = previous.to_numpy()[pos[same]] == current.to_numpy()[same]
+    return current.index[~same]
+
+
+def reconcile_incremental(engine: ReconEngine, key_col: str, mapping: Dict[str, str], tolerance: Any = 0.01,
+                          accepted_matches: set = None, state: Optional[Dict] = None) -> Tuple[ReconResult, Dict]:
+    """
+    Delta reconciliation against the previous run's state.
+    Only common keys whose row fingerprint changed on either side are compared cell by cell, with the
+    comparison plan and date formats of the last full run, so the outcome equals a full run;
+    breaks of unchanged keys are reused. Returns (recon_data, new_state).
+    """
+    signature = config_signature(key_col, mapping, tolerance, engine.data_mapping, accepted_matches)
+    schema = (tuple(engine.df_a.columns), tuple(engine.df_b.columns))
+    # States written before plans were kept (or before breaks were columnar) are discarded too
+    if state and (state.get("signature") != signature or state.get("schema") != schema or "plan" not in state):
+        print("DEBUG: Recon settings or file layout changed since last run, running a full comparison")
+        state = None
+
+    # 1. Key both sides and fingerprint the first occurrence of every key
+    df_a_work, df_b_work = engine.prepare_work_frames(key_col, mapping)
+    a_first = df_a_work.drop_duplicates(subset=['_match_key'])
+    b_first = df_b_work.drop_duplicates(subset=['_match_key'])
+
+    # Accepted matches are tracked by row number, so row moves count as changes then
+    cols_a = list(mapping.keys()) + (['_orig_row_idx'] if accepted_matches else [])
+    fp_a = pd.Series(row_fingerprints(a_first, cols_a), index=a_first['_match_key'].to_numpy(dtype=object))
+    fp_b = pd.Series(row_fingerprints(b_first, list(mapping.values())), index=b_first['_match_key'].to_numpy(dtype=object))
+
+    common = fp_a.index[fp_a.index.isin(fp_b.index)]
+    only_in_a = fp_a.index[~fp_a.index.isin(fp_b.index)]
+    only_in_b = fp_b.index[~fp_b.index.isin(fp_a.index)]
+
+    # 2. Work out which keys changed since the last run
+    if state:
+        prev_a, prev_b, prev_breaks = state["fp_a"], state["fp_b"], state["breaks"]
+        changed_a = _changed_keys(prev_a, fp_a)
+        changed_b = _changed_keys(prev_b, fp_b)
+        removed = prev_a.index.difference(fp_a.index).union(prev_b.index.difference(fp_b.index))
+        changed = changed_a.union(changed_b).union(removed)
+        to_compare = common[common.isin(changed)]
+        reused = common[~common.isin(changed)]
+    else:
+        prev_breaks = empty_breaks()
+        changed = fp_a.index.union(fp_b.index)
+        to_compare, reused = common, common[:0]
+
+    # 3. Compare only the changed common keys, reuse the rest
+    engine.fast_path_cleared = 0
+    engine.comparison_plan = {}
+    if state:
+        # A few changed rows say little about a column; keep reading it like the full run did
+        engine.pinned_plan = state["plan"]
+        engine.date_formats = dict(state["date_formats"])
+    else:
+        engine.date_formats = {}
+        engine.pin_date_formats(df_a_work, df_b_work, mapping)
+    _, _, _, breaks = engine.match_keyed(
+        a_first[a_first['_match_key'].isin(to_compare)], b_first[b_first['_match_key'].isin(to_compare)],
+        mapping, tolerance=tolerance, accepted_matches=accepted_matches
+    )
+    breaks = concat_breaks([breaks, prev_breaks[prev_breaks["key"].isin(reused)]])
+    # Back into the full run's order (A row order, then mapping order) so the detail sheets match
+    key_rank = pd.Index(a_first['_match_key']).get_indexer(breaks["key"])
+    column_rank = pd.Index(list(mapping.keys())).get_indexer(breaks["column"].astype(object))
+    breaks = breaks.iloc[np.lexsort((column_rank, key_rank))].reset_index(drop=True)
+    print(f"DEBUG: Incremental recon compared {len(to_compare)} of {len(common)} matched keys")
+
+    engine.pinned_plan = None
+    plan = dict(state["plan"], **engine.comparison_plan) if state else engine.comparison_plan
+    stats = {"fast_path_cleared": engine.fast_path_cleared, "changed_since_last_run": len(changed)}
+    recon_data = ReconResult(key_col, len(df_a_work), len(df_b_work), len(common), breaks, only_in_a, only_in_b,
+                             plan_rows(plan), stats)
+    new_state = {
+        "signature": signature,
+        "schema": schema,
+        "plan": plan,
+        "date_formats": engine.date_formats,
+        "fp_a": fp_a,
+        "fp_b": fp_b,
+        "breaks": recon_data.breaks,
+    }
+    return recon_data, new_state
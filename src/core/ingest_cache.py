@@ -0,0 +1,185 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+from src.handlers.base_handler import estimate_memory
+
+try:
+    import pyarrow  # noqa: F401  (optional, not in requirements.txt: Parquet disk entries)
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "ingest_cache")
+
+
+class IngestionCache:
+    """
+    Cache of parsed input files in front of the handlers (a PDF/OCR read can take minutes).
+    Entries are keyed by path, size and mtime (plus a content hash if hash_content=True) and by the
+    read arguments, which include the handler's cache_tag(), so an edited file or a change to the
+    parsing/cleaning rules is simply a new entry. Two tiers: an in-memory LRU bounded by memory_limit_mb and
+    an on-disk tier bounded by disk_limit_mb; both evict least recently used entries first.
+    Disk entries are pickles (Parquet instead when pyarrow happens to be installed). Loading a pickle
+    runs whatever code the file holds, so cache_dir must only be writable by the user running the tool.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, memory_limit_mb: int = 512, disk_limit_mb: int = 4096,
+                 hash_content: bool = False):
+        self.cache_dir = cache_dir
+        self.memory_limit = memory_limit_mb * 1024 * 1024
+        self.disk_limit = disk_limit_mb * 1024 * 1024
+        self.hash_content = hash_content
+        self._memory: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        # A and B are read from two threads at once (see read_pair in the coordinator)
+        self._lock = threading.RLock()
+
+    def cache_key(self, path: str, **read_args) -> str:
+        st = os.stat(path)
+        parts = [os.path.abspath(path), str(st.st_size), str(st.st_mtime_ns), repr(sorted(read_args.items()))]
+        if self.hash_content:
+            digest = hashlib.sha1()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+            parts.append(digest.hexdigest())
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+    def read(self, path: str, loader: Callable[[], pd.DataFrame], **read_args) -> pd.DataFrame:
+        """Returns the parsed file from cache, or runs loader() and caches its result."""
+        try:
+            key = self.cache_key(path, **read_args)
+        except OSError:
+            # Not a local file (or gone): let the handler raise its usual error
+            return loader()
+
+        df = self._lookup(key, path)
+        if df is not None:
+            return df
+
+        self.stats["misses"] += 1
+        df = loader()
+        if df.empty:
+            # Handlers return an empty frame on a failed (e.g. OCR) read; worth retrying next time
+            return df
+        self._memory_put(key, df)
+        self._disk_put(key, df)
+        # Shallow (Copy-on-Write) copy: callers renaming or adding columns never touch the cached frame
+        return df.copy(deep=False)
+
+    def peek(self, path: str, **read_args) -> Optional[pd.DataFrame]:
+        """The cached parse of path (memory or disk tier) if there is one; never parses the file."""
+        try:
+            key = self.cache_key(path, **read_args)
+        except OSError:
+            return None
+        return self._lookup(key, path)
+
+    def _lookup(self, key: str, path: str) -> Optional[pd.DataFrame]:
+        df = self._memory_get(key)
+        if df is not None:
+            self.stats["memory_hits"] += 1
+            print(f"DEBUG: Ingestion cache hit (memory) for {os.path.basename(path)}")
+            return df.copy(deep=False)
+
+        df = self._disk_get(key)
+        if df is not None:
+            self.stats["disk_hits"] += 1
+            print(f"DEBUG: Ingestion cache hit (disk) for {os.path.basename(path)}")
+            self._memory_put(key, df)
+            return df.copy(deep=False)
+        return None
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._sizes.clear()
+
+    # --- memory tier ---
+
+    def _memory_get(self, key: str) -> Optional[pd.DataFrame]:
+        with self._lock:
+            df = self._memory.get(key)
+            if df is not None:
+                self._memory.move_to_end(key)
+            return df
+
+    def _memory_put(self, key: str, df: pd.DataFrame):
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.memory_limit:
+            return
+        with self._lock:
+            self._memory[key] = df
+            self._sizes[key] = size
+            while sum(self._sizes.values()) > self.memory_limit:
+                old, _ = self._memory.popitem(last=False)
+                self._sizes.pop(old, None)
+                self.stats["evictions"] += 1
+
+    # --- disk tier ---
+
+    def _disk_path(self, key: str, ext: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.{ext}")
+
+    def _disk_get(self, key: str) -> Optional[pd.DataFrame]:
+        for ext in ("parquet", "pkl"):
+            path = self._disk_path(key, ext)
+            if not os.path.exists(path):
+                continue
+            try:
+                # Trusted: only this cache writes to cache_dir (see the class docstring)
+                df = pd.read_parquet(path) if ext == "parquet" else pd.read_pickle(path)
+                os.utime(path)  # last access drives disk eviction
+                return df
+            except Exception as e:
+                print(f"Warning: Dropping unreadable ingestion cache entry {path}: {e}")
+                # Another batch process may have dropped it already
+                with suppress(OSError):
+                    os.remove(path)
+        return None
+
+    def _disk_put(self, key: str, df: pd.DataFrame):
+        if self.disk_limit <= 0:
+            return
+        if estimate_memory(df) > self.disk_limit:
+            # Would be evicted straight after a (multi-GB) write
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            written = False
+            if HAS_PARQUET and all(isinstance(c, str) for c in df.columns):
+                try:
+                    df.to_parquet(self._disk_path(key, "parquet"))
+                    written = True
+                except Exception:
+                    # Mixed-type object columns (PDF/OCR tables) do not fit Parquet's schema
+                    if os.path.exists(self._disk_path(key, "parquet")):
+                        os.remove(self._disk_path(key, "parquet"))
+            if not written:
+                df.to_pickle(self._disk_path(key, "pkl"), protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                self._evict_disk()
+        except Exception as e:
+            print(f"Warning: Could not write ingestion cache entry: {e}")
+
+    def _evict_disk(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            st = os.stat(path)
+            entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.disk_limit:
+                break
+            os.remove(path)
+            total -= size
+            self.stats["evictions"] += 1
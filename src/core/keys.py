@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+from typing import List
+
+# Between the parts of aggregate group keys: ("A", "BC") and ("AB", "C") stay apart and read as "A | BC"
+GROUP_KEY_SEPARATOR = " | "
+
+# Plain decimal literals (optional sign, fraction and exponent) that float() accepts
+NUMERIC_PATTERN = r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+
+
+def normalize_key(v) -> str:
+    """Normalizes a single key cell so that 699451 and 699451.0 produce the same key."""
+    if pd.isna(v): return "nan"
+    try:
+        f_val = float(v)
+        if f_val == int(f_val): return str(int(f_val)).strip()
+        return str(f_val).strip()
+    except:
+        return str(v).strip()
+
+
+def _format_floats(values: np.ndarray) -> np.ndarray:
+    """Formats a float64 array exactly like normalize_key does for numeric cells."""
+    out = np.empty(len(values), dtype=object)
+    finite = np.isfinite(values)
+    whole = np.zeros(len(values), dtype=bool)
+    whole[finite] = values[finite] == np.trunc(values[finite])
+    # Whole numbers that fit in int64 are formatted in bulk, everything else
+    # (fractions, inf, >= 2**63) goes through the scalar path.
+    fast = whole & (np.abs(np.where(finite, values, 0.0)) < 2.0 ** 63)
+    out[fast] = list(map(str, values[fast].astype(np.int64).tolist()))
+    slow = ~fast
+    if slow.any():
+        out[slow] = [normalize_key(v) for v in values[slow].tolist()]
+    return out
+
+
+def _normalize_strings(values: np.ndarray) -> np.ndarray:
+    """Normalizes an object array of Python strings column-wise."""
+    stripped = pd.Series(values, dtype=object).str.strip()
+    out = stripped.to_numpy(dtype=object).copy()
+
+    numeric = stripped.str.fullmatch(NUMERIC_PATTERN).to_numpy(dtype=bool)
+    if numeric.any():
+        literals = out[numeric]
+        floats = literals.astype(np.float64)
+        formatted = _format_floats(floats)
+        # Literals beyond float64 ("1e400") overflow to inf; normalize_key keeps those as text
+        overflow = np.isinf(floats)
+        formatted[overflow] = literals[overflow]
+        out[numeric] = formatted
+
+    # float() also accepts digit separators ("1_000"), keep those on the scalar path
+    underscored = ~numeric & stripped.str.contains("_", regex=False).to_numpy(dtype=bool)
+    if underscored.any():
+        out[underscored] = [normalize_key(v) for v in values[underscored]]
+    return out
+
+
+def normalize_key_column(series: pd.Series) -> np.ndarray:
+    """Vectorized equivalent of applying normalize_key to every cell of a column."""
+    out = np.full(len(series), "nan", dtype=object)
+    valid = ~series.isna().to_numpy(dtype=bool)
+    if not valid.any():
+        return out
+
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_numeric_dtype(dtype):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        out[valid] = _format_floats(values[valid])
+        return out
+
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        values = series.to_numpy(dtype=object)[valid]
+        if pd.api.types.infer_dtype(values, skipna=False) == "string":
+            out[valid] = _normalize_strings(values)
+            return out
+
+    # Mixed objects, datetimes, categoricals etc: normalize each distinct value once
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    normalized = np.array([normalize_key(u) for u in uniques] + ["nan"], dtype=object)
+    return normalized[codes]
+
+
+def build_match_keys(df: pd.DataFrame, cols: List[str], separator: str = "") -> pd.Series:
+    """
+    Builds the reconciliation match key for every row of df.
+    Parts are normalized column by column, concatenated and stripped of spaces
+    (e.g. File A "John Smith" matches File B "John" + "Smith").
+    With a separator (group keys, see GROUP_KEY_SEPARATOR) the parts are joined with it instead.
+    """
+    parts = [normalize_key_column(df[c]) for c in cols if c in df.columns]
+    if not parts:
+        return pd.Series("", index=df.index, dtype=object)
+
+    if separator:
+        # Parts lose their spaces first, so a separator with spaces never occurs inside a part
+        parts = [pd.Series(p, dtype=object).str.replace(" ", "", regex=False).to_numpy(dtype=object) for p in parts]
+        key = parts[0]
+        for part in parts[1:]:
+            key = key + separator + part
+        return pd.Series(key, index=df.index, dtype=object)
+
+    key = parts[0]
+    for part in parts[1:]:
+        key = key + part
+    return pd.Series(key, index=df.index, dtype=object).str.replace(" ", "", regex=False)
+
+
+def partition_ids(keys: pd.Series, num_partitions: int) -> np.ndarray:
+    """Stable hash partition number (0..num_partitions-1) for each normalized match key."""
+    hashes = pd.util.hash_array(np.asarray(keys, dtype=object))
+    return (hashes % np.uint64(num_partitions)).astype(np.int64)
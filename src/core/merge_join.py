@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from src.core.keys import build_match_keys
+from src.core.plan import plan_rows
+from src.core.reconciler import ReconEngine
+from src.core.result import ReconResult, concat_breaks
+
+# Normalized keys that can be ordered as numbers (e.g. Deal Id 699200 < 699296)
+INTEGER_KEY_PATTERN = r"[+-]?\d+"
+
+
+class UnsortedInputError(ValueError):
+    """Raised when an input handed to the sorted-merge path is not ordered by its match key."""
+
+
+class SortedMergeReconciler:
+    """
+    Streaming sort-merge reconciliation for extracts that are already sorted by key.
+    Both inputs are consumed as chunk generators in key order; every block of keys that can no
+    longer appear further down either file is reconciled and emitted immediately, so memory
+    depends on the chunk size rather than the file size.
+    """
+
+    def __init__(self, data_mapping: Dict[str, Dict[str, str]] = None):
+        self.data_mapping = data_mapping or {}
+        self.numeric_order = None
+        self.fast_path_cleared = 0
+        self.comparison_plan = {}
+        self.unpaired_a, self.unpaired_b = [], []
+
+    def _keyed_chunks(self, chunks: Iterable[pd.DataFrame], key_cols: List[str], keep_cols: List[str], group: str) -> Iterator[pd.DataFrame]:
+        """Projects each chunk to the needed columns and attaches its match key."""
+        offset = 0
+        for chunk in chunks:
+            chunk.columns = [str(c).strip() for c in chunk.columns]
+            for k in key_cols:
+                if k not in chunk.columns:
+                    raise ValueError(f"Primary Key part '{k}' not found in Group {group}")
+            cols = list(dict.fromkeys(c for c in key_cols + keep_cols if c in chunk.columns))
+            part = chunk[cols].reset_index(drop=True)
+            if group == "A":
+                part['_orig_row_idx'] = np.arange(offset, offset + len(part))
+            part['_match_key'] = build_match_keys(part, key_cols)
+            offset += len(part)
+            if len(part):
+                yield part
+
+    def _sort_values(self, keys: pd.Series) -> np.ndarray:
+        """Values the input is expected to be ordered by (numeric ids compare as numbers)."""
+        keys = keys.to_numpy(dtype=object)
+        if self.numeric_order:
+            if not pd.Series(keys, dtype=object).str.fullmatch(INTEGER_KEY_PATTERN).all():
+                raise UnsortedInputError("Non-numeric key found in an input sorted by numeric key")
+            return keys.astype(np.float64)
+        return keys
+
+    def _pull(self, source: Iterator[pd.DataFrame], pending: pd.DataFrame, last: Any, group: str) -> Tuple[pd.DataFrame, Any, bool]:
+        """Appends the next chunk of a side to its pending rows after checking key order."""
+        chunk = next(source, None)
+        if chunk is None:
+            return pending, last, True
+        if self.numeric_order is None:
+            self.numeric_order = bool(chunk['_match_key'].str.fullmatch(INTEGER_KEY_PATTERN).all())
+
+        values = self._sort_values(chunk['_match_key'])
+        in_order = bool(np.all(values[1:] >= values[:-1])) if len(values) > 1 else True
+        if not in_order or (last is not None and values[0] < last):
+            raise UnsortedInputError(f"Group {group} is not sorted by its key")
+
+        chunk['_sort_value'] = values
+        pending = chunk if pending is None or pending.empty else pd.concat([pending, chunk], ignore_index=True)
+        return pending, values[-1], False
+
+    def iter_blocks(self, chunks_a: Iterable[pd.DataFrame], chunks_b: Iterable[pd.DataFrame], key_col: str,
+                    mapping: Dict[str, str], tolerance: Any = 0.01, accepted_matches: set = None,
+                    duplicates: str = "first") -> Iterator[Tuple[int, int, int, List, List, pd.DataFrame]]:
+        """
+        Walks both inputs in key order.
+        Yields (rows_a, rows_b, matched, only_in_a, only_in_b, breaks) for each reconciled block.
+        Raises UnsortedInputError as soon as either input turns out to be out of order.
+        """
+        key_cols_a, key_cols_b = ReconEngine.resolve_key_columns(key_col, mapping)
+        source_a = self._keyed_chunks(chunks_a, key_cols_a, list(mapping.keys()), "A")
+        source_b = self._keyed_chunks(chunks_b, key_cols_b, list(mapping.values()), "B")
+        engine = ReconEngine(pd.DataFrame(), pd.DataFrame(), data_mapping=self.data_mapping)
+
+        self.numeric_order = None
+        self.fast_path_cleared = 0
+        self.comparison_plan = {}
+        self.unpaired_a, self.unpaired_b = engine.unpaired_a, engine.unpaired_b
+        pending_a, last_a, done_a = self._pull(source_a, None, None, "A")
+        pending_b, last_b, done_b = self._pull(source_b, None, None, "B")
+
+        while True:
+            # Keys below the smallest "last seen" key cannot appear again in either file
+            limits = [last for last, done in ((last_a, done_a), (last_b, done_b)) if not done]
+            boundary = min(limits) if limits else None
+
+            if boundary is None:
+                block_a, block_b = pending_a, pending_b
+            else:
+                block_a = pending_a[pending_a['_sort_value'] < boundary] if pending_a is not None else None
+                block_b = pending_b[pending_b['_sort_value'] < boundary] if pending_b is not None else None
+
+            block_a = block_a if block_a is not None else pd.DataFrame({'_match_key': [], '_orig_row_idx': []})
+            block_b = block_b if block_b is not None else pd.DataFrame({'_match_key': []})
+            if len(block_a) or len(block_b):
+                common, only_a, only_b, diffs = engine.match_keyed(block_a, block_b, mapping, tolerance, accepted_matches, duplicates)
+                self.fast_path_cleared = engine.fast_path_cleared
+                self.comparison_plan = engine.comparison_plan
+                yield len(block_a), len(block_b), len(common), only_a.tolist(), only_b.tolist(), diffs
+
+            if boundary is None:
+                return
+
+            pending_a = pending_a[pending_a['_sort_value'] >= boundary] if pending_a is not None else None
+            pending_b = pending_b[pending_b['_sort_value'] >= boundary] if pending_b is not None else None
+            if not done_a and last_a == boundary:
+                pending_a, last_a, done_a = self._pull(source_a, pending_a, last_a, "A")
+            if not done_b and last_b == boundary:
+                pending_b, last_b, done_b = self._pull(source_b, pending_b, last_b, "B")
+
+    def reconcile(self, chunks_a: Iterable[pd.DataFrame], chunks_b: Iterable[pd.DataFrame], key_col: str,
+                  mapping: Dict[str, str], tolerance: Any = 0.01, accepted_matches: set = None, duplicates: str = "first") -> ReconResult:
+        """Same contract and result structure as ReconEngine.reconcile for key-sorted inputs."""
+        total_a = total_b = matched = 0
+        only_in_a, only_in_b, breaks = [], [], []
+        for rows_a, rows_b, block_matched, block_only_a, block_only_b, block_diffs in self.iter_blocks(
+                chunks_a, chunks_b, key_col, mapping, tolerance, accepted_matches, duplicates):
+            total_a += rows_a
+            total_b += rows_b
+            matched += block_matched
+            only_in_a.extend(block_only_a)
+            only_in_b.extend(block_only_b)
+            breaks.append(block_diffs)
+
+        stats = {"fast_path_cleared": self.fast_path_cleared}
+        if duplicates != "first":
+            stats["unpaired_a"] = self.unpaired_a
+            stats["unpaired_b"] = self.unpaired_b
+        return ReconResult(key_col, total_a, total_b, matched, concat_breaks(breaks), only_in_a, only_in_b,
+                           plan_rows(self.comparison_plan), stats, duplicates)
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List
+
+from src.core.keys import build_match_keys
+from src.core.plan import build_plan, execute_step, plan_rows
+from src.core.reconciler import ReconEngine
+from src.core.translation import TranslationTable
+
+CONSENSUS_BREAK = "VALUE BREAK"
+NO_CONSENSUS = "NO CONSENSUS"
+
+
+class MultiReconResult:
+    """
+    Outcome of an N-source reconciliation.
+    presence: one row per key seen anywhere, a bool column per source.
+    breaks: one row per (key, column) where the sources disagree, with every source's value,
+    the consensus value and the sources that disagree with it.
+    """
+
+    def __init__(self, key_name: str, sources: List[str], rows: List[int], presence: pd.DataFrame,
+                 breaks: pd.DataFrame, plan: List[Dict]):
+        self.key_name = key_name
+        self.sources = sources
+        self.rows = rows
+        self.presence = presence
+        self.breaks = breaks
+        self.plan = plan
+
+    @property
+    def in_all(self) -> int:
+        return int(self.presence[self.sources].all(axis=1).sum())
+
+    def source_summary(self) -> pd.DataFrame:
+        """Per source: rows, keys, keys it is missing and cells where it disagrees with the consensus."""
+        present = self.presence[self.sources]
+        disagreeing = self.breaks["disagreeing"].str.split(", ").explode() if len(self.breaks) else pd.Series(dtype=object)
+        return pd.DataFrame({
+            "Source": self.sources,
+            "Total Rows": self.rows,
+            "Unique Keys": present.sum().to_numpy(),
+            "Keys Missing": (~present).sum().to_numpy(),
+            "Disagreeing Cells": [int((disagreeing == s).sum()) for s in self.sources],
+        })
+
+
+class MultiSourceReconciler:
+    """
+    Reconciles N sources against each other in one pass (e.g. front office, back office, custodian).
+    Every source is keyed once into a shared key index; each mapped column is compared pairwise
+    between the sources holding it (vectorized over all keys) and the pairwise agreement decides
+    the consensus value and which source is the odd one out.
+    The first source is the reference: key_col and the mapped columns use its names, and
+    mappings[i] maps them to the column names of source i + 1.
+    """
+
+    def __init__(self, translations: TranslationTable = None):
+        self.translations = translations or TranslationTable.from_dict({})
+
+    def _key_source(self, df: pd.DataFrame, key_cols: List[str], name: str) -> pd.DataFrame:
+        for k in key_cols:
+            if k not in df.columns:
+                raise ValueError(f"Primary Key part '{k}' not found in {name}")
+        keys = build_match_keys(df, key_cols)
+        # First row per key, like the default pairwise run
+        first = ~keys.duplicated().to_numpy()
+        return df[first].assign(_match_key=keys[first].to_numpy())
+
+    def _cells(self, frame: pd.DataFrame, col: str, pos: np.ndarray):
+        """Raw and translated values of a column on the shared key index (None where the key is absent)."""
+        present = pos >= 0
+        cells = frame[col].take(pos[present])
+        raw = np.full(len(pos), None, dtype=object)
+        raw[present] = cells.to_numpy(dtype=object)
+        mapped = raw.copy()
+        data_mapping = self.translations.load()
+        if col in data_mapping:
+            mapped[present] = self.translations.apply(col, cells)
+        return raw, mapped
+
+    def reconcile(self, frames: List[pd.DataFrame], names: List[str], key_col: str, mappings: List[Dict[str, str]],
+                  tolerance: Any = 0.01) -> MultiReconResult:
+        if len(frames) < 2 or len(mappings) != len(frames) - 1:
+            raise ValueError("N-way reconciliation needs at least two sources and one mapping per extra source")
+        global_tol, column_tolerances = ReconEngine.split_tolerance(tolerance)
+        frames = [df.set_axis([str(c).strip() for c in df.columns], axis=1) for df in frames]
+        n_sources = len(frames)
+
+        # 1. Key every source once and build the shared key index
+        key_cols = [key_col.split("+")] + [ReconEngine.resolve_key_columns(key_col, m)[1] for m in mappings]
+        keyed = [self._key_source(df, cols, name) for df, cols, name in zip(frames, key_cols, names)]
+        index = pd.Index(pd.unique(np.concatenate([k['_match_key'].to_numpy(dtype=object) for k in keyed])))
+        pos = np.stack([pd.Index(k['_match_key'].to_numpy(dtype=object)).get_indexer(index) for k in keyed])
+        present = pos >= 0
+        presence = pd.DataFrame(present.T, columns=names)
+        presence.insert(0, "key", index.to_numpy(dtype=object))
+
+        # 2. Compare every mapped column between each pair of sources holding it
+        key_parts = set(key_cols[0]) | {key_col}
+        columns = [c for c in dict.fromkeys(c for m in mappings for c in m) if c not in key_parts]
+        schemas = [tuple(c for c in df.columns) for df in frames]
+        # Date format per (source, column, schema), chosen once from the first cells compared
+        plan, frames_out, formats = [], [], {}
+        for col in columns:
+            src_cols = [col if col in frames[0].columns else None] + [m.get(col) if m.get(col) in df.columns else None
+                                                                     for m, df in zip(mappings, frames[1:])]
+            holders = [s for s in range(n_sources) if src_cols[s] is not None]
+            if len(holders) < 2:
+                continue
+            cells = {s: self._cells(keyed[s], src_cols[s], pos[s]) for s in holders}
+
+            # agree[s, t] is True where both sources have the key and their values match
+            agree = np.zeros((n_sources, n_sources, len(index)), dtype=bool)
+            broken = np.zeros(len(index), dtype=bool)
+            for i, s in enumerate(holders):
+                for t in holders[i + 1:]:
+                    both = np.flatnonzero(present[s] & present[t])
+                    step = build_plan([(col, src_cols[t], cells[s][1][both], cells[t][1][both])], global_tol, column_tolerances,
+                                      schemas[s], schemas[t], formats, (s, t))[0]
+                    plan.append(dict(plan_rows({col: step})[0], **{"Sources": f"{names[s]} vs {names[t]}"}))
+                    pair_breaks = execute_step(step, cells[s][1][both], cells[t][1][both])
+                    agree[s, t, both] = agree[t, s, both] = ~pair_breaks
+                    broken[both[pair_breaks]] = True
+
+            rows = np.flatnonzero(broken)
+            if len(rows) == 0:
+                continue
+
+            # 3. Consensus: the source agreeing with most others (earlier sources win ties) and everyone agreeing with it
+            holds = np.zeros((n_sources, len(rows)), dtype=bool)
+            holds[holders] = present[holders][:, rows]
+            votes = np.where(holds, agree[:, :, rows].sum(axis=1), -1)
+            leader = votes.argmax(axis=0)
+            cols_idx = np.arange(len(rows))
+            with_leader = agree[leader, :, rows].T | (np.arange(n_sources)[:, None] == leader[None, :])
+            with_leader &= holds
+            majority = with_leader.sum(axis=0) * 2 > holds.sum(axis=0)
+            disagreeing = holds & ~with_leader
+
+            out = pd.DataFrame({
+                "_row": rows,
+                "key": index.to_numpy(dtype=object)[rows],
+                "column": col,
+                "status": np.where(majority, CONSENSUS_BREAK, NO_CONSENSUS),
+                "consensus": [cells[l][0][r] if m else None for l, r, m in zip(leader, rows, majority)],
+                "disagreeing": [", ".join(names[s] for s in np.flatnonzero(disagreeing[:, i])) if majority[i]
+                                else ", ".join(names[s] for s in np.flatnonzero(holds[:, i])) for i in cols_idx],
+            })
+            for s in range(n_sources):
+                out[names[s]] = cells[s][0][rows] if s in cells else None
+            frames_out.append(out)
+
+        if frames_out:
+            # Key order first, mapping order within a key
+            breaks = pd.concat(frames_out, ignore_index=True).sort_values("_row", kind="stable")
+            breaks = breaks.drop(columns="_row").reset_index(drop=True)
+        else:
+            breaks = pd.DataFrame(columns=["key", "column", "status", "consensus", "disagreeing"] + names)
+        return MultiReconResult(key_col, names, [len(df) for df in frames], presence, breaks, plan)
@@ -0,0 +1,121 @@
+import math
+import os
+import pickle
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List
+
+from src.core.keys import build_match_keys, partition_ids
+from src.core.plan import plan_rows
+from src.core.reconciler import ReconEngine
+from src.core.result import ReconResult, concat_breaks
+
+# In-memory pandas frames are typically 3-5x larger than the text they were parsed from
+MEMORY_EXPANSION = 4
+
+
+def estimate_partitions(total_bytes: int, memory_limit_mb: int) -> int:
+    """Number of partitions so that one A/B partition pair fits in half of the memory budget."""
+    budget = memory_limit_mb * 1024 * 1024 / 2
+    return max(1, math.ceil(total_bytes * MEMORY_EXPANSION / budget))
+
+
+def estimate_chunk_rows(file_path: str, memory_limit_mb: int, sample_bytes: int = 65536) -> int:
+    """Rows per ingestion chunk so that a parsed chunk uses about a quarter of the memory budget."""
+    with open(file_path, 'rb') as f:
+        sample = f.read(sample_bytes)
+    row_bytes = max(1, len(sample) // max(1, sample.count(b"\n")))
+    budget = memory_limit_mb * 1024 * 1024 / 4
+    return max(1000, int(budget / (row_bytes * MEMORY_EXPANSION)))
+
+
+class SpillReconciler:
+    """
+    Out-of-core reconciliation for inputs larger than RAM.
+    Each input is streamed once and its rows are hash-partitioned by normalized match key into
+    on-disk partition files; partitions are then reconciled one pair at a time and merged.
+    """
+
+    def __init__(self, num_partitions: int = 16, data_mapping: Dict[str, Dict[str, str]] = None, spill_dir: str = None):
+        self.num_partitions = max(1, int(num_partitions))
+        self.data_mapping = data_mapping or {}
+        self.spill_dir = spill_dir
+
+    def _spill(self, chunks: Iterable[pd.DataFrame], key_cols: List[str], keep_cols: List[str], prefix: str, group: str) -> int:
+        """Writes every chunk's rows to the partition files of their key. Returns the row count."""
+        handles = {}
+        total = 0
+        try:
+            for chunk in chunks:
+                chunk.columns = [str(c).strip() for c in chunk.columns]
+                for k in key_cols:
+                    if k not in chunk.columns:
+                        raise ValueError(f"Primary Key part '{k}' not found in Group {group}")
+
+                # Only the key and mapped columns travel to disk
+                cols = list(dict.fromkeys(c for c in key_cols + keep_cols if c in chunk.columns))
+                part = chunk[cols].copy()
+                if group == "A":
+                    part['_orig_row_idx'] = np.arange(total, total + len(part))
+                part['_match_key'] = build_match_keys(part, key_cols)
+                total += len(part)
+
+                ids = partition_ids(part['_match_key'], self.num_partitions)
+                for pid, rows in part.groupby(ids, sort=False):
+                    if pid not in handles:
+                        handles[pid] = open(f"{prefix}_{pid}.pkl", 'wb')
+                    pickle.dump(rows, handles[pid], protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            for fh in handles.values():
+                fh.close()
+        return total
+
+    def _load(self, prefix: str, pid: int) -> pd.DataFrame:
+        """Reads back all pieces of one partition in their original order."""
+        path = f"{prefix}_{pid}.pkl"
+        if not os.path.exists(path):
+            return pd.DataFrame({'_match_key': pd.Series(dtype=object), '_orig_row_idx': pd.Series(dtype=np.int64)})
+        pieces = []
+        with open(path, 'rb') as f:
+            while True:
+                try:
+                    pieces.append(pickle.load(f))
+                except EOFError:
+                    break
+        return pd.concat(pieces) if len(pieces) > 1 else pieces[0]
+
+    def reconcile(self, chunks_a: Iterable[pd.DataFrame], chunks_b: Iterable[pd.DataFrame], key_col: str,
+                  mapping: Dict[str, str], tolerance: Any = 0.01, accepted_matches: set = None, duplicates: str = "first") -> ReconResult:
+        """Same contract and result structure as ReconEngine.reconcile, but with bounded memory."""
+        key_cols_a, key_cols_b = ReconEngine.resolve_key_columns(key_col, mapping)
+        work_dir = tempfile.mkdtemp(prefix="recon_spill_", dir=self.spill_dir)
+        prefix_a, prefix_b = os.path.join(work_dir, "a"), os.path.join(work_dir, "b")
+
+        try:
+            # 1. Stream both inputs once into hash partitions
+            total_a = self._spill(chunks_a, key_cols_a, list(mapping.keys()), prefix_a, "A")
+            total_b = self._spill(chunks_b, key_cols_b, list(mapping.values()), prefix_b, "B")
+
+            # 2. Reconcile partition pairs one at a time (equal keys always share a partition)
+            engine = ReconEngine(pd.DataFrame(), pd.DataFrame(), data_mapping=self.data_mapping)
+            matched, only_in_a, only_in_b, breaks = 0, [], [], []
+            for pid in range(self.num_partitions):
+                part_a, part_b = self._load(prefix_a, pid), self._load(prefix_b, pid)
+                if part_a.empty and part_b.empty:
+                    continue
+                common, only_a, only_b, diffs = engine.match_keyed(part_a, part_b, mapping, tolerance, accepted_matches, duplicates)
+                matched += len(common)
+                only_in_a.extend(only_a.tolist())
+                only_in_b.extend(only_b.tolist())
+                breaks.append(diffs)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+        stats = {"fast_path_cleared": engine.fast_path_cleared}
+        if duplicates != "first":
+            stats["unpaired_a"] = engine.unpaired_a
+            stats["unpaired_b"] = engine.unpaired_b
+        return ReconResult(key_col, total_a, total_b, matched, concat_breaks(breaks), only_in_a, only_in_b,
+                           plan_rows(engine.comparison_plan), stats, duplicates)
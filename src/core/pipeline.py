@@ -0,0 +1,96 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Union
+
+
+class StageTimer:
+    """Start/end of each stage of one run, relative to the start of the run (stages may overlap)."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.stages: List[Dict] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: Union[str, Callable[[], str]]):
+        """Times the block. name may be a callable, asked once the stage ends (e.g. the parser a read fell back to)."""
+        start = time.perf_counter() - self.origin
+        try:
+            yield
+        finally:
+            end = time.perf_counter() - self.origin
+            if callable(name):
+                name = name()
+            with self._lock:
+                self.stages.append({"stage": name, "start": round(start, 3), "end": round(end, 3),
+                                    "thread": threading.current_thread().name})
+
+    def overlap(self) -> float:
+        """Seconds saved by running stages at the same time (sum of stage times minus the time they span)."""
+        if not self.stages:
+            return 0.0
+        busy = sum(s["end"] - s["start"] for s in self.stages)
+        span = max(s["end"] for s in self.stages) - min(s["start"] for s in self.stages)
+        return max(0.0, busy - span)
+
+    def summary(self) -> str:
+        parts = [f"{s['stage']} {s['start']:.2f}-{s['end']:.2f}s" for s in sorted(self.stages, key=lambda s: s["start"])]
+        return ", ".join(parts) + f" (overlap {self.overlap():.2f}s)"
+
+
+def read_concurrently(readers: Dict[str, Callable], timer: StageTimer = None,
+                      labels: Dict[str, Callable[[], str]] = None) -> Dict[str, object]:
+    """
+    Runs the readers (e.g. {"read A": ..., "read B": ...}) in parallel threads and returns their results.
+    The CSV parser and file I/O release the GIL, so the two sides really overlap.
+    labels: stage label of a reader, worked out once it is done (default: its name).
+    """
+    timer = timer or StageTimer()
+    labels = labels or {}
+
+    def timed(name, reader):
+        with timer.stage(labels.get(name, name)):
+            return reader()
+
+    with ThreadPoolExecutor(max_workers=len(readers), thread_name_prefix="ingest") as pool:
+        futures = {name: pool.submit(timed, name, reader) for name, reader in readers.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+class ReportWriter:
+    """
+    One background thread that writes reports, so the caller can start on the next pair while
+    openpyxl is still busy. flush() waits for everything submitted so far.
+    """
+
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-writer")
+        self._pending: Dict[str, Future] = {}
+
+    def submit(self, write: Callable, output_path: str, timer: StageTimer = None) -> Future:
+        timer = timer or StageTimer()
+
+        def job():
+            with timer.stage("report"):
+                write()
+            print(f"DEBUG: Background report written: {output_path} ({timer.summary()})")
+
+        future = self._pool.submit(job)
+        self._pending[output_path] = future
+        return future
+
+    def wait(self, output_path: str) -> Optional[str]:
+        """Waits for the report of output_path if one is pending. Returns its error message or None."""
+        future = self._pending.pop(output_path, None)
+        if future is None:
+            return None
+        error = future.exception()
+        if error:
+            print(f"Warning: Report {output_path} could not be written: {error}")
+        return str(error) if error else None
+
+    def flush(self) -> Dict[str, Optional[str]]:
+        """Waits for all pending reports. Returns {output_path: error message or None}."""
+        return {path: self.wait(path) for path in list(self._pending)}
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+from src.core.compare import compare_numeric, compare_text, compare_values, to_float
+from src.core.dates import DAY_FIRST, compare_dates, infer_format
+
+# Rows looked at when profiling a column pair; the comparators stay exact on every row regardless
+PROFILE_SAMPLE_ROWS = 1000
+
+COMPARATORS = {
+    "numeric": compare_numeric,
+    "date": compare_dates,
+    "text": compare_text,
+    "mixed": compare_values,
+}
+
+DESCRIPTIONS = {
+    "numeric": "Numeric difference within tolerance",
+    "date": "Dates parsed with the inferred formats and compared as dates",
+    "text": "Case-insensitive text, '/' = '-'",
+    "mixed": "Numeric where both parse, text otherwise",
+}
+
+
+def _profile(values: np.ndarray) -> Optional[Tuple[bool, bool]]:
+    """(all_numeric, any_numeric) over the non-null cells of a sample, None if there are none."""
+    sample = values[:PROFILE_SAMPLE_ROWS]
+    if sample.dtype.kind in "biuf":
+        return True, True
+    sample = sample[~pd.isna(sample)]
+    if len(sample) == 0:
+        return None
+    parsed, _ = to_float(sample)
+    return bool(parsed.all()), bool(parsed.any())
+
+
+def side_format(side, column: str, values: np.ndarray, schema: Tuple[str, ...] = (), formats: Dict = None) -> Optional[Dict]:
+    """
+    Date format of one side's column (see infer_format). formats holds the choices of the current run
+    per (side, column, schema), so every partition, shard and block reads the column the same way.
+    """
+    key = (side, column, tuple(schema))
+    if formats is not None and key in formats:
+        return formats[key]
+    info = infer_format(values, (column, tuple(schema)))
+    if formats is not None:
+        formats[key] = info
+    return info
+
+
+def pin_formats(side: str, column: str, values: np.ndarray, schema: Tuple[str, ...], formats: Dict) -> Optional[Dict]:
+    """side_format for a column whose sample profiles as text; numeric columns never get a date comparator."""
+    profile = _profile(values)
+    if profile is None or profile[1]:
+        return None
+    return side_format(side, column, values, schema, formats)
+
+
+def infer_step(col_a: str, col_b: str, values_a: np.ndarray, values_b: np.ndarray,
+               schema_a: Tuple[str, ...] = (), schema_b: Tuple[str, ...] = (), formats: Dict = None,
+               sides: Tuple = ("A", "B")) -> Dict:
+    """Picks the comparator for one mapped column pair from a profile of both sides."""
+    step = {"column_a": col_a, "column_b": col_b}
+    profile_a, profile_b = _profile(values_a), _profile(values_b)
+    if profile_a is None and profile_b is None:
+        step["comparator"] = "mixed"
+        return step
+    # An all-empty side takes the profile of the other one
+    all_num_a, any_num_a = profile_a or profile_b
+    all_num_b, any_num_b = profile_b or profile_a
+    if all_num_a and all_num_b:
+        step["comparator"] = "numeric"
+    elif any_num_a or any_num_b:
+        step["comparator"] = "mixed"
+    else:
+        step["comparator"] = "text"
+        # Each side's format comes from its own values, never from how well A and B agree
+        info_a = side_format(sides[0], col_a, values_a, schema_a, formats)
+        info_b = side_format(sides[1], col_b, values_b, schema_b, formats)
+        if info_a and info_b:
+            step["comparator"] = "date"
+            step["format_a"], step["format_b"] = info_a["format"], info_b["format"]
+            step["ambiguous_a"], step["ambiguous_b"] = info_a["ambiguous_with"], info_b["ambiguous_with"]
+    return step
+
+
+def build_plan(columns: List[Tuple[str, str, np.ndarray, np.ndarray]], global_tol: float,
+               column_tolerances: Dict[str, float], schema_a: Tuple[str, ...] = (), schema_b: Tuple[str, ...] = (),
+               formats: Dict = None, sides: Tuple = ("A", "B")) -> List[Dict]:
+    """
+    One entry per (col_a, col_b, values_a, values_b): which comparator runs and with what tolerance.
+    schema_a/schema_b (the column layouts of both files) key the inferred date formats; formats
+    keeps the ones already chosen in this run, per side name in sides (see side_format).
+    """
+    plan = []
+    for col_a, col_b, values_a, values_b in columns:
+        step = infer_step(col_a, col_b, values_a, values_b, schema_a, schema_b, formats, sides)
+        step["tolerance"] = float(column_tolerances.get(col_a, global_tol))
+        plan.append(step)
+    return plan
+
+
+def execute_step(step: Dict, values_a: np.ndarray, values_b: np.ndarray) -> np.ndarray:
+    """Runs one plan entry over aligned cells and returns its break mask."""
+    if step["comparator"] == "date":
+        return compare_dates(values_a, values_b, step["tolerance"], step["format_a"], step["format_b"])
+    return COMPARATORS[step["comparator"]](values_a, values_b, step["tolerance"])
+
+
+def merge_plans(plan: Dict[str, Dict], steps: List[Dict]) -> Dict[str, Dict]:
+    """Folds the plan of one block/shard into the running plan; columns profiled differently become mixed."""
+    for step in steps:
+        current = plan.get(step["column_a"])
+        if current is None:
+            plan[step["column_a"]] = dict(step)
+        elif current["comparator"] != step["comparator"] or current.get("format_a") != step.get("format_a") \
+                or current.get("format_b") != step.get("format_b"):
+            current["comparator"] = "mixed"
+            for field in ("format_a", "format_b", "ambiguous_a", "ambiguous_b"):
+                current.pop(field, None)
+    return plan
+
+
+def _date_rule(step: Dict) -> str:
+    rule = f" ({step['format_a']} vs {step['format_b']})"
+    guessed = [side for side in ("a", "b") if step.get(f"ambiguous_{side}")]
+    if guessed:
+        order = "day-first" if DAY_FIRST else "month-first"
+        rule += f", {' and '.join(s.upper() for s in guessed)} taken as {order} (no day above 12)"
+    return rule
+
+
+def plan_rows(plan: Dict[str, Dict]) -> List[Dict]:
+    """Report-friendly view of a plan."""
+    return [{
+        "Source A Column": step["column_a"],
+        "Source B Column": step["column_b"],
+        "Comparator": step["comparator"],
+        "Tolerance": step["tolerance"] if step["comparator"] in ("numeric", "mixed") else "",
+        "Rule": DESCRIPTIONS[step["comparator"]] + (_date_rule(step) if step["comparator"] == "date" else ""),
+    } for step in plan.values()]
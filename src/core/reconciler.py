@@ -1,147 +1,408 @@
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from src.core.batch import POOL_CONTEXT
 from typing import Dict, List, Optional, Tuple, Any
+from src.core.keys import GROUP_KEY_SEPARATOR, build_match_keys, partition_ids
+from src.core.aggregate import aggregate_measures, align_groups, measure_values, rounded_totals
+from src.core.compare import compare_numeric
+from src.core.duplicates import DUPLICATE_MODES, occurrence_rank, pair_rows
+from src.core.plan import build_plan, execute_step, merge_plans, pin_formats, plan_rows
+from src.core.fingerprint import value_row_hashes
+from src.core.result import ReconResult, concat_breaks, empty_breaks
+from src.core.translation import TranslationTable
 
 class ReconEngine:
     """The core logic for comparing two datasets (Group A and Group B)."""
     
-    def __init__(self, df_a: pd.DataFrame, df_b: pd.DataFrame, data_mapping: Dict[str, Dict[str, str]] = None):
-        self.df_a = df_a.copy()
-        self.df_b = df_b.copy()
-        self.data_mapping = data_mapping or {}
-        
-        # Pre-process: strip column names
-        self.df_a.columns = [str(c).strip() for c in self.df_a.columns]
-        self.df_b.columns = [str(c).strip() for c in self.df_b.columns]
-
-    def _apply_data_mapping(self, val, col_name):
-        """Applies user-defined translation for a specific column."""
-        if col_name in self.data_mapping:
-            mapping = self.data_mapping[col_name]
-            str_val = str(val).strip()
-            if str_val in mapping:
-                return mapping[str_val]
-        return val
-
-    def reconcile(self, key_col: str, mapping: Dict[str, str], tolerance: Any = 0.01, accepted_matches: set = None) -> Dict:
+    def __init__(self, df_a: pd.DataFrame, df_b: pd.DataFrame, data_mapping: Dict[str, Dict[str, str]] = None,
+                 translations: TranslationTable = None, copy: bool = False):
         """
-        Executes reconciliation based on a unique key and column mapping.
+        The inputs are used as read-only views (pandas Copy-on-Write): nothing is copied up front and only
+        the derived key columns are materialized. copy=True keeps private deep copies (the old behaviour).
         """
-        accepted_matches = accepted_matches or set()
+        self.copy = copy
+        self.df_a = _strip_columns(df_a.copy() if copy else df_a)
+        self.df_b = _strip_columns(df_b.copy() if copy else df_b)
+        self.translations = translations or TranslationTable.from_dict(data_mapping or {})
+        self.data_mapping = self.translations.load()
+        self.fast_path_cleared = 0
+        self.comparison_plan = {}
+        # Date format chosen per (column, schema) in this run, shared by all partitions/shards/blocks
+        self.date_formats = {}
+        # Comparison plan fixed by an earlier run (incremental reconciliation), by A column
+        self.pinned_plan = None
+        self.unpaired_a, self.unpaired_b = [], []
+
+    def _compare_aligned(self, a_first: pd.DataFrame, rows_a: np.ndarray, b_first: pd.DataFrame, rows_b: np.ndarray,
+                         common_keys: pd.Index, mapping: Dict[str, str], global_tol: float,
+                         column_tolerances: Dict[str, float], accepted_matches: set, occurrences: np.ndarray = None) -> pd.DataFrame:
+        """
+        Vectorized cell comparison of the aligned rows (rows_a[i] in A pairs with rows_b[i] in B).
+        Returns one row per broken cell (see src/core/result.py); occurrences is the 1-based rank of
+        the row within its key for duplicate-aware runs.
+        """
+        orig_idx = a_first['_orig_row_idx'].to_numpy()[rows_a]
         
-        # Handle tolerance as either a float (global) or a dict (mixed)
-        if isinstance(tolerance, dict):
-            global_tol = tolerance.get("default", 0.01)
-            column_tolerances = tolerance
+        # Group accepted (row, column) pairs by column so they become one mask per column
+        accepted_rows = {}
+        for row_idx, col in accepted_matches:
+            accepted_rows.setdefault(col, []).append(row_idx)
+        
+        columns = []
+        for col_a, col_b in mapping.items():
+            if col_a not in a_first.columns or col_b not in b_first.columns:
+                continue
+            
+            cells_a = a_first[col_a].take(rows_a)
+            cells_b = b_first[col_b].take(rows_b)
+            val_a, val_b = cells_a.to_numpy(), cells_b.to_numpy()
+            
+            # Apply Data Mapping (Translation)
+            val_a_mapped = self.translations.apply(col_a, cells_a) if col_a in self.data_mapping else val_a
+            val_b_mapped = self.translations.apply(col_b, cells_b) if col_b in self.data_mapping else val_b
+            columns.append((col_a, col_b, val_a, val_b, val_a_mapped, val_b_mapped))
+        
+        if not columns:
+            return empty_breaks()
+        
+        # Fast path: rows whose translated values hash alike on both sides cannot break
+        hash_a = value_row_hashes([c[4] for c in columns])
+        hash_b = value_row_hashes([c[5] for c in columns])
+        suspect = np.flatnonzero(hash_a != hash_b)
+        self.fast_path_cleared += len(rows_a) - len(suspect)
+        
+        # Profile each column pair once and pick its comparator (see src/core/plan.py)
+        if self.pinned_plan and all(c[0] in self.pinned_plan for c in columns):
+            steps = [self.pinned_plan[c[0]] for c in columns]
         else:
-            global_tol = float(tolerance)
-            column_tolerances = {}
+            steps = build_plan([(c[0], c[1], c[4], c[5]) for c in columns], global_tol, column_tolerances,
+                               _schema(a_first), _schema(b_first), self.date_formats)
+        if len(rows_a):
+            self.comparison_plan = merge_plans(self.comparison_plan, steps)
+        
+        keys = common_keys.to_numpy(dtype=object)
+        frames = []
+        for step, (col_a, col_b, val_a, val_b, val_a_mapped, val_b_mapped) in zip(steps, columns):
+            col_breaks = np.zeros(len(rows_a), dtype=bool)
+            col_breaks[suspect] = execute_step(step, val_a_mapped[suspect], val_b_mapped[suspect])
+            
+            # Feature: Skip if manually accepted in UI
+            if col_a in accepted_rows:
+                col_breaks &= ~np.isin(orig_idx, accepted_rows[col_a])
+            
+            # Only the broken cells are kept, with their raw (untranslated) values
+            rows = np.flatnonzero(col_breaks)
+            if len(rows):
+                frames.append(pd.DataFrame({
+                    "_row": rows,
+                    "key": keys[rows],
+                    "occurrence": occurrences[rows] if occurrences is not None else np.ones(len(rows), dtype=np.int64),
+                    "column": col_a,
+                    "val_a": _as_objects(val_a[rows]),
+                    "val_b": _as_objects(val_b[rows]),
+                }))
+        
+        if not frames:
+            return empty_breaks()
+        # Row order first, mapping order within a row
+        breaks = pd.concat(frames, ignore_index=True).sort_values("_row", kind="stable")
+        return breaks.drop(columns="_row").reset_index(drop=True)
 
-        # 1. Preparation: Handle asymmetric composite keys
+    @staticmethod
+    def split_tolerance(tolerance: Any) -> Tuple[float, Dict[str, float]]:
+        """Handle tolerance as either a float (global) or a dict (mixed)."""
+        if isinstance(tolerance, dict):
+            return tolerance.get("default", 0.01), tolerance
+        return float(tolerance), {}
+
+    @staticmethod
+    def resolve_key_columns(key_col: str, mapping: Dict[str, str]) -> Tuple[List[str], List[str]]:
+        """Handle asymmetric composite keys: returns the key parts for A and for B."""
         if key_col in mapping:
             # Explicit full-key mapping (e.g. "FirstName+LastName" -> "FullName")
-            key_cols_a = key_col.split("+")
-            key_cols_b = mapping[key_col].split("+")
-        else:
-            # Component-level mapping (e.g. "FullName" -> "FirstName+LastName")
-            key_cols_a = key_col.split("+")
-            key_cols_b = []
-            for k in key_cols_a:
-                mapped = mapping.get(k, k)
-                key_cols_b.extend(mapped.split("+"))
-
-        def normalize_key(v):
-            if pd.isna(v): return "nan"
-            try:
-                f_val = float(v)
-                if f_val == int(f_val): return str(int(f_val)).strip()
-                return str(f_val).strip()
-            except:
-                return str(v).strip()
+            return key_col.split("+"), mapping[key_col].split("+")
+        
+        # Component-level mapping (e.g. "FullName" -> "FirstName+LastName")
+        key_cols_a = key_col.split("+")
+        key_cols_b = []
+        for k in key_cols_a:
+            mapped = mapping.get(k, k)
+            key_cols_b.extend(mapped.split("+"))
+        return key_cols_a, key_cols_b
+
+    def prepare_work_frames(self, key_col: str, mapping: Dict[str, str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Returns working frames of A and B carrying '_match_key' (and '_orig_row_idx' on A).
+        They are projections of the key and mapped columns that share data with the inputs;
+        only the two derived columns are new memory.
+        """
+        # 1. Preparation: Handle asymmetric composite keys
+        key_cols_a, key_cols_b = self.resolve_key_columns(key_col, mapping)
 
         # 2. Index Data for fast lookup
-        df_a_work = self.df_a.copy()
-        df_a_work['_orig_row_idx'] = range(len(df_a_work))
+        if self.copy:
+            df_a_work, df_b_work = self.df_a.copy(), self.df_b.copy()
+        else:
+            df_a_work = _project(self.df_a, key_cols_a + list(mapping.keys()))
+            df_b_work = _project(self.df_b, key_cols_b + list(mapping.values()))
+        df_a_work['_orig_row_idx'] = np.arange(len(df_a_work))
+
+        # Generate match key for A and B (normalized column by column, see src/core/keys.py)
+        df_a_work['_match_key'] = build_match_keys(df_a_work, key_cols_a)
+        df_b_work['_match_key'] = build_match_keys(df_b_work, key_cols_b)
+        return df_a_work, df_b_work
+
+    def pin_date_formats(self, df_a_work: pd.DataFrame, df_b_work: pd.DataFrame, mapping: Dict[str, str]):
+        """Chooses the date format of every mapped text column from all rows of its own side, before matching."""
+        for group, df, cols in [("A", df_a_work, mapping.keys()), ("B", df_b_work, mapping.values())]:
+            schema = _schema(df)
+            for col in cols:
+                if col in df.columns:
+                    values = self.translations.apply(col, df[col]) if col in self.data_mapping else df[col].to_numpy()
+                    pin_formats(group, col, values, schema, self.date_formats)
+
+    def _mapped_columns(self, df_a: pd.DataFrame, df_b: pd.DataFrame, mapping: Dict[str, str]) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """Translated mapped values of every row of A and of B, column pair by column pair."""
+        pairs = [(a, b) for a, b in mapping.items() if a in df_a.columns and b in df_b.columns]
+        cols_a = [self.translations.apply(a, df_a[a]) if a in self.data_mapping else df_a[a].to_numpy() for a, _ in pairs]
+        cols_b = [self.translations.apply(b, df_b[b]) if b in self.data_mapping else df_b[b].to_numpy() for _, b in pairs]
+        return cols_a, cols_b
+
+    def match_keyed(self, df_a_work: pd.DataFrame, df_b_work: pd.DataFrame, mapping: Dict[str, str],
+                    tolerance: Any = 0.01, accepted_matches: set = None, duplicates: str = "first") -> Tuple[pd.Index, pd.Index, pd.Index, pd.DataFrame]:
+        """
+        Matches and compares two frames that already carry '_match_key' (and '_orig_row_idx' on A).
+        Returns (common_keys, only_in_a, only_in_b, breaks).
+        With duplicates="rank"/"best_fit" every row takes part (see src/core/duplicates.py); rows of a key
+        present on both sides that found no partner are added to self.unpaired_a / self.unpaired_b.
+        """
+        accepted_matches = accepted_matches or set()
+        global_tol, column_tolerances = self.split_tolerance(tolerance)
+        
+        if duplicates not in DUPLICATE_MODES:
+            raise ValueError(f"Unknown duplicate mode '{duplicates}', expected one of {DUPLICATE_MODES}")
+        
+        if duplicates == "first":
+            # Drop duplicates in index to prevent the 'getting stuck' or expansion issue
+            a_first = df_a_work.drop_duplicates(subset=['_match_key'])
+            b_first = df_b_work.drop_duplicates(subset=['_match_key'])
+            
+            # Align A and B on the match key in a single hash join
+            keys_a = pd.Index(a_first['_match_key'].to_numpy(dtype=object))
+            keys_b = pd.Index(b_first['_match_key'].to_numpy(dtype=object))
+            pos_b = keys_b.get_indexer(keys_a)
+            in_b = pos_b >= 0
+            
+            common_keys = keys_a[in_b]
+            only_in_a = keys_a[~in_b]
+            only_in_b = keys_b[~keys_b.isin(keys_a)]
+            rows_a, rows_b, occurrences = np.flatnonzero(in_b), pos_b[in_b], None
+        else:
+            # Every row takes part: pair occurrences within each key
+            a_first, b_first = df_a_work, df_b_work
+            keys_a = a_first['_match_key'].to_numpy(dtype=object)
+            keys_b = b_first['_match_key'].to_numpy(dtype=object)
+            columns = self._mapped_columns(a_first, b_first, mapping) if duplicates == "best_fit" else (None, None)
+            rows_a, rows_b = pair_rows(keys_a, keys_b, *columns)
+            
+            paired_a = np.zeros(len(keys_a), dtype=bool)
+            paired_a[rows_a] = True
+            paired_b = np.zeros(len(keys_b), dtype=bool)
+            paired_b[rows_b] = True
+            key_in_b = pd.Index(keys_a).isin(keys_b)
+            key_in_a = pd.Index(keys_b).isin(keys_a)
+            
+            common_keys = pd.Index(keys_a[rows_a])
+            only_in_a = pd.Index(keys_a[~key_in_b]).unique()
+            only_in_b = pd.Index(keys_b[~key_in_a]).unique()
+            self.unpaired_a.extend(keys_a[~paired_a & key_in_b].tolist())
+            self.unpaired_b.extend(keys_b[~paired_b & key_in_a].tolist())
+            occurrences = occurrence_rank([keys_a])[rows_a] + 1
         
-        def build_key(row, cols):
-            # Concatenate normalized parts and remove spaces to ensure asymmetric matching 
-            # (e.g. File A "John Smith" matches File B "John" + "Smith")
-            return "".join([normalize_key(row[c]).replace(" ", "") for c in cols if c in row.index])
+        # Compare column by column
+        breaks = self._compare_aligned(
+            a_first, rows_a, b_first, rows_b, common_keys,
+            mapping, global_tol, column_tolerances, accepted_matches, occurrences
+        )
+        return common_keys, only_in_a, only_in_b, breaks
 
-        # Generate match key for A and B
-        df_a_work['_match_key'] = df_a_work.apply(lambda row: build_key(row, key_cols_a), axis=1)
+    def _match_parallel(self, df_a_work: pd.DataFrame, df_b_work: pd.DataFrame, mapping: Dict[str, str],
+                        tolerance: Any, accepted_matches: set, workers: int, duplicates: str = "first") -> Tuple[int, List, List, pd.DataFrame]:
+        """Splits A and B into key-hash shards and matches/compares them in a process pool."""
+        # Only the columns the comparison needs are shipped to the workers
+        cols_a = [c for c in dict.fromkeys(list(mapping.keys()) + ['_match_key', '_orig_row_idx']) if c in df_a_work.columns]
+        cols_b = [c for c in dict.fromkeys(list(mapping.values()) + ['_match_key']) if c in df_b_work.columns]
+        shard_a = partition_ids(df_a_work['_match_key'], workers)
+        shard_b = partition_ids(df_b_work['_match_key'], workers)
         
-        df_b_work = self.df_b.copy()
-        df_b_work['_match_key'] = df_b_work.apply(lambda row: build_key(row, key_cols_b), axis=1)
+        matched, only_in_a, only_in_b, breaks = 0, [], [], []
+        # Spawned workers (see POOL_CONTEXT): reconcile() also runs from the desktop app's worker QThread
+        with ProcessPoolExecutor(max_workers=workers, mp_context=POOL_CONTEXT) as pool:
+            futures = [
+                pool.submit(_reconcile_shard, df_a_work.loc[shard_a == i, cols_a], df_b_work.loc[shard_b == i, cols_b],
+                            mapping, tolerance, accepted_matches, self.data_mapping, duplicates, self.date_formats)
+                for i in range(workers)
+            ]
+            for future in futures:
+                shard = future.result()
+                matched += shard["matched"]
+                only_in_a.extend(shard["only_in_a"])
+                only_in_b.extend(shard["only_in_b"])
+                breaks.append(shard["breaks"])
+                self.fast_path_cleared += shard["fast_path_cleared"]
+                self.comparison_plan = merge_plans(self.comparison_plan, list(shard["plan"].values()))
+                self.unpaired_a.extend(shard["unpaired_a"])
+                self.unpaired_b.extend(shard["unpaired_b"])
+        return matched, only_in_a, only_in_b, concat_breaks(breaks)
+
+    def reconcile(self, key_col: str, mapping: Dict[str, str], tolerance: Any = 0.01, accepted_matches: set = None,
+                  workers: int = 1, duplicates: str = "first") -> ReconResult:
+        """
+        Executes reconciliation based on a unique key and column mapping.
+        With workers > 1 the rows are split by key hash and shards are compared in parallel processes.
+        duplicates="rank"/"best_fit" pairs repeated keys instead of keeping only their first row.
+        The ReconResult still reads like the old {"summary", "detail", "plan", "key_name"} dict.
+        """
+        self.fast_path_cleared = 0
+        self.comparison_plan = {}
+        self.date_formats = {}
+        self.unpaired_a, self.unpaired_b = [], []
         
-        # Drop duplicates in index to prevent the 'getting stuck' or expansion issue
-        a_indexed = df_a_work.drop_duplicates(subset=['_match_key']).set_index('_match_key')
-        b_indexed = df_b_work.drop_duplicates(subset=['_match_key']).set_index('_match_key')
+        # 1-2. Key both sides
+        df_a_work, df_b_work = self.prepare_work_frames(key_col, mapping)
+        self.pin_date_formats(df_a_work, df_b_work, mapping)
         
-        keys_a = set(a_indexed.index)
-        keys_b = set(b_indexed.index)
+        # 3. Match keys and compare cell-by-cell
+        if workers and workers > 1:
+            matched, only_in_a, only_in_b, breaks = self._match_parallel(
+                df_a_work, df_b_work, mapping, tolerance, accepted_matches, workers, duplicates
+            )
+        else:
+            common_keys, only_in_a, only_in_b, breaks = self.match_keyed(
+                df_a_work, df_b_work, mapping, tolerance=tolerance, accepted_matches=accepted_matches, duplicates=duplicates
+            )
+            matched = len(common_keys)
+
+        stats = {"fast_path_cleared": self.fast_path_cleared}
+        if duplicates != "first":
+            stats["unpaired_a"] = self.unpaired_a
+            stats["unpaired_b"] = self.unpaired_b
+        return ReconResult(key_col, len(self.df_a), len(self.df_b), matched, breaks, only_in_a, only_in_b,
+                           plan_rows(self.comparison_plan), stats, duplicates)
+
+    def reconcile_aggregate(self, group_col: str, measures: List[str], mapping: Dict[str, str], tolerance: Any = 0.01,
+                            accepted_matches: set = None, drill_down_key: str = None) -> ReconResult:
+        """
+        Aggregate (netting) reconciliation: sums the measures per group on both sides (e.g. Notional per
+        "Book+Trade Currency") and compares the totals with the usual global/per-column tolerances.
+        Group keys are normalized like match keys with their parts joined by " | "; the result has one "row" per group.
+        With drill_down_key the rows of the groups that break or exist on one side only are also
+        reconciled row by row on that key (result.drill_down).
+        """
+        global_tol, column_tolerances = self.split_tolerance(tolerance)
+        self.fast_path_cleared = 0
+        self.comparison_plan = {}
+        self.date_formats = {}
         
-        common_keys = keys_a & keys_b
-        only_in_a = keys_a - keys_b
-        only_in_b = keys_b - keys_a
+        # 1. Group key of every row on both sides
+        group_cols_a, group_cols_b = self.resolve_key_columns(group_col, mapping)
+        pairs = [(m, mapping.get(m, m)) for m in measures]
+        for group, df, cols in [("A", self.df_a, group_cols_a + [m for m, _ in pairs]), ("B", self.df_b, group_cols_b + [m for _, m in pairs])]:
+            for c in cols:
+                if c not in df.columns:
+                    raise ValueError(f"Aggregate column '{c}' not found in Group {group}")
+        # Part by part when both sides split the group alike, else (e.g. "Book+Ccy" -> "BookCcy") concatenated
+        separator = GROUP_KEY_SEPARATOR if len(group_cols_a) == len(group_cols_b) else ""
+        groups_a = build_match_keys(self.df_a, group_cols_a, separator).to_numpy(dtype=object)
+        groups_b = build_match_keys(self.df_b, group_cols_b, separator).to_numpy(dtype=object)
         
-        # 3. Compare Cell-by-Cell
-        mismatches = []
+        # 2. Vectorized group sums (B measures are labelled with their A names so the totals line up)
+        totals_a = aggregate_measures(groups_a, {m: measure_values(self.df_a[m].to_numpy(), m, "A") for m, _ in pairs})
+        totals_b = aggregate_measures(groups_b, {m: measure_values(self.df_b[mb].to_numpy(), mb, "B") for m, mb in pairs})
+        aligned = align_groups(totals_a, totals_b)
+        rows_a, rows_b = aligned["rows_a"], aligned["rows_b"]
+        keys = totals_a.index.to_numpy(dtype=object)[rows_a]
         
-        for key in common_keys:
-            row_a = a_indexed.loc[key]
-            row_b = b_indexed.loc[key]
-            orig_idx = int(row_a['_orig_row_idx'])
-            
-            row_diffs = {}
-            for col_a, col_b in mapping.items():
-                if col_a in row_a.index and col_b in row_b.index:
-                    # Feature: Skip if manually accepted in UI
-                    if (orig_idx, col_a) in accepted_matches:
-                        continue
-                        
-                    val_a = row_a[col_a]
-                    val_b = row_b[col_b]
-                    
-                    # Apply Data Mapping (Translation)
-                    val_a_mapped = self._apply_data_mapping(val_a, col_a)
-                    val_b_mapped = self._apply_data_mapping(val_b, col_b)
-
-                    # Handle nulls
-                    if pd.isna(val_a_mapped) and pd.isna(val_b_mapped):
-                        continue
-                    
-                    # Numerical comparison with tolerance
-                    try:
-                        num_a, num_b = float(val_a_mapped), float(val_b_mapped)
-                        
-                        # Fetch column-specific tolerance or fallback to global
-                        tol = column_tolerances.get(col_a, global_tol)
-                        
-                        if abs(num_a - num_b) > tol:
-                            row_diffs[col_a] = {"val_a": val_a, "val_b": val_b}
-                        continue
-                    except:
-                        pass
-                    
-                    # String comparison (Case-Insensitive)
-                    str_a, str_b = str(val_a_mapped).strip(), str(val_b_mapped).strip()
-                    if str_a.lower() != str_b.lower():
-                        # Check for 'logical match' (date formats etc)
-                        if str_a.replace("/", "-").lower() != str_b.replace("/", "-").lower():
-                            row_diffs[col_a] = {"val_a": val_a, "val_b": val_b}
-            
-            if row_diffs:
-                mismatches.append({"key": key, "differences": row_diffs})
-
-        return {
-            "summary": {
-                "total_a": len(self.df_a),
-                "total_b": len(self.df_b),
-                "matched": len(common_keys),
-                "mismatches": len(mismatches),
-                "only_in_a": list(only_in_a),
-                "only_in_b": list(only_in_b)
-            },
-            "detail": mismatches,
-            "key_name": key_col
-        }
+        # 3. Compare the totals measure by measure
+        frames = []
+        for measure, measure_b in pairs:
+            tol = float(column_tolerances.get(measure, global_tol))
+            self.comparison_plan[measure] = {"column_a": measure, "column_b": measure_b, "comparator": "numeric", "tolerance": tol}
+            sums_a, sums_b = totals_a[measure].to_numpy()[rows_a], totals_b[measure].to_numpy()[rows_b]
+            broken = np.flatnonzero(compare_numeric(sums_a, sums_b, tol))
+            if len(broken):
+                frames.append(pd.DataFrame({
+                    "_row": broken,
+                    "key": keys[broken],
+                    "occurrence": np.ones(len(broken), dtype=np.int64),
+                    "column": measure,
+                    "val_a": pd.Series(rounded_totals(sums_a[broken]), dtype=object),
+                    "val_b": pd.Series(rounded_totals(sums_b[broken]), dtype=object),
+                }))
+        breaks = concat_breaks(frames)
+        if len(breaks):
+            breaks = breaks.sort_values("_row", kind="stable").drop(columns="_row").reset_index(drop=True)
+        
+        stats = {"rows_aggregated_a": len(self.df_a), "rows_aggregated_b": len(self.df_b)}
+        result = ReconResult(group_col, len(totals_a), len(totals_b), len(rows_a), breaks, aligned["only_in_a"],
+                             aligned["only_in_b"], plan_rows(self.comparison_plan), stats)
+        
+        # 4. Optional row-level drill-down into the groups that did not reconcile
+        if drill_down_key:
+            suspect = np.concatenate([breaks["key"].to_numpy(dtype=object), aligned["only_in_a"], aligned["only_in_b"]])
+            in_a, in_b = pd.Index(groups_a).isin(suspect), pd.Index(groups_b).isin(suspect)
+            self.comparison_plan = {}
+            df_a_work, df_b_work = self.prepare_work_frames(drill_down_key, mapping)
+            common, only_a, only_b, row_breaks = self.match_keyed(df_a_work[in_a], df_b_work[in_b], mapping,
+                                                                  tolerance=tolerance, accepted_matches=accepted_matches)
+            result.drill_down = ReconResult(drill_down_key, int(in_a.sum()), int(in_b.sum()), len(common), row_breaks,
+                                            only_a, only_b, plan_rows(self.comparison_plan),
+                                            {"fast_path_cleared": self.fast_path_cleared, "groups_drilled": len(set(suspect))})
+        return result
+
+
+def _strip_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Strips column names without touching the data (and without renaming the caller's frame)."""
+    stripped = [str(c).strip() for c in df.columns]
+    if stripped == list(df.columns):
+        return df
+    return df.set_axis(stripped, axis=1)
+
+
+def _schema(df: pd.DataFrame) -> Tuple[str, ...]:
+    """Column layout of a (work) frame without the derived '_' columns; keys the inferred date formats."""
+    return tuple(c for c in df.columns if not str(c).startswith('_'))
+
+
+def _project(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Lazy (Copy-on-Write) selection of the given columns that exist in df, in first-seen order."""
+    return df[[c for c in dict.fromkeys(columns) if c in df.columns]]
+
+
+def _as_objects(values: np.ndarray) -> np.ndarray:
+    """Object array of the cells as numpy scalars (what the old per-row dicts held)."""
+    if values.dtype == object:
+        return values
+    out = np.empty(len(values), dtype=object)
+    out[:] = list(values)
+    return out
+
+
+def _reconcile_shard(shard_a: pd.DataFrame, shard_b: pd.DataFrame, mapping: Dict[str, str], tolerance: Any,
+                     accepted_matches: set, data_mapping: Dict[str, Dict[str, str]], duplicates: str = "first",
+                     date_formats: Dict = None) -> Dict:
+    """Process pool entry point: matches and compares one key-hash shard (with the date formats chosen on the whole input)."""
+    engine = ReconEngine(pd.DataFrame(), pd.DataFrame(), data_mapping=data_mapping)
+    engine.date_formats = dict(date_formats or {})
+    common_keys, only_in_a, only_in_b, breaks = engine.match_keyed(shard_a, shard_b, mapping, tolerance, accepted_matches, duplicates)
+    return {
+        "matched": len(common_keys),
+        "only_in_a": only_in_a.tolist(),
+        "only_in_b": only_in_b.tolist(),
+        "breaks": breaks,
+        "fast_path_cleared": engine.fast_path_cleared,
+        "plan": engine.comparison_plan,
+        "unpaired_a": engine.unpaired_a,
+        "unpaired_b": engine.unpaired_b,
+    }
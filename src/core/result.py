@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+# Status codes of the rows in ReconResult.exceptions
+VALUE_BREAK = "VALUE BREAK"
+MISSING_IN_B = "MISSING IN B"
+MISSING_IN_A = "MISSING IN A"
+UNPAIRED_IN_A = "UNPAIRED DUPLICATE IN A"
+UNPAIRED_IN_B = "UNPAIRED DUPLICATE IN B"
+STATUSES = [VALUE_BREAK, MISSING_IN_B, MISSING_IN_A, UNPAIRED_IN_A, UNPAIRED_IN_B]
+
+BREAK_COLUMNS = ["key", "occurrence", "column", "val_a", "val_b"]
+
+
+def empty_breaks() -> pd.DataFrame:
+    return pd.DataFrame({
+        "key": pd.Series(dtype=object),
+        "occurrence": pd.Series(dtype=np.int64),
+        "column": pd.Series(dtype=object),
+        "val_a": pd.Series(dtype=object),
+        "val_b": pd.Series(dtype=object),
+    })
+
+
+def concat_breaks(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    frames = [f for f in frames if len(f)]
+    if not frames:
+        return empty_breaks()
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0].reset_index(drop=True)
+
+
+def count_broken_rows(breaks: pd.DataFrame) -> int:
+    """Number of matched row pairs with at least one break (a pair is a key + occurrence)."""
+    if breaks.empty:
+        return 0
+    return int((~breaks.duplicated(subset=["key", "occurrence"])).sum())
+
+
+class ReconResult(Mapping):
+    """
+    Columnar outcome of a reconciliation.
+    Cell breaks live in one DataFrame (one row per broken cell, column names dictionary-encoded as a
+    categorical) and orphan keys in arrays, instead of millions of small dicts and lists.
+    For older callers it still behaves like the {"summary", "detail", "plan", "key_name"} dict;
+    those views are only built when they are first read.
+    """
+
+    def __init__(self, key_name: str, total_a: int, total_b: int, matched: int, breaks: pd.DataFrame = None,
+                 only_in_a: Any = (), only_in_b: Any = (), plan: List[Dict] = None, stats: Dict[str, Any] = None,
+                 duplicates: str = "first"):
+        self.key_name = key_name
+        self.total_a = int(total_a)
+        self.total_b = int(total_b)
+        self.matched = int(matched)
+        breaks = breaks if breaks is not None else empty_breaks()
+        # assign() returns a new frame: the caller's breaks keep their own column dtype
+        self.breaks = breaks.assign(column=breaks["column"].astype("category"))
+        self.only_in_a = np.asarray(only_in_a, dtype=object)
+        self.only_in_b = np.asarray(only_in_b, dtype=object)
+        self.plan = plan or []
+        # Optional counters/lists (fast_path_cleared, unpaired_a/b, changed_since_last_run, probable_matches...)
+        self.stats = stats or {}
+        self.duplicates = duplicates
+        self.mismatches = count_broken_rows(self.breaks)
+        # Row-level result of the breaking groups of an aggregate run (ReconEngine.reconcile_aggregate)
+        self.drill_down: Optional["ReconResult"] = None
+        self._views = {}
+
+    def set_stat(self, name: str, value: Any):
+        """Attaches an extra counter/list (e.g. probable_matches) after the run."""
+        self.stats[name] = value
+        self._views.pop("summary", None)
+
+    @property
+    def exceptions(self) -> pd.DataFrame:
+        """Every exception as one status-coded row: value breaks, then missing and unpaired keys."""
+        parts = [self.breaks.assign(status=VALUE_BREAK)]
+        for status, keys in [(MISSING_IN_B, self.only_in_a), (MISSING_IN_A, self.only_in_b),
+                             (UNPAIRED_IN_A, self.stats.get("unpaired_a", [])), (UNPAIRED_IN_B, self.stats.get("unpaired_b", []))]:
+            if len(keys):
+                parts.append(pd.DataFrame({"key": np.asarray(keys, dtype=object), "status": status}))
+        frame = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+        frame["status"] = pd.Categorical(frame["status"], categories=STATUSES)
+        return frame[["key", "occurrence", "status", "column", "val_a", "val_b"]]
+
+    def _summary(self) -> Dict[str, Any]:
+        summary = {
+            "total_a": self.total_a,
+            "total_b": self.total_b,
+            "matched": self.matched,
+            "mismatches": self.mismatches,
+            "only_in_a": self.only_in_a.tolist(),
+            "only_in_b": self.only_in_b.tolist(),
+        }
+        for name, value in self.stats.items():
+            summary[name] = list(value) if isinstance(value, np.ndarray) else value
+        return summary
+
+    def _detail(self) -> List[Dict]:
+        detail, index = [], {}
+        breaks = self.breaks
+        for key, occurrence, column, val_a, val_b in zip(breaks["key"], breaks["occurrence"], breaks["column"],
+                                                         breaks["val_a"], breaks["val_b"]):
+            item = index.get((key, occurrence))
+            if item is None:
+                item = {"key": key, "differences": {}}
+                if self.duplicates != "first":
+                    item["occurrence"] = int(occurrence)
+                index[(key, occurrence)] = item
+                detail.append(item)
+            item["differences"][column] = {"val_a": val_a, "val_b": val_b}
+        return detail
+
+    def __getitem__(self, name: str):
+        if name not in self._views:
+            if name == "summary":
+                self._views[name] = self._summary()
+            elif name == "detail":
+                self._views[name] = self._detail()
+            elif name == "plan":
+                return self.plan
+            elif name == "key_name":
+                return self.key_name
+            else:
+                raise KeyError(name)
+        return self._views[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(["summary", "detail", "plan", "key_name"])
+
+    def __len__(self) -> int:
+        return 4
+
+    @classmethod
+    def from_dict(cls, recon_data: Dict) -> "ReconResult":
+        """Builds a result from the historical nested-dict structure."""
+        if isinstance(recon_data, ReconResult):
+            return recon_data
+        summary = dict(recon_data.get("summary", {}))
+        rows = []
+        for item in recon_data.get("detail", []):
+            for column, diff in item["differences"].items():
+                rows.append((item["key"], item.get("occurrence", 1), column, diff.get("val_a"), diff.get("val_b")))
+        breaks = pd.DataFrame(rows, columns=BREAK_COLUMNS).astype({"key": object, "val_a": object, "val_b": object}) if rows else None
+        core = {k: summary.pop(k, None) for k in ["total_a", "total_b", "matched", "mismatches", "only_in_a", "only_in_b"]}
+        return cls(recon_data.get("key_name", "Unique Record ID"), core["total_a"] or 0, core["total_b"] or 0, core["matched"] or 0,
+                   breaks, core["only_in_a"] or [], core["only_in_b"] or [], recon_data.get("plan"), summary,
+                   "rank" if any("occurrence" in item for item in recon_data.get("detail", [])) else "first")
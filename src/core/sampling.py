@@ -0,0 +1,157 @@
+import math
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.core.keys import build_match_keys
+from src.core.reconciler import ReconEngine
+from src.core.result import concat_breaks, count_broken_rows
+
+# Key-hash buckets the sample fraction is expressed in (0.05 = the first 500 buckets)
+SAMPLE_BUCKETS = 10000
+
+# Two-sided 95% normal quantile for the Wilson intervals
+Z_95 = 1.959964
+
+# Breaks returned with a quick check so the operator can see what kind of breaks they are
+MAX_SAMPLE_BREAKS = 50
+
+
+def sample_mask(keys: pd.Series, fraction: float) -> np.ndarray:
+    """
+    Deterministic key-hash sample: a key is in or out no matter which file or chunk it comes from,
+    so both sides sample the same keys and two runs sample the same rows.
+    """
+    buckets = pd.util.hash_array(np.asarray(keys, dtype=object)) % np.uint64(SAMPLE_BUCKETS)
+    return buckets < np.uint64(max(1, round(fraction * SAMPLE_BUCKETS)))
+
+
+def wilson_interval(successes: int, n: int, z: float = Z_95) -> Tuple[float, float]:
+    """Wilson score interval of a proportion (stays inside 0..1 even for tiny samples or 0/100% rates)."""
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    centre = (p + z * z / (2 * n)) / (1 + z * z / n)
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+class QuickChecker:
+    """
+    Fast "is this pair clean?" estimate ahead of a full run.
+    Both inputs are streamed chunk by chunk and only the rows of sampled keys (key and mapped columns)
+    are kept. Keys seen on both sides are compared as soon as they meet, so with max_breaks the run
+    stops reading as soon as enough breaks were found.
+    """
+
+    def __init__(self, data_mapping: Dict[str, Dict[str, str]] = None, sample_fraction: float = 0.05,
+                 max_breaks: Optional[int] = None):
+        self.data_mapping = data_mapping or {}
+        self.sample_fraction = min(1.0, max(1.0 / SAMPLE_BUCKETS, float(sample_fraction)))
+        self.max_breaks = max_breaks
+
+    def _sampled_chunks(self, chunks: Iterable[pd.DataFrame], key_cols: List[str], keep_cols: List[str],
+                        group: str, counter: Dict[str, int]) -> Iterator[pd.DataFrame]:
+        """Keyed, projected rows of the sampled keys of every chunk (counter["rows"] counts rows read)."""
+        for chunk in chunks:
+            chunk.columns = [str(c).strip() for c in chunk.columns]
+            for k in key_cols:
+                if k not in chunk.columns:
+                    raise ValueError(f"Primary Key part '{k}' not found in Group {group}")
+            cols = list(dict.fromkeys(c for c in key_cols + keep_cols if c in chunk.columns))
+            part = chunk[cols]
+            offset = counter["rows"]
+            counter["rows"] += len(part)
+
+            keys = build_match_keys(part, key_cols)
+            keep = sample_mask(keys, self.sample_fraction)
+            part = part[keep]
+            if group == "A":
+                part['_orig_row_idx'] = np.arange(offset, offset + len(keep))[keep]
+            part['_match_key'] = keys[keep]
+            yield part
+
+    def check(self, chunks_a: Iterable[pd.DataFrame], chunks_b: Iterable[pd.DataFrame], key_col: str,
+              mapping: Dict[str, str], tolerance: Any = 0.01, accepted_matches: set = None) -> Dict[str, Any]:
+        """
+        Reconciles the sampled keys (first row per key, like the default full run) and returns the
+        estimated match and break rates with 95% confidence intervals plus a few sample breaks.
+        "complete" is False when the run stopped at max_breaks; rates then cover the compared keys only.
+        """
+        key_cols_a, key_cols_b = ReconEngine.resolve_key_columns(key_col, mapping)
+        read_a, read_b = {"rows": 0}, {"rows": 0}
+        source_a = self._sampled_chunks(chunks_a, key_cols_a, list(mapping.keys()), "A", read_a)
+        source_b = self._sampled_chunks(chunks_b, key_cols_b, list(mapping.values()), "B", read_b)
+        engine = ReconEngine(pd.DataFrame(), pd.DataFrame(), data_mapping=self.data_mapping)
+
+        pending_a = pd.DataFrame({'_match_key': pd.Series(dtype=object), '_orig_row_idx': pd.Series(dtype=np.int64)})
+        pending_b = pd.DataFrame({'_match_key': pd.Series(dtype=object)})
+        seen_a, seen_b = set(), set()
+        done_a = done_b = False
+        compared, breaks, broken = 0, [], 0
+
+        while not (done_a and done_b):
+            # 1. Pull the next chunk of each side, keeping the first row of every sampled key
+            if not done_a:
+                part = next(source_a, None)
+                if part is None:
+                    done_a = True
+                else:
+                    part = part.drop_duplicates(subset=['_match_key'])
+                    part = part[~part['_match_key'].isin(seen_a)]
+                    seen_a.update(part['_match_key'])
+                    pending_a = pd.concat([pending_a, part], ignore_index=True) if len(pending_a) else part
+            if not done_b:
+                part = next(source_b, None)
+                if part is None:
+                    done_b = True
+                else:
+                    part = part.drop_duplicates(subset=['_match_key'])
+                    part = part[~part['_match_key'].isin(seen_b)]
+                    seen_b.update(part['_match_key'])
+                    pending_b = pd.concat([pending_b, part], ignore_index=True) if len(pending_b) else part
+
+            # 2. Compare the keys that have now been seen on both sides
+            met_a = pending_a['_match_key'].isin(pending_b['_match_key'])
+            if met_a.any():
+                met_b = pending_b['_match_key'].isin(pending_a['_match_key'])
+                common, _, _, block_breaks = engine.match_keyed(pending_a[met_a], pending_b[met_b], mapping,
+                                                                tolerance, accepted_matches)
+                compared += len(common)
+                breaks.append(block_breaks)
+                broken += count_broken_rows(block_breaks)
+                pending_a, pending_b = pending_a[~met_a], pending_b[~met_b]
+
+            # 3. Early exit: enough breaks to call the pair broken
+            if self.max_breaks and broken >= self.max_breaks:
+                break
+
+        complete = done_a and done_b
+        breaks = concat_breaks(breaks)
+        clean = compared - broken
+        # Once both files are read, unmatched sampled keys of A are orphans and count against the match rate
+        sampled_a = compared + len(pending_a) if complete else compared
+        match_rate_ci = wilson_interval(clean, sampled_a)
+        break_rate_ci = wilson_interval(broken, compared)
+
+        result = {
+            "sample_fraction": self.sample_fraction,
+            "complete": complete,
+            "rows_read_a": read_a["rows"],
+            "rows_read_b": read_b["rows"],
+            "compared": compared,
+            "mismatches": broken,
+            "match_rate": clean / sampled_a if sampled_a else 0.0,
+            "match_rate_ci": match_rate_ci,
+            "break_rate": broken / compared if compared else 0.0,
+            "break_rate_ci": break_rate_ci,
+            "sample_breaks": [
+                {"key": key, "column": column, "val_a": str(val_a), "val_b": str(val_b)}
+                for key, column, val_a, val_b in breaks[["key", "column", "val_a", "val_b"]].head(MAX_SAMPLE_BREAKS).itertuples(index=False)
+            ],
+        }
+        if complete:
+            result["only_in_a"] = len(pending_a)
+            result["only_in_b"] = len(pending_b)
+            result["estimated_mismatches"] = int(round(broken / self.sample_fraction))
+        return result
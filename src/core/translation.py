@@ -0,0 +1,66 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+
+from src.core.compare import translate
+
+DEFAULT_MAPPING_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "data_mapping.csv")
+
+
+class TranslationTable:
+    """
+    User-defined value translations (e.g. SGP = Singapore) from data/data_mapping.csv.
+    The file is parsed once and re-read only when its modification time changes, so the
+    engine and the UI can share one instance across runs.
+    """
+
+    def __init__(self, mapping_file: str = DEFAULT_MAPPING_FILE):
+        self.mapping_file = mapping_file
+        self._tables = {}
+        self._mtime = None
+
+    @classmethod
+    def from_dict(cls, tables: Dict[str, Dict[str, str]]) -> "TranslationTable":
+        """In-memory table (no backing file), e.g. for engines created by tests or workers."""
+        table = cls(mapping_file=None)
+        table._tables = tables or {}
+        return table
+
+    def load(self) -> Dict[str, Dict[str, str]]:
+        """Returns {column: {source value: target value}}, reloading the file if it changed."""
+        if not self.mapping_file:
+            return self._tables
+        try:
+            mtime = os.path.getmtime(self.mapping_file)
+        except OSError:
+            self._tables, self._mtime = {}, None
+            return self._tables
+        if mtime == self._mtime:
+            return self._tables
+
+        tables = {}
+        try:
+            map_df = pd.read_csv(self.mapping_file)
+            cols, srcs, tgts = (map_df[c].map(str).str.strip() for c in ['Column', 'Source Value', 'Target Value'])
+            for col, src, tgt in zip(cols, srcs, tgts):
+                tables.setdefault(col, {})[src] = tgt
+        except Exception as e:
+            print(f"Warning: Could not load data_mapping.csv: {e}")
+        self._tables, self._mtime = tables, mtime
+        return self._tables
+
+    def get(self, col_name: str) -> Optional[Dict[str, str]]:
+        return self.load().get(col_name)
+
+    def apply(self, col_name: str, column: pd.Series) -> np.ndarray:
+        """Translated cells of a whole column (categoricals are translated once per category)."""
+        translations = self.get(col_name)
+        if translations and isinstance(column.dtype, pd.CategoricalDtype):
+            categories = translate(column.cat.categories.to_numpy(dtype=object), translations)
+            codes = column.cat.codes.to_numpy()
+            out = np.asarray(categories, dtype=object).take(codes)
+            if (codes < 0).any():
+                out[codes < 0] = translate(column.to_numpy(dtype=object)[codes < 0], translations)
+            return out
+        return translate(column.to_numpy(), translations)
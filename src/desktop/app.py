@@ -6,7 +6,7 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
                              QComboBox, QGroupBox, QListWidget, QDialog, QProgressBar,
                              QTabWidget, QSplitter, QFrame, QGraphicsOpacityEffect,
-                             QListWidgetItem)
+                             QListWidgetItem, QCheckBox)
 from PySide6.QtCore import Qt, QThread, Signal, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QColor, QIcon, QPixmap, QFont
 
@@ -48,6 +48,7 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from src.core.coordinator import ReconCoordinator
+from src.core.batch import default_concurrency
 from src.desktop.login import LoginScreen, SplashScreen
 from src.desktop.admin import AdminPortal
 from src.core.database import DatabaseManager
@@ -213,14 +214,14 @@ class CustomPrimaryKeyDialog(QDialog):
         return [item.text() for item in self.column_list.selectedItems()]
 
 class ComparisonView(QDialog):
-    def __init__(self, df_a, df_b, mapping, key_col=None, parent=None, accepted_logical_matches=None):
+    def __init__(self, df_a, df_b, mapping, key_col=None, parent=None, accepted_logical_matches=None, translations=None):
         super().__init__(parent)
         self.setWindowTitle("Aura - Intelligent Delta View")
         self.setMinimumSize(1200, 800)
         self.layout = QVBoxLayout(self)
         
         self.accepted_logical_matches = accepted_logical_matches if accepted_logical_matches is not None else set()
-        self.data_mapping = {} # Store translations
+        self.data_mapping = translations.load() if translations else {} # Store translations
         
         controls_layout = QHBoxLayout()
         info_icon = QLabel("ℹ")
@@ -544,38 +545,38 @@ class FileListWidget(QWidget):
 
 class ReconWorker(QThread):
     progress = Signal(int)
+    pair_finished = Signal(int, int, dict)
     finished = Signal(list)
     error = Signal(str)
 
-    def __init__(self, coordinator, files_a, files_b, key_col, mapping, db, user_id, tolerance, accepted_matches, auto_map=False):
+    def __init__(self, coordinator, files_a, files_b, key_col, mapping, db, user_id, tolerance, accepted_matches, auto_map=False, workers=1, duplicates="first", fuzzy=False, concurrency=1):
         super().__init__()
         self.coordinator = coordinator; self.files_a = files_a; self.files_b = files_b
         self.key_col = key_col; self.mapping = mapping; self.db = db
         self.user_id = user_id; self.tolerance = tolerance; self.accepted_matches = accepted_matches
-        self.auto_map = auto_map
+        self.auto_map = auto_map; self.workers = workers; self.duplicates = duplicates; self.fuzzy = fuzzy
+        self.concurrency = concurrency
+
+    def on_pair_done(self, done, total, outcome):
+        # Called after every pair (pool results arrive in completion order)
+        self.db.log_recon(self.user_id, outcome["file_a"], outcome["file_b"], outcome["status"], outcome["output"] if outcome["status"] == "SUCCESS" else outcome.get("error", ""))
+        if outcome["status"] != "SUCCESS":
+            with open('error_log_app.txt', 'a') as f:
+                f.write(outcome.get("traceback", outcome.get("error", "")) + "\n")
+        self.pair_finished.emit(done, total, outcome)
+        self.progress.emit(int((done / total) * 100))
 
     def run(self):
-        results = []
         try:
-            for i, file_a in enumerate(self.files_a):
-                if i < len(self.files_b):
-                    file_b = self.files_b[i]
-                    output_path = f"Recon_Report_{os.path.basename(file_a)}.xlsx"
-                    
-                    current_key = self.key_col
-                    current_mapping = self.mapping
-                    
-                    if self.auto_map:
-                        df_a = self.coordinator.get_handler(file_a).read(file_a)
-                        df_b = self.coordinator.get_handler(file_b).read(file_b)
-                        current_key = self.coordinator.mapper.suggest_primary_key(df_a)
-                        current_mapping = self.coordinator.mapper.suggest_mapping(df_a.columns.tolist(), df_b.columns.tolist())
-
-                    self.coordinator.run_full_recon(file_a, file_b, current_key, current_mapping, output_path, self.tolerance, self.accepted_matches)
-                    self.db.log_recon(self.user_id, file_a, file_b, "SUCCESS", output_path)
-                    results.append(output_path)
-                self.progress.emit(int(((i + 1) / len(self.files_a)) * 100))
-            self.finished.emit(results)
+            pairs = list(zip(self.files_a, self.files_b))
+            outcomes = self.coordinator.run_batch(
+                pairs, self.key_col, self.mapping, concurrency=self.concurrency, auto_map=self.auto_map, on_progress=self.on_pair_done,
+                tolerance=self.tolerance, accepted_matches=self.accepted_matches, workers=self.workers, duplicates=self.duplicates, fuzzy=self.fuzzy
+            )
+            if len(outcomes) == 1 and outcomes[0]["status"] != "SUCCESS":
+                self.error.emit(outcomes[0]["error"])
+                return
+            self.finished.emit(outcomes)
         except Exception as e: 
             import traceback
             err_msg = traceback.format_exc()
@@ -707,6 +708,11 @@ class ReconApp(QMainWindow):
         self.btn_local_tol.setStyleSheet("background-color: #555; font-size: 10px; font-weight: bold;")
         key_row.addWidget(self.btn_local_tol)
 
+        key_row.addSpacing(20); key_row.addWidget(QLabel("WORKERS:")); self.combo_workers = QComboBox(); self.combo_workers.addItems(["1", "2", "4", "8"]); self.combo_workers.setEditable(True); self.combo_workers.setFixedWidth(60); self.combo_workers.setCurrentText("1"); key_row.addWidget(self.combo_workers)
+        key_row.addSpacing(20); key_row.addWidget(QLabel("PARALLEL PAIRS:")); self.combo_concurrency = QComboBox(); self.combo_concurrency.addItems(["1", "2", "4", "8"]); self.combo_concurrency.setEditable(True); self.combo_concurrency.setFixedWidth(60); self.combo_concurrency.setCurrentText(str(default_concurrency())); key_row.addWidget(self.combo_concurrency)
+        key_row.addSpacing(20); key_row.addWidget(QLabel("DUPLICATES:")); self.combo_duplicates = QComboBox(); self.combo_duplicates.addItems(["first", "rank", "best_fit"]); self.combo_duplicates.setFixedWidth(90); key_row.addWidget(self.combo_duplicates)
+        key_row.addSpacing(20); self.chk_fuzzy = QCheckBox("FUZZY ORPHANS"); key_row.addWidget(self.chk_fuzzy)
+
         key_row.addStretch(); config_layout.addLayout(key_row)
 
         self.mapping_table = QTableWidget(0, 3); self.mapping_table.setHorizontalHeaderLabels(["SOURCE (A)", "TARGET (B)", "STATUS"]); self.mapping_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch); config_layout.addWidget(self.mapping_table)
@@ -832,8 +838,8 @@ class ReconApp(QMainWindow):
         if idx >= len(self.files_a) or idx >= len(self.files_b): return
         
         try:
-            self.current_df_a = self.coordinator.get_handler(self.files_a[idx]).read(self.files_a[idx])
-            self.current_df_b = self.coordinator.get_handler(self.files_b[idx]).read(self.files_b[idx])
+            self.current_df_a = self.coordinator.read_file(self.files_a[idx])
+            self.current_df_b = self.coordinator.read_file(self.files_b[idx])
             
             if self.current_df_a.empty:
                 QMessageBox.warning(self, "Warning", "Source A file appears to be empty or contains no readable tables.")
@@ -910,25 +916,32 @@ class ReconApp(QMainWindow):
                 m[ca] = cb
         return m
 
+    def get_worker_count(self):
+        try: return max(1, int(self.combo_workers.currentText()))
+        except: return 1
+
+    def get_concurrency(self):
+        try: return max(1, int(self.combo_concurrency.currentText()))
+        except: return 1
+
+    def show_pair_progress(self, done, total, outcome):
+        failed = getattr(self, "batch_failed", 0) + (outcome["status"] != "SUCCESS")
+        self.batch_failed = failed
+        self.progress_bar.setFormat(f"%p%  -  {done}/{total} pairs" + (f" ({failed} failed)" if failed else ""))
+
+    def on_global_finished(self, outcomes):
+        self.progress_bar.hide(); self.progress_bar.setFormat("%p%")
+        self.btn_reconcile.setEnabled(True); self.btn_reconcile_global.setEnabled(True)
+        failed = [o for o in outcomes if o["status"] != "SUCCESS"]
+        if not failed:
+            QMessageBox.information(self, "Aura", f"Global Process Complete. {len(outcomes)} pairs reconciled.")
+            return
+        details = "\n".join(f"{os.path.basename(o['file_a'])}: {o.get('error', '')}" for o in failed[:15])
+        QMessageBox.warning(self, "Aura", f"Global Process Complete. {len(outcomes) - len(failed)} of {len(outcomes)} pairs reconciled, {len(failed)} failed:\n\n{details}")
+
     def open_comparison_view(self):
-        view = ComparisonView(self.current_df_a, self.current_df_b, self.get_current_mapping(), self.combo_key.currentText(), self, set(self.accepted_logical_matches))
-        
-        # Apply Data Mapping to the Comparison View
-        map_file = os.path.join(project_root, "data", "data_mapping.csv")
-        if os.path.exists(map_file):
-            try:
-                map_df = pd.read_csv(map_file)
-                data_map_dict = {}
-                for _, row in map_df.iterrows():
-                    col = str(row['Column']).strip()
-                    src = str(row['Source Value']).strip()
-                    tgt = str(row['Target Value']).strip()
-                    if col not in data_map_dict: data_map_dict[col] = {}
-                    data_map_dict[col][src] = tgt
-                view.data_mapping = data_map_dict
-                # Refresh view with mapping
-                view.populate_and_compare(self.current_df_a, self.current_df_b, self.get_current_mapping(), self.combo_key.currentText())
-            except: pass
+        # Data Mapping comes from the coordinator's shared translation table
+        view = ComparisonView(self.current_df_a, self.current_df_b, self.get_current_mapping(), self.combo_key.currentText(), self, set(self.accepted_logical_matches), translations=self.coordinator.translations)
 
         if view.exec() == QDialog.Accepted:
             self.accepted_logical_matches = view.accepted_logical_matches
@@ -955,9 +968,12 @@ class ReconApp(QMainWindow):
         self.btn_reconcile.setEnabled(False)
         self.btn_reconcile_global.setEnabled(False)
         
-        self.worker = ReconWorker(self.coordinator, paired_files_a, paired_files_b, self.combo_key.currentText(), mapping, self.db, self.user_info['id'], full_tolerances, self.accepted_logical_matches, auto_map=True)
+        self.batch_failed = 0
+        self.progress_bar.setValue(0)
+        self.worker = ReconWorker(self.coordinator, paired_files_a, paired_files_b, self.combo_key.currentText(), mapping, self.db, self.user_info['id'], full_tolerances, self.accepted_logical_matches, auto_map=True, workers=self.get_worker_count(), duplicates=self.combo_duplicates.currentText(), fuzzy=self.chk_fuzzy.isChecked(), concurrency=self.get_concurrency())
         self.worker.progress.connect(self.progress_bar.setValue)
-        self.worker.finished.connect(lambda: (self.progress_bar.hide(), self.btn_reconcile.setEnabled(True), self.btn_reconcile_global.setEnabled(True), QMessageBox.information(self, "Aura", "Global Process Complete.")))
+        self.worker.pair_finished.connect(self.show_pair_progress)
+        self.worker.finished.connect(self.on_global_finished)
         self.worker.error.connect(lambda e: (self.progress_bar.hide(), self.btn_reconcile.setEnabled(True), self.btn_reconcile_global.setEnabled(True), QMessageBox.critical(self, "Error", e)))
         self.worker.start()
 
@@ -979,7 +995,7 @@ class ReconApp(QMainWindow):
         selected_file_b = [self.files_b[idx]]
 
         self.progress_bar.show(); self.btn_reconcile.setEnabled(False)
-        self.worker = ReconWorker(self.coordinator, selected_file_a, selected_file_b, self.combo_key.currentText(), mapping, self.db, self.user_info['id'], full_tolerances, self.accepted_logical_matches, auto_map=False)
+        self.worker = ReconWorker(self.coordinator, selected_file_a, selected_file_b, self.combo_key.currentText(), mapping, self.db, self.user_info['id'], full_tolerances, self.accepted_logical_matches, auto_map=False, workers=self.get_worker_count(), duplicates=self.combo_duplicates.currentText(), fuzzy=self.chk_fuzzy.isChecked())
         self.worker.progress.connect(self.progress_bar.setValue)
         self.worker.finished.connect(lambda: (self.progress_bar.hide(), self.btn_reconcile.setEnabled(True), QMessageBox.information(self, "Aura", "Process Complete.")))
         self.worker.error.connect(lambda e: (self.progress_bar.hide(), self.btn_reconcile.setEnabled(True), QMessageBox.critical(self, "Error", e)))
@@ -1,24 +1,134 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
+from typing import Callable, Iterator, List, Optional
 
 class BaseHandler(ABC):
     """Abstract base class for all file ingestion handlers."""
+
+    # False when read(columns=...) still has to parse the whole file (projection after the fact)
+    native_projection = True
+
+    # Bump when read()/clean_data() start producing different frames for the same file:
+    # part of the ingestion cache key, so cached frames of the old rules are not served
+    cache_version = 2
     
     @abstractmethod
-    def read(self, file_path: str) -> pd.DataFrame:
-        """Read the file and return a standardized DataFrame."""
+    def read(self, file_path: str, columns: List[str] = None) -> pd.DataFrame:
+        """
+        Read the file and return a standardized DataFrame.
+        columns: only return these columns (names as they are after header stripping); names the
+        file does not have are ignored, so the caller's own "not found" checks still apply.
+        """
         pass
 
-    def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Generic cleaning: trim whitespace, handle NaN, etc."""
+    def cache_tag(self) -> str:
+        """Handler, rules version and settings a parsed frame depends on (see IngestionCache)."""
+        return f"{type(self).__name__}/v{self.cache_version}/{getattr(self, 'engine', '')}"
+
+    def engine_for(self, file_path: str) -> str:
+        """Name of the parser read() uses for file_path (shown in the stage timings)."""
+        return type(self).__name__.replace("Handler", "").lower()
+
+    def read_chunks(self, file_path: str, chunksize: int, columns: List[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        Streams the file as cleaned DataFrames of at most `chunksize` rows (same columns as read()).
+        Handlers that can stream override this; the default reads the file whole and slices it.
+        """
+        df = self.read(file_path, columns=columns)
+        for start in range(0, max(len(df), 1), chunksize):
+            yield df.iloc[start:start + chunksize]
+
+    @staticmethod
+    def column_filter(columns: List[str] = None) -> Optional[Callable[[str], bool]]:
+        """usecols callable for pandas readers: matches header names after stripping (None reads everything)."""
+        if columns is None:
+            return None
+        wanted = {str(c).strip() for c in columns}
+        return lambda c: str(c).strip() in wanted
+
+    @staticmethod
+    def project(df: pd.DataFrame, columns: List[str] = None) -> pd.DataFrame:
+        """Projection after the fact, for readers without native column selection."""
+        if columns is None:
+            return df
+        wanted = {str(c).strip() for c in columns}
+        return df[[c for c in df.columns if str(c).strip() in wanted]]
+
+    def clean_data(self, df: pd.DataFrame, source: str = None) -> pd.DataFrame:
+        """
+        Generic cleaning: trim headers and text, keep nulls and types, compact the memory.
+        Only real strings are stripped (NaN stays NaN instead of becoming "nan", numbers stay numbers),
+        repetitive text columns (currency, book, status...) become categoricals and integer columns
+        are downcast. Floats keep float64 so no value changes. With `source` the memory saved is printed.
+        """
+        before = estimate_memory(df) if source else 0
+
         # Clean headers first
         df.columns = [str(c).strip() for c in df.columns]
-        
-        # Strip whitespace from string columns
-        for col in df.select_dtypes(include=['object']).columns:
-            df[col] = df[col].astype(str).str.strip()
-            
+
+        # By position: PDF/Excel headers can repeat
+        for i in range(df.shape[1]):
+            series = df.iloc[:, i]
+            if pd.api.types.is_integer_dtype(series.dtype):
+                df.isetitem(i, pd.to_numeric(series, downcast='integer'))
+            elif pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+                df.isetitem(i, _clean_text(series))
+
         # Optional: Drop completely empty rows or columns if needed
         # df = df.dropna(how='all').dropna(axis=1, how='all')
-        
+
+        if source:
+            after = estimate_memory(df)
+            print(f"DEBUG: Cleaned {source}: ~{before / 1048576:.1f} MB -> ~{after / 1048576:.1f} MB "
+                  f"(saved ~{(before - after) / 1048576:.1f} MB)")
         return df
+
+
+# Rows measured by estimate_memory (exact deep sizes of every Python string take seconds on big files)
+MEMORY_SAMPLE_ROWS = 10000
+# Text columns with at most this share of distinct values are stored as categoricals
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+# Below this many rows a categorical saves nothing worth its overhead
+CATEGORY_MIN_ROWS = 1000
+
+
+def estimate_memory(df: pd.DataFrame) -> int:
+    """Bytes held by df; object/str cells are measured on evenly spaced sample rows and scaled up."""
+    if len(df) <= MEMORY_SAMPLE_ROWS:
+        return int(df.memory_usage(deep=True).sum())
+    sample = df.iloc[np.linspace(0, len(df) - 1, MEMORY_SAMPLE_ROWS).astype(np.int64)]
+    shallow = df.memory_usage(deep=False, index=False).to_numpy()
+    deep = sample.memory_usage(deep=True, index=False).to_numpy() * (len(df) / MEMORY_SAMPLE_ROWS)
+    # Fixed-width columns are exact already, only the per-object sizes are estimated
+    objects = np.array([dtype == object or pd.api.types.is_string_dtype(dtype) for dtype in df.dtypes], dtype=bool)
+    return int(np.where(objects, deep, shallow).sum() + df.index.memory_usage())
+
+
+def _clean_text(series: pd.Series) -> pd.Series:
+    """Strips the string cells of a text/mixed column (other cells untouched) and categorizes it if repetitive."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    # is_string_dtype() is also True for object columns, so test the dtype itself: mixed object columns
+    # (Excel ids/amounts) must only have their str cells stripped, .str would turn the rest into NaN
+    if pd.api.types.is_object_dtype(series.dtype):
+        values = series.to_numpy(dtype=object)
+        kind = pd.api.types.infer_dtype(values, skipna=True)
+        if kind in ("mixed", "mixed-integer"):
+            is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+            if is_str.any():
+                values = values.copy()
+                values[is_str] = pd.Series(values[is_str], dtype=object).str.strip().to_numpy(dtype=object)
+                series = pd.Series(values, index=series.index, name=series.name, dtype=object)
+            return series
+        if kind != "string":
+            return series
+
+    # Text repeats a lot: strip every distinct value once
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    if len(series) < CATEGORY_MIN_ROWS or len(uniques) > len(series) * CATEGORY_MAX_UNIQUE_RATIO:
+        return series.str.strip()
+    # Stripping can merge values (" EUR" and "EUR"), so the stripped values are factorized again (sorted categories)
+    stripped_codes, categories = pd.factorize(pd.Index(uniques).str.strip(), sort=True)
+    codes = np.where(codes >= 0, stripped_codes.take(np.maximum(codes, 0)), -1)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=series.index, name=series.name)
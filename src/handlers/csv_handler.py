@@ -1,20 +1,113 @@
+import csv
 import pandas as pd
+from typing import Dict, List, Optional
 from .base_handler import BaseHandler
 
+try:
+    import pyarrow  # noqa: F401  (enables engine="pyarrow")
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Bytes sniffed for delimiter/quoting/encoding (enough for a few dozen lines of a wide feed)
+SNIFF_BYTES = 64 * 1024
+SNIFF_DELIMITERS = ",;\t|"
+
+
 class CSVHandler(BaseHandler):
     """Handler for CSV files."""
-    
-    def read(self, file_path: str) -> pd.DataFrame:
-        """Reads a CSV file with automatic delimiter detection."""
+
+    def __init__(self, engine: str = "c"):
+        # "c" (default) or "pyarrow" (multi-threaded, when installed) for the sniffed fast path
+        self.engine = engine if engine != "pyarrow" or HAS_PYARROW else "c"
+        # Parser each file was last read with, after any fallback to the Python parser
+        self.engines: Dict[str, str] = {}
+
+    def engine_for(self, file_path: str) -> str:
+        """Parser the last read of file_path actually used ("python" after a fallback), else the configured engine."""
+        return self.engines.get(file_path, self.engine)
+
+    def sniff(self, file_path: str) -> Optional[Dict]:
+        """
+        Detects encoding, delimiter and quoting from the first SNIFF_BYTES of the file.
+        Returns read_csv arguments, or None when the sample gives no clear dialect.
+        """
+        with open(file_path, 'rb') as f:
+            sample = f.read(SNIFF_BYTES)
+        if not sample:
+            return None
+
+        if sample.startswith(b'\xef\xbb\xbf'):
+            encoding = 'utf-8-sig'
+        else:
+            encoding = 'utf-8'
+        try:
+            text = sample.decode(encoding)
+        except UnicodeDecodeError as e:
+            cut_off = len(sample) == SNIFF_BYTES and len(sample) - e.start <= 4
+            if not cut_off:
+                # Not a multi-byte character cut off by the sample boundary: legacy Windows export
+                encoding = 'cp1252'
+            text = sample.decode(encoding, errors='ignore')
+
+        lines = text.splitlines()
+        if len(sample) == SNIFF_BYTES and len(lines) > 1:
+            lines = lines[:-1]  # last line is probably cut off
+        try:
+            dialect = csv.Sniffer().sniff("\n".join(lines), delimiters=SNIFF_DELIMITERS)
+        except csv.Error:
+            return None
+        return {
+            "sep": dialect.delimiter,
+            "quotechar": dialect.quotechar,
+            "doublequote": dialect.doublequote,
+            "escapechar": dialect.escapechar,
+            "skipinitialspace": dialect.skipinitialspace,
+            "encoding": encoding,
+        }
+
+    def _read_args(self, file_path: str, chunked: bool = False, columns: List[str] = None) -> Dict:
+        """read_csv arguments: the sniffed dialect on the C/pyarrow parser, else the slow Python sniffing engine."""
+        usecols = self.column_filter(columns)
+        dialect = self.sniff(file_path)
+        if dialect is None:
+            print(f"DEBUG: Could not sniff the dialect of {file_path}, using the Python parser")
+            return {"sep": None, "engine": 'python', "usecols": usecols}
+        # pyarrow has no chunked reader, no callable usecols and no escapechar/skipinitialspace support
+        if (self.engine == "pyarrow" and not chunked and usecols is None and dialect["escapechar"] is None
+                and not dialect["skipinitialspace"]):
+            dialect.pop("escapechar")
+            dialect.pop("skipinitialspace")
+            return dict(dialect, engine='pyarrow')
+        # round_trip parses floats exactly like the Python engine did (same values in reports and results)
+        return dict(dialect, engine='c', float_precision='round_trip', usecols=usecols)
+
+    def read(self, file_path: str, columns: List[str] = None) -> pd.DataFrame:
+        """Reads a CSV file with automatic delimiter detection (only `columns` when given)."""
         try:
-            # First, read a few lines to inspect the delimiter and headers
-            with open(file_path, 'r') as f:
-                first_line = f.readline()
-                print(f"DEBUG: First line of {file_path}: {repr(first_line)}")
-            
-            # engine='python' allows for better delimiter sniffing
-            df = pd.read_csv(file_path, sep=None, engine='python')
+            args = self._read_args(file_path, columns=columns)
+            try:
+                df = pd.read_csv(file_path, **args)
+            except (pd.errors.ParserError, UnicodeDecodeError) as e:
+                if args["engine"] == 'python':
+                    raise
+                # Sample looked fine but the rest of the file does not fit the sniffed dialect
+                print(f"Warning: Fast CSV parse of {file_path} failed ({e}), retrying with the Python parser")
+                df = pd.read_csv(file_path, sep=None, engine='python', usecols=self.column_filter(columns))
+                args["engine"] = 'python'
+            self.engines[file_path] = args["engine"]
             print(f"DEBUG: Columns found: {df.columns.tolist()}")
-            return self.clean_data(df)
+            return self.clean_data(df, source=file_path)
+        except Exception as e:
+            raise Exception(f"Error reading CSV file {file_path}: {e}")
+
+    def read_chunks(self, file_path: str, chunksize: int, columns: List[str] = None):
+        """Streams a CSV file as cleaned DataFrame chunks of at most `chunksize` rows."""
+        try:
+            args = self._read_args(file_path, chunked=True, columns=columns)
+            self.engines[file_path] = args["engine"]
+            reader = pd.read_csv(file_path, chunksize=chunksize, **args)
+            for chunk in reader:
+                yield self.clean_data(chunk)
         except Exception as e:
             raise Exception(f"Error reading CSV file {file_path}: {e}")
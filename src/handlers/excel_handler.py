@@ -1,14 +1,140 @@
+import os
+import numpy as np
 import pandas as pd
+from pandas.io.parsers import TextParser
+from typing import Iterator, List
 from .base_handler import BaseHandler
 
+try:
+    import python_calamine  # noqa: F401  (enables engine="calamine")
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+# Workbooks our own streaming reader handles (everything else goes through pd.read_excel)
+STREAMABLE_EXTENSIONS = ('.xlsx', '.xlsm')
+
+
 class ExcelHandler(BaseHandler):
     """Handler for Excel files (.xlsx, .xls)."""
-    
-    def read(self, file_path: str, sheet_name: str = 0) -> pd.DataFrame:
-        """Reads an Excel file and returns a cleaned DataFrame."""
+
+    def __init__(self, engine: str = "auto"):
+        # "auto", "calamine" (Rust reader, when installed), "openpyxl" (streaming reader) or "pandas" (plain pd.read_excel)
+        self.engine = engine
+
+    def engine_for(self, file_path: str) -> str:
+        """
+        Reader used for file_path. auto: calamine when installed (several times faster than openpyxl),
+        else the openpyxl streaming reader for .xlsx/.xlsm, else pd.read_excel (.xls needs xlrd).
+        """
+        streamable = os.path.splitext(file_path)[1].lower() in STREAMABLE_EXTENSIONS
+        engine = self.engine
+        if engine == "auto":
+            engine = "calamine" if HAS_CALAMINE else "openpyxl"
+        if engine == "calamine" and not HAS_CALAMINE:
+            engine = "openpyxl"
+        if engine == "openpyxl" and not streamable:
+            engine = "pandas"
+        return engine
+
+    def read(self, file_path: str, sheet_name: str = 0, columns: List[str] = None, nrows: int = None) -> pd.DataFrame:
+        """Reads an Excel file and returns a cleaned DataFrame (only `columns`, at most `nrows` data rows when given)."""
+        try:
+            engine = self.engine_for(file_path)
+            if engine == "openpyxl":
+                df = next(self._stream(file_path, sheet_name, columns, nrows=nrows))
+            else:
+                df = pd.read_excel(file_path, sheet_name=sheet_name, usecols=self.column_filter(columns), nrows=nrows,
+                                   engine="calamine" if engine == "calamine" else None)
+            print(f"DEBUG: Read {os.path.basename(file_path)} with the {engine} Excel reader")
+            return self.clean_data(df, source=file_path)
+        except Exception as e:
+            raise Exception(f"Error reading Excel file {file_path}: {e}")
+
+    def read_chunks(self, file_path: str, chunksize: int, columns: List[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        Streams the first sheet of an .xlsx row by row (openpyxl read-only mode) as cleaned chunks.
+        Cells are converted and parsed the way pd.read_excel does, so the chunks add up to read()
+        (column types are inferred per chunk, like CSV chunks).
+        """
+        if os.path.splitext(file_path)[1].lower() not in STREAMABLE_EXTENSIONS:
+            # Legacy .xls has no streaming reader
+            yield from super().read_chunks(file_path, chunksize, columns)
+            return
         try:
-            # Using openpyxl as the default engine for .xlsx
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-            return self.clean_data(df)
+            for chunk in self._stream(file_path, 0, columns, chunksize=chunksize):
+                yield self.clean_data(chunk)
         except Exception as e:
             raise Exception(f"Error reading Excel file {file_path}: {e}")
+
+    def _stream(self, file_path: str, sheet_name=0, columns: List[str] = None, nrows: int = None,
+                chunksize: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Raw (uncleaned) frames of a sheet, `chunksize` data rows at a time (all in one frame without it).
+        Read-only openpyxl with values_only skips styles and cell objects; with `columns` only the
+        matching header positions are converted at all.
+        """
+        from openpyxl import load_workbook
+        book = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            sheet = book.worksheets[sheet_name] if isinstance(sheet_name, int) else book[sheet_name]
+            # Some writers store a wrong sheet size; let openpyxl find it from the rows (as pandas does)
+            sheet.reset_dimensions()
+            rows = sheet.iter_rows(values_only=True)
+            header = _trim_row([_convert_value(v) for v in next(rows, ())])
+            usecols = self.column_filter(columns)
+            positions = None
+            if usecols is not None:
+                # Superset by header text; TextParser still applies usecols to the final (de-duplicated) names
+                positions = [i for i, name in enumerate(header) if usecols(name)]
+                header = [header[i] for i in positions]
+
+            chunk, blank, taken = [], [], 0
+            for row in rows:
+                if nrows is not None and taken >= nrows:
+                    break
+                if positions is not None:
+                    row = [row[i] if i < len(row) else None for i in positions]
+                values = _trim_row([_convert_value(v) for v in row])
+                taken += 1
+                if not values:
+                    # Trailing empty rows are dropped like read_excel does; only keep them if data follows
+                    blank.append(values)
+                    continue
+                chunk += blank + [values]
+                blank = []
+                while chunksize and len(chunk) >= chunksize:
+                    yield _parse_rows(header, chunk[:chunksize], usecols)
+                    chunk = chunk[chunksize:]
+            if chunk or not chunksize:
+                yield _parse_rows(header, chunk, usecols)
+        finally:
+            book.close()
+
+
+def _convert_value(value):
+    """Cell value as pandas' openpyxl reader returns it (empty -> "", error -> NaN, whole floats -> int)."""
+    from openpyxl.cell.cell import ERROR_CODES
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        val = int(value) if np.isfinite(value) else None
+        return val if val == value else value
+    if isinstance(value, str) and value in ERROR_CODES:
+        return np.nan
+    return value
+
+
+def _trim_row(values: list) -> list:
+    while values and values[-1] == "":
+        values.pop()
+    return values
+
+
+def _parse_rows(header: list, rows: List[list], usecols) -> pd.DataFrame:
+    """Header + data rows through the same TextParser (type inference, NA handling) read_excel uses."""
+    width = max([len(header)] + [len(r) for r in rows])
+    data = [r + [""] * (width - len(r)) for r in [header] + rows]
+    if not any(data):
+        return pd.DataFrame()
+    return TextParser(data, header=0, skip_blank_lines=False, usecols=usecols).read()
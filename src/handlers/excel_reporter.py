@@ -1,10 +1,13 @@
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from openpyxl.chart import PieChart, BarChart, Reference
-from typing import Dict, List, Any
+from typing import Dict, List
 import datetime
 
+from src.core.result import ReconResult, VALUE_BREAK, MISSING_IN_A, MISSING_IN_B, UNPAIRED_IN_A, UNPAIRED_IN_B
+
 class ExcelReporter:
     """Generates professional, color-coded Excel reports based on reconciliation results with visualization."""
     
@@ -16,44 +19,68 @@ class ExcelReporter:
     WHITE_FONT = Font(color="FFFFFF", bold=True)
     BOLD_FONT = Font(bold=True)
     
-    def generate_report(self, recon_data: Dict[str, Any], output_path: str):
+    def generate_report(self, recon_data: ReconResult, output_path: str):
         """
-        Takes the dictionary from ReconEngine and writes a formatted Excel file with charts.
+        Takes the ReconResult from ReconEngine (or the older nested dict) and writes a formatted Excel file with charts.
         """
-        summary = recon_data.get("summary", {})
-        # Check if we are using a composite key
-        key_name = recon_data.get("key_name", "Unique Record ID")
+        result = ReconResult.from_dict(recon_data)
+        summary = result.stats
         
         with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
             # 1. Generate Summary Sheet
-            self._write_summary_sheet(writer, summary)
+            self._write_summary_sheet(writer, result)
+            
+            # 2. Generate Detailed Deltas Sheet (plus the row-level drill-down of an aggregate run)
+            self._write_detailed_sheet(writer, result)
+            if result.drill_down is not None:
+                self._write_detailed_sheet(writer, result.drill_down, sheet_name="Drill Down Details")
+            
+            # 3. Probable matches among the orphans (fuzzy second pass)
+            if "probable_matches" in summary:
+                self._write_probable_matches_sheet(writer, summary["probable_matches"])
             
-            # 2. Generate Detailed Deltas Sheet
-            self._write_detailed_sheet(writer, recon_data)
+            # 4. Document how each mapped column was compared
+            if result.plan:
+                self._write_plan_sheet(writer, result.plan)
             
-            # 3. Add Charts (requires direct sheet access)
-            self._add_visualizations(writer, summary)
+            # 5. Add Charts (requires direct sheet access)
+            self._add_visualizations(writer, result)
 
-    def _write_summary_sheet(self, writer, summary):
+    def _write_summary_sheet(self, writer, result: ReconResult):
         """Creates a professional dashboard-style summary sheet."""
-        total_matched = summary.get("matched", 0) - summary.get("mismatches", 0)
+        summary = result.stats
+        total_matched = result.matched - result.mismatches
+        # Aggregate runs reconcile group totals, so their "rows" are groups
+        unit = "Groups" if "rows_aggregated_a" in summary else "Rows"
         
         summary_data = [
             ["Reconciliation Summary Report", ""],
             ["Generated At:", datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
             ["", ""],
             ["Dataset Overview", ""],
-            ["Total Rows (Source A)", summary.get("total_a")],
-            ["Total Rows (Source B)", summary.get("total_b")],
+            [f"Total {unit} (Source A)", result.total_a],
+            [f"Total {unit} (Source B)", result.total_b],
             ["", ""],
             ["Reconciliation Results", ""],
             ["Perfect Matches", total_matched],
-            ["Data Mismatches", summary.get("mismatches")],
-            ["Missing in Source B (A only)", len(summary.get("only_in_a", []))],
-            ["Missing in Source A (B only)", len(summary.get("only_in_b", []))],
+            ["Data Mismatches", result.mismatches],
+            ["Missing in Source B (A only)", len(result.only_in_a)],
+            ["Missing in Source A (B only)", len(result.only_in_b)],
             ["", ""],
-            ["Match Rate", f"{(total_matched / max(summary.get('total_a', 1), 1) * 100):.2f}%"]
+            ["Match Rate", f"{(total_matched / max(result.total_a, 1) * 100):.2f}%"]
         ]
+        if "rows_aggregated_a" in summary:
+            summary_data += [["Rows Aggregated (A)", summary.get("rows_aggregated_a")],
+                             ["Rows Aggregated (B)", summary.get("rows_aggregated_b")]]
+        if "unpaired_a" in summary:
+            summary_data += [["Unpaired Duplicates (A)", len(summary.get("unpaired_a", []))],
+                             ["Unpaired Duplicates (B)", len(summary.get("unpaired_b", []))]]
+        if "probable_matches" in summary:
+            summary_data += [["Probable Matches (Orphans)", len(summary.get("probable_matches", []))]]
+        if "fast_path_cleared" in summary:
+            summary_data += [["Cleared by Row Fingerprint", summary.get("fast_path_cleared")]]
+        if "changed_since_last_run" in summary:
+            summary_data += [["", ""], ["Changed Since Last Run", summary.get("changed_since_last_run")]]
         
         df_summary = pd.DataFrame(summary_data)
         df_summary.to_excel(writer, sheet_name="Summary Dashboard", index=False, header=False)
@@ -80,51 +107,45 @@ class ExcelReporter:
         ws['A25'] = "3. Status 'MISMATCH' indicates the same key exists in both, but values differ."
         ws['A26'] = "4. Status 'ONLY IN A/B' indicates the record is entirely missing from one source."
 
-    def _write_detailed_sheet(self, writer, recon_data):
+    # Report wording per exception status: (Source A Value, Source B Value, Action Required)
+    STATUS_LABELS = {
+        VALUE_BREAK: (None, None, "Investigate Value Discrepancy"),
+        MISSING_IN_B: ("Record Present", "Record Missing", "Check Source B Extraction"),
+        MISSING_IN_A: ("Record Missing", "Record Present", "Check Source A Extraction"),
+        UNPAIRED_IN_A: ("Duplicate Present", "-", "Check Duplicate / Amendment in Source A"),
+        UNPAIRED_IN_B: ("-", "Duplicate Present", "Check Duplicate / Amendment in Source B"),
+    }
+
+    def _write_detailed_sheet(self, writer, result: ReconResult, sheet_name: str = "Exception Details"):
         """Helper to write and style the detailed reconciliation sheet."""
-        summary = recon_data.get("summary", {})
-        details = recon_data.get("detail", [])
-        key_name = recon_data.get("key_name", "Unique Record ID")
-        
         # WE ALWAYS LABEL THE FIRST COLUMN AS 'UNIQUE KEY' TO MATCH THE UI
         current_key_col = "UNIQUE KEY"
         
-        rows = []
-        # Add Mismatches
-        for item in details:
-            # IMPORTANT: item["key"] already contains the normalized, joined composite string (e.g. '699451+CA')
-            key_val = str(item["key"])
-            for col, diff in item["differences"].items():
-                rows.append({
-                    current_key_col: key_val,
-                    "Reconciliation Status": "VALUE BREAK",
-                    "Mapped Field Name": str(col),
-                    "Source A Value": str(diff.get("val_a", "")),
-                    "Source B Value": str(diff.get("val_b", "")),
-                    "Action Required": "Investigate Value Discrepancy"
-                })
-        
-        # Add Missing Rows
-        for key in summary.get("only_in_a", []):
-            rows.append({
-                current_key_col: str(key),
-                "Reconciliation Status": "MISSING IN B",
-                "Mapped Field Name": "N/A",
-                "Source A Value": "Record Present",
-                "Source B Value": "Record Missing",
-                "Action Required": "Check Source B Extraction"
-            })
-        for key in summary.get("only_in_b", []):
-            rows.append({
-                current_key_col: str(key),
-                "Reconciliation Status": "MISSING IN A",
-                "Mapped Field Name": "N/A",
-                "Source A Value": "Record Missing",
-                "Source B Value": "Record Present",
-                "Action Required": "Check Source A Extraction"
-            })
-            
-        df_details = pd.DataFrame(rows)
+        # Built column-wise from the status-coded exceptions frame (no per-row dicts)
+        exceptions = result.exceptions
+        status = exceptions["status"].astype(object)
+        is_break = (status == VALUE_BREAK).to_numpy()
+        
+        # IMPORTANT: the key already contains the normalized, joined composite string (e.g. '699451+CA')
+        key_val = exceptions["key"].map(str)
+        repeated = is_break & (exceptions["occurrence"].fillna(1) > 1).to_numpy()
+        key_val[repeated] = key_val[repeated] + " #" + exceptions["occurrence"][repeated].astype(int).astype(str)
+        
+        labels = status.map(self.STATUS_LABELS)
+        val_a = labels.str[0].astype(object)
+        val_b = labels.str[1].astype(object)
+        val_a[is_break] = exceptions["val_a"][is_break].map(str)
+        val_b[is_break] = exceptions["val_b"][is_break].map(str)
+        field = exceptions["column"].astype(object).where(is_break, "N/A").map(str)
+        
+        df_details = pd.DataFrame({
+            current_key_col: key_val,
+            "Reconciliation Status": status,
+            "Mapped Field Name": field,
+            "Source A Value": val_a,
+            "Source B Value": val_b,
+            "Action Required": labels.str[2],
+        })
         
         # Final Force: Ensure the columns are in the exact order requested
         cols_order = [current_key_col, "Reconciliation Status", "Mapped Field Name", "Source A Value", "Source B Value", "Action Required"]
@@ -135,9 +156,9 @@ class ExcelReporter:
             df_details = pd.DataFrame(columns=cols_order)
             df_details.loc[0] = ["No differences found", "MATCHED", "-", "-", "-", "None"]
 
-        df_details.to_excel(writer, sheet_name="Exception Details", index=False)
+        df_details.to_excel(writer, sheet_name=sheet_name, index=False)
         
-        ws = writer.sheets["Exception Details"]
+        ws = writer.sheets[sheet_name]
         
         # Apply header styling
         for cell in ws[1]:
@@ -151,7 +172,7 @@ class ExcelReporter:
             fill = None
             if status == "VALUE BREAK":
                 fill = self.MISMATCH_FILL
-            elif status and "MISSING" in str(status):
+            elif status and ("MISSING" in str(status) or "DUPLICATE" in str(status)):
                 fill = self.MISSING_FILL
             
             if fill:
@@ -169,16 +190,46 @@ class ExcelReporter:
                 except: pass
             ws.column_dimensions[column].width = max_length + 2
 
-    def _add_visualizations(self, writer, summary):
+    def _write_probable_matches_sheet(self, writer, matches: List[Dict]):
+        """Orphaned keys of A and B that look like the same record, best score first."""
+        df = pd.DataFrame(matches, columns=["key_a", "key_b", "score"])
+        df.columns = ["Key Only In A", "Key Only In B", "Similarity Score"]
+        df.to_excel(writer, sheet_name="Probable Matches", index=False)
+        ws = writer.sheets["Probable Matches"]
+        
+        for cell in ws[1]:
+            cell.fill = self.HEADER_FILL
+            cell.font = self.WHITE_FONT
+            cell.alignment = Alignment(horizontal="center")
+        for row in range(2, ws.max_row + 1):
+            for col in range(1, 4):
+                ws.cell(row=row, column=col).fill = self.MISSING_FILL
+        for letter in ["A", "B", "C"]:
+            ws.column_dimensions[letter].width = 22
+
+    def _write_plan_sheet(self, writer, plan: List[Dict]):
+        """Lists the comparator and tolerance the engine used for every mapped column pair."""
+        pd.DataFrame(plan).to_excel(writer, sheet_name="Comparison Plan", index=False)
+        ws = writer.sheets["Comparison Plan"]
+        
+        for cell in ws[1]:
+            cell.fill = self.HEADER_FILL
+            cell.font = self.WHITE_FONT
+            cell.alignment = Alignment(horizontal="center")
+        
+        for col in ws.columns:
+            ws.column_dimensions[col[0].column_letter].width = max(len(str(cell.value)) for cell in col) + 2
+
+    def _add_visualizations(self, writer, result: ReconResult):
         """Adds charts to the Summary sheet."""
         ws = writer.sheets["Summary Dashboard"]
         
         # Data for the pie chart
-        mismatches = summary.get("mismatches", 0)
-        only_a = len(summary.get("only_in_a", []))
-        only_b = len(summary.get("only_in_b", []))
+        mismatches = result.mismatches
+        only_a = len(result.only_in_a)
+        only_b = len(result.only_in_b)
         # Perfect matches are total matches minus mismatches
-        total_matched = summary.get("matched", 0) - mismatches
+        total_matched = result.matched - mismatches
         
         # Place chart data in a hidden area or specific range
         ws["Z1"] = "Category"
@@ -210,9 +261,9 @@ class ExcelReporter:
         ws["Z7"] = "Source"
         ws["AA7"] = "Count"
         ws["Z8"] = "Source A"
-        ws["AA8"] = summary.get("total_a")
+        ws["AA8"] = result.total_a
         ws["Z9"] = "Source B"
-        ws["AA9"] = summary.get("total_b")
+        ws["AA9"] = result.total_b
         
         data_bar = Reference(ws, min_col=27, min_row=7, max_row=9)
         cats_bar = Reference(ws, min_col=26, min_row=8, max_row=9)
@@ -226,3 +277,72 @@ class ExcelReporter:
         # Place Bar Chart below the Pie Chart, or to the right of the logic section
         ws.add_chart(bar, "M2")
 
+
+    def generate_multi_report(self, result, output_path: str):
+        """
+        Writes the report of an N-source run (MultiReconResult, see src/core/multiway.py):
+        per-source summary, key presence across sources and value breaks with the disagreeing source marked.
+        """
+        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            # 1. Summary per source
+            summary = result.source_summary()
+            summary.to_excel(writer, sheet_name="Summary Dashboard", index=False, startrow=3)
+            ws = writer.sheets["Summary Dashboard"]
+            ws['A1'] = "N-Way Reconciliation Summary Report"
+            ws['A1'].font = Font(size=16, bold=True, color="4472C4")
+            ws['A2'] = f"Generated At: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            ws.cell(row=len(summary) + 6, column=1, value="Keys in All Sources")
+            ws.cell(row=len(summary) + 6, column=2, value=result.in_all)
+            ws.cell(row=len(summary) + 7, column=1, value="Keys Missing Somewhere")
+            ws.cell(row=len(summary) + 7, column=2, value=len(result.presence) - result.in_all)
+            ws.cell(row=len(summary) + 8, column=1, value="Value Breaks")
+            ws.cell(row=len(summary) + 8, column=2, value=len(result.breaks))
+            for cell in ws[4]:
+                cell.fill = self.HEADER_FILL
+                cell.font = self.WHITE_FONT
+            for letter in ["A", "B", "C", "D", "E"]:
+                ws.column_dimensions[letter].width = 24
+
+            # 2. Keys that are missing from at least one source
+            presence = result.presence[~result.presence[result.sources].all(axis=1)]
+            missing = pd.DataFrame({"UNIQUE KEY": presence["key"].map(str)})
+            for source in result.sources:
+                missing[source] = np.where(presence[source], "Present", "Missing")
+            absent = ~presence[result.sources].to_numpy(dtype=bool)
+            missing["Missing From"] = [", ".join(np.array(result.sources)[row]) for row in absent]
+            self._write_multi_sheet(writer, missing, "Presence", {s: "Missing" for s in result.sources})
+
+            # 3. Value breaks, with the values of the disagreeing sources highlighted
+            breaks = result.breaks.rename(columns={"key": "UNIQUE KEY", "column": "Mapped Field Name", "status": "Reconciliation Status",
+                                                   "consensus": "Consensus Value", "disagreeing": "Disagreeing Source(s)"})
+            breaks = breaks.astype(object).where(breaks.notna(), "").map(str) if len(breaks) else breaks
+            self._write_multi_sheet(writer, breaks, "Value Breaks", None, result.sources)
+
+            # 4. Comparators used per column and source pair
+            if result.plan:
+                self._write_plan_sheet(writer, result.plan)
+
+    def _write_multi_sheet(self, writer, df: pd.DataFrame, sheet_name: str, flag_values: Dict[str, str] = None,
+                           sources: List[str] = None):
+        """Writes an N-way sheet; cells equal to flag_values[col], or of a source listed as disagreeing, are highlighted."""
+        if df.empty:
+            df = pd.DataFrame({"UNIQUE KEY": ["No differences found"]})
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
+        ws = writer.sheets[sheet_name]
+        header = [cell.value for cell in ws[1]]
+        for cell in ws[1]:
+            cell.fill = self.HEADER_FILL
+            cell.font = self.WHITE_FONT
+            cell.alignment = Alignment(horizontal="center")
+
+        disagreeing_col = header.index("Disagreeing Source(s)") + 1 if "Disagreeing Source(s)" in header else None
+        for row in range(2, ws.max_row + 1):
+            odd = set(str(ws.cell(row=row, column=disagreeing_col).value or "").split(", ")) if disagreeing_col else set()
+            for col, name in enumerate(header, start=1):
+                cell = ws.cell(row=row, column=col)
+                if flag_values and name in flag_values and cell.value == flag_values[name]:
+                    cell.fill = self.MISSING_FILL
+                elif sources and name in sources and name in odd:
+                    cell.fill = self.MISMATCH_FILL
+        for col in ws.columns:
+            ws.column_dimensions[col[0].column_letter].width = min(60, max(len(str(cell.value)) for cell in col) + 2)
@@ -2,50 +2,27 @@ import pdfplumber
 import pandas as pd
 import os
 import tempfile
+from typing import List
 import fitz  # PyMuPDF
 from src.handlers.base_handler import BaseHandler
 from src.handlers.ocr_handler import OCRHandler
 
 class PDFHandler(BaseHandler):
     """Handles extraction of tabular data from PDF files."""
-    
-    def read(self, file_path: str) -> pd.DataFrame:
+
+    native_projection = False
+
+    def engine_for(self, file_path: str) -> str:
+        return "pdfplumber/ocr"
+
+    def read(self, file_path: str, columns: List[str] = None) -> pd.DataFrame:
         """
         Reads a PDF file and attempts to extract the primary table.
         Concatenates tables across multiple pages if found.
+        Headers are only known after extraction, so `columns` is applied at the end.
         """
-        all_data = []
-        
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    # Extract tables from each page
-                    tables = page.extract_tables()
-                    for table in tables:
-                        if table:
-                            # Convert table list of lists to DataFrame
-                            df = pd.DataFrame(table)
-                            all_data.append(df)
-            
-            if not all_data:
-                # Fallback to OCR if no native tables were found
-                print("No native text tables found, falling back to OCR...")
-                ocr_handler = OCRHandler()
-                
-                # Use PyMuPDF (fitz) instead of pdf2image to avoid Poppler dependency on Windows
-                doc = fitz.open(file_path)
-                for page in doc:
-                    pix = page.get_pixmap()
-                    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp_img:
-                        temp_file_name = temp_img.name
-                    # Save after closing the file handle to avoid Windows permission errors
-                    pix.save(temp_file_name)
-                    df = ocr_handler.extract_table(temp_file_name)
-                    if not df.empty:
-                        all_data.append(df)
-                    os.remove(temp_file_name)
-                doc.close()
-                        
+            all_data = list(self._iter_pages(file_path))
             if not all_data:
                 return pd.DataFrame()
                 
@@ -56,18 +33,76 @@ class PDFHandler(BaseHandler):
             
             # Use the first row as header if it looks like one (standard PDF table behavior)
             if not final_df.empty:
-                final_df.columns = final_df.iloc[0]
+                final_df.columns = self._header(final_df.iloc[0])
                 final_df = final_df[1:].reset_index(drop=True)
                 
-                # Filter out any remaining empty column headers
-                final_df.columns = [str(c).strip() if c and str(c).strip() != "" else f"Col_{i}" for i, c in enumerate(final_df.columns)]
-                
-            return final_df
+            return self.clean_data(self.project(final_df, columns), source=file_path)
             
         except Exception as e:
             print(f"Error reading PDF {file_path}: {e}")
             return pd.DataFrame()
 
+    def read_chunks(self, file_path: str, chunksize: int, columns: List[str] = None):
+        """
+        Streams the table page by page (one chunk per page, `chunksize` is not used): the first row
+        of the first page is the header of every chunk, later pages are cut to its width.
+        """
+        header = None
+        try:
+            for page_df in self._iter_pages(file_path):
+                page_df = page_df.dropna(how='all').reset_index(drop=True)
+                if page_df.empty:
+                    continue
+                if header is None:
+                    header = self._header(page_df.iloc[0])
+                    page_df = page_df[1:].reset_index(drop=True)
+                page_df = page_df.reindex(columns=range(len(header)))
+                page_df.columns = header
+                yield self.clean_data(self.project(page_df, columns))
+        except Exception as e:
+            print(f"Error reading PDF {file_path}: {e}")
+        if header is None:
+            yield pd.DataFrame()
+
+    @staticmethod
+    def _header(first_row: pd.Series) -> List[str]:
+        # Filter out any remaining empty column headers
+        return [str(c).strip() if c and str(c).strip() != "" else f"Col_{i}" for i, c in enumerate(first_row)]
+
+    def _iter_pages(self, file_path: str):
+        """Yields the tables of each page as one raw frame (header row not split off yet), OCR if there are none."""
+        found = False
+        with pdfplumber.open(file_path) as pdf:
+            for page in pdf.pages:
+                # Extract tables from each page
+                tables = [pd.DataFrame(table) for table in page.extract_tables() if table]
+                if tables:
+                    found = True
+                    yield pd.concat(tables, ignore_index=True)
+
+        if not found:
+            # Fallback to OCR if no native tables were found
+            print("No native text tables found, falling back to OCR...")
+            ocr_handler = OCRHandler()
+            
+            # Use PyMuPDF (fitz) instead of pdf2image to avoid Poppler dependency on Windows
+            doc = fitz.open(file_path)
+            try:
+                for page in doc:
+                    pix = page.get_pixmap()
+                    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as temp_img:
+                        temp_file_name = temp_img.name
+                    # Save after closing the file handle to avoid Windows permission errors
+                    pix.save(temp_file_name)
+                    try:
+                        df = ocr_handler.extract_table(temp_file_name)
+                    finally:
+                        os.remove(temp_file_name)
+                    if not df.empty:
+                        yield df
+            finally:
+                doc.close()
+
     def write(self, df: pd.DataFrame, file_path: str):
         """Standard PDF writing isn't typical for this tool's internal handlers (outputs are Excel)."""
         raise NotImplementedError("Writing to PDF is not supported by this handler.")
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+from src.core.reconciler import ReconEngine
+
+
+def test_group_totals_match_a_plain_groupby():
+    rng = np.random.default_rng(7)
+    df_a = pd.DataFrame({"Deal Id": range(2000), "Book": rng.choice(["B1", "B2", "B3"], 2000),
+                         "Ccy": rng.choice(["USD", "EUR", "ZAR"], 2000), "Notional": rng.normal(1e6, 1e5, 2000).round(2)})
+    df_b = df_a.copy()
+    df_b.loc[df_b["Book"].eq("B3") & df_b["Ccy"].eq("ZAR"), "Notional"] += 10
+
+    result = ReconEngine(df_a, df_b).reconcile_aggregate("Book+Ccy", ["Notional"], {"Notional": "Notional"}, tolerance=0.01)
+    totals_a = df_a.groupby(["Book", "Ccy"])["Notional"].sum()
+    totals_b = df_b.groupby(["Book", "Ccy"])["Notional"].sum()
+    expected = sorted(f"{book} | {ccy}" for (book, ccy) in totals_a.index[(totals_a - totals_b).abs() > 0.01])
+
+    assert result["summary"]["matched"] == len(totals_a)
+    assert sorted(result.breaks["key"]) == expected == ["B3 | ZAR"]
+
+
+def test_group_parts_do_not_run_together():
+    df_a = pd.DataFrame({"Book": ["A", "AB"], "Ccy": ["BC", "C"], "Notional": [1.0, 2.0]})
+    df_b = pd.DataFrame({"Book": ["A", "AB"], "Ccy": ["BC", "C"], "Notional": [1.0, 5.0]})
+    result = ReconEngine(df_a, df_b).reconcile_aggregate("Book+Ccy", ["Notional"], {"Notional": "Notional"})
+    assert result["summary"]["matched"] == 2
+    assert result.breaks["key"].tolist() == ["AB | C"]
+
+
+if __name__ == "__main__":
+    test_group_totals_match_a_plain_groupby()
+    test_group_parts_do_not_run_together()
+    print("Success")
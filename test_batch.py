@@ -0,0 +1,65 @@
+import os
+import tempfile
+import pandas as pd
+from src.core.coordinator import ReconCoordinator
+from src.core.ingest_cache import IngestionCache
+
+
+class FailingReporter:
+    """Writes reports with the real reporter, except for files whose name contains `fail_on`."""
+
+    def __init__(self, reporter, fail_on: str):
+        self.reporter, self.fail_on = reporter, fail_on
+
+    def generate_report(self, recon_data, output_path):
+        if self.fail_on in os.path.basename(output_path):
+            raise IOError("disk full")
+        return self.reporter.generate_report(recon_data, output_path)
+
+
+def test_progress_is_reported_after_the_report_is_written():
+    with tempfile.TemporaryDirectory() as tmp:
+        pairs = []
+        for name in ["p1", "p2_bad", "p3"]:
+            df = pd.DataFrame({"Deal Id": [1, 2, 3], "Notional": [10.0, 20.0, 30.0]})
+            path_a, path_b = os.path.join(tmp, f"{name}_a.csv"), os.path.join(tmp, f"{name}_b.csv")
+            df.to_csv(path_a, index=False)
+            df.assign(Notional=[10.0, 20.0, 31.0]).to_csv(path_b, index=False)
+            pairs.append((path_a, path_b))
+
+        coordinator = ReconCoordinator()
+        coordinator.ingest_cache = IngestionCache(cache_dir=os.path.join(tmp, "cache"))
+        coordinator.reporter = FailingReporter(coordinator.reporter, "p2_bad")
+
+        # What the desktop app logs to its DB at each progress call
+        logged = []
+        def on_progress(done, total, outcome):
+            logged.append((outcome["status"], os.path.exists(outcome["output"])))
+
+        outcomes = coordinator.run_batch(pairs, "Deal Id", {"Deal Id": "Deal Id", "Notional": "Notional"},
+                                         output_dir=tmp, concurrency=1, on_progress=on_progress)
+        assert [o["status"] for o in outcomes] == ["SUCCESS", "FAILED", "SUCCESS"]
+        assert logged == [("SUCCESS", True), ("FAILED", False), ("SUCCESS", True)]
+
+
+def test_pool_workers_are_spawned_not_forked():
+    from src.core.batch import POOL_CONTEXT
+    assert POOL_CONTEXT.get_start_method() == "spawn"
+    with tempfile.TemporaryDirectory() as tmp:
+        pairs = []
+        for name in ["p1", "p2"]:
+            df = pd.DataFrame({"Deal Id": [1, 2, 3], "Notional": [10.0, 20.0, 30.0]})
+            path_a, path_b = os.path.join(tmp, f"{name}_a.csv"), os.path.join(tmp, f"{name}_b.csv")
+            df.to_csv(path_a, index=False)
+            df.to_csv(path_b, index=False)
+            pairs.append((path_a, path_b))
+        outcomes = ReconCoordinator().run_batch(pairs, "Deal Id", {"Deal Id": "Deal Id", "Notional": "Notional"},
+                                                output_dir=tmp, concurrency=2)
+        assert [o["status"] for o in outcomes] == ["SUCCESS", "SUCCESS"]
+        assert all(os.path.exists(o["output"]) for o in outcomes)
+
+
+if __name__ == "__main__":
+    test_progress_is_reported_after_the_report_is_written()
+    test_pool_workers_are_spawned_not_forked()
+    print("Success")
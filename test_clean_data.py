@@ -0,0 +1,27 @@
+import pandas as pd
+from src.core.reconciler import ReconEngine
+from src.handlers.csv_handler import CSVHandler
+
+
+def test_mixed_object_columns_keep_their_non_text_cells():
+    df = pd.DataFrame({"Amt": pd.Series([" 100 ", 200, 300.5], dtype=object),
+                       "Deal Id": pd.Series(["X1 ", 2, 3], dtype=object)})
+    cleaned = CSVHandler().clean_data(df)
+    assert cleaned["Amt"].tolist() == ["100", 200, 300.5]
+    assert cleaned["Deal Id"].tolist() == ["X1", 2, 3]
+    assert not cleaned.isna().any().any()
+
+
+def test_mixed_key_column_still_matches_every_row():
+    # Excel id column: one text id, the rest read as numbers
+    df_a = CSVHandler().clean_data(pd.DataFrame({"Deal Id": pd.Series(["X1", 2, 3], dtype=object), "Notional": [1.0, 2.0, 3.0]}))
+    df_b = CSVHandler().clean_data(pd.DataFrame({"Deal Id": pd.Series(["X1", 2, 3], dtype=object), "Notional": [1.0, 2.0, 3.0]}))
+    result = ReconEngine(df_a, df_b).reconcile("Deal Id", {"Deal Id": "Deal Id", "Notional": "Notional"})
+    assert result["summary"]["matched"] == 3
+    assert result.mismatches == 0
+
+
+if __name__ == "__main__":
+    test_mixed_object_columns_keep_their_non_text_cells()
+    test_mixed_key_column_still_matches_every_row()
+    print("Success")
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import pandas as pd
+from src.core.coordinator import ReconCoordinator
+from src.core.ingest_cache import IngestionCache
+from src.core.pipeline import StageTimer
+from src.handlers.csv_handler import CSVHandler
+
+
+def test_engine_for_reports_the_python_fallback():
+    with tempfile.TemporaryDirectory() as tmp:
+        # One column: csv.Sniffer finds no delimiter, so the read falls back to the Python parser
+        path_a, path_b = os.path.join(tmp, "a.csv"), os.path.join(tmp, "b.csv")
+        pd.DataFrame({"Deal Id": [1, 2, 3]}).to_csv(path_a, index=False)
+        pd.DataFrame({"Deal Id": [1, 2, 3], "Notional": [1.5, 2.5, 3.5]}).to_csv(path_b, index=False)
+
+        handler = CSVHandler()
+        handler.read(path_a)
+        handler.read(path_b)
+        assert handler.engine_for(path_a) == "python"
+        assert handler.engine_for(path_b) == "c"
+
+        coordinator = ReconCoordinator()
+        coordinator.ingest_cache = IngestionCache(cache_dir=os.path.join(tmp, "cache"))
+        timer = StageTimer()
+        coordinator.read_pair(path_a, path_b, timer)
+        assert sorted(s["stage"] for s in timer.stages) == ["read A [python]", "read B [c]"]
+
+
+def test_small_legacy_file_ending_in_an_accent_is_cp1252():
+    with tempfile.TemporaryDirectory() as tmp:
+        # The whole file fits in the sniff sample, so the last byte cannot be a cut-off character
+        path = os.path.join(tmp, "legacy.csv")
+        with open(path, "wb") as f:
+            f.write("Deal Id,Counterparty\n1,Soci\u00e9t\u00e9".encode("cp1252"))
+        handler = CSVHandler()
+        assert handler.sniff(path)["encoding"] == "cp1252"
+        assert handler.read(path)["Counterparty"].tolist() == ["Soci\u00e9t\u00e9"]
+
+
+if __name__ == "__main__":
+    test_engine_for_reports_the_python_fallback()
+    test_small_legacy_file_ending_in_an_accent_is_cp1252()
+    print("Success")
@@ -0,0 +1,50 @@
+import os
+import pandas as pd
+from src.core.coordinator import ReconCoordinator
+from src.core.reconciler import ReconEngine
+
+SAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "requirements")
+
+MAPPING = {"Deal Id": "Deal Id", "Trade Date": "Trade Date"}
+
+
+def reconcile(dates_a, dates_b, **kwargs):
+    df_a = pd.DataFrame({"Deal Id": range(1, len(dates_a) + 1), "Trade Date": dates_a})
+    df_b = pd.DataFrame({"Deal Id": range(1, len(dates_b) + 1), "Trade Date": dates_b})
+    return ReconEngine(df_a, df_b).reconcile("Deal Id", MAPPING, **kwargs)
+
+
+def test_ambiguous_dates_are_not_resolved_by_agreement():
+    # Month-first on A would make every row agree with B; nothing in A says it is month-first
+    result = reconcile(['01-02-2025', '03-04-2025', '05-06-2025'], ['02 January 2025', '04 March 2025', '06 May 2025'])
+    assert result["summary"]["mismatches"] == 3
+    assert reconcile(['01-02-2025', '03-04-2025', '05-06-2025'], ['02 January 2025', '04 March 2025', '06 May 2025'],
+                     workers=2)["summary"]["mismatches"] == 3
+
+
+def test_day_above_twelve_settles_the_order():
+    dates_a = ['01-02-2025', '03-04-2025', '05-06-2025', '12-25-2025']
+    result = reconcile(dates_a, ['02 January 2025', '04 March 2025', '06 May 2025', '25 December 2025'])
+    assert result["summary"]["mismatches"] == 0
+    assert "%m-%d-%Y vs %d %B %Y" in result["plan"][1]["Rule"]
+    result = reconcile(dates_a, ['2025-01-02', '2025-03-04', '2025-05-06', '2025-12-26'])
+    assert result["summary"]["mismatches"] == 1
+
+
+def test_sample_files_without_a_day_above_twelve_use_day_first():
+    # System1 settles 01-12-2025 .. 10-12-2025, System2 writes the same dates as "01 December 2025"
+    coordinator = ReconCoordinator()
+    df_a = coordinator.read_file(os.path.join(SAMPLES, "System1.csv"))
+    df_b = coordinator.read_file(os.path.join(SAMPLES, "System2.csv"))
+    mapping = {"Deal Id": "Trade Id", "Trade Date": "Trade Date", "Trade Settle Date": "Trade Settle Date"}
+    result = ReconEngine(df_a, df_b).reconcile("Deal Id", mapping)
+    assert result["summary"]["matched"] == 44
+    assert result["summary"]["mismatches"] == 0
+    assert [p["Comparator"] for p in result["plan"]][-2:] == ["date", "date"]
+
+
+if __name__ == "__main__":
+    test_ambiguous_dates_are_not_resolved_by_agreement()
+    test_day_above_twelve_settles_the_order()
+    test_sample_files_without_a_day_above_twelve_use_day_first()
+    print("Success")
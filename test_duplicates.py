@@ -0,0 +1,35 @@
+import pandas as pd
+from src.core.reconciler import ReconEngine
+
+MAPPING = {"Deal Id": "Deal Id", "Notional": "Notional", "Ccy": "Ccy"}
+
+
+def reconcile(rows_a, rows_b, duplicates, tolerance=1.0):
+    df_a = pd.DataFrame(rows_a, columns=["Deal Id", "Notional", "Ccy"])
+    df_b = pd.DataFrame(rows_b, columns=["Deal Id", "Notional", "Ccy"])
+    return ReconEngine(df_a, df_b).reconcile("Deal Id", MAPPING, tolerance=tolerance, duplicates=duplicates)
+
+
+def test_best_fit_pairs_the_closest_rows():
+    rows_a = [(1, 10.0, "USD"), (1, 20.0, "USD")]
+    rows_b = [(1, 21.0, "USD"), (1, 11.0, "USD")]
+    assert reconcile(rows_a, rows_b, "rank")["summary"]["mismatches"] == 2
+    result = reconcile(rows_a, rows_b, "best_fit")
+    assert result["summary"]["mismatches"] == 0
+    assert result["summary"]["matched"] == 2
+
+
+def test_best_fit_keeps_exact_matches_and_flags_the_amendment():
+    # The amended row (ccy and notional changed) still pairs with its nearest counterpart
+    rows_a = [(7, 100.0, "EUR"), (7, 250.0, "USD"), (7, 990.0, "GBP")]
+    rows_b = [(7, 990.0, "GBP"), (7, 252.5, "USD"), (7, 100.0, "EUR")]
+    result = reconcile(rows_a, rows_b, "best_fit")
+    assert result["summary"]["mismatches"] == 1
+    assert result.breaks["val_a"].tolist() == [250.0]
+    assert result.breaks["val_b"].tolist() == [252.5]
+
+
+if __name__ == "__main__":
+    test_best_fit_pairs_the_closest_rows()
+    test_best_fit_keeps_exact_matches_and_flags_the_amendment()
+    print("Success")
@@ -0,0 +1,32 @@
+import pandas as pd
+from src.core.fingerprint import row_fingerprints
+from src.core.incremental import reconcile_incremental
+from src.core.reconciler import ReconEngine
+from src.handlers.csv_handler import CSVHandler
+
+MAPPING = {"Deal Id": "Deal Id", "Adj": "Adj"}
+
+
+def test_integer_width_does_not_change_the_fingerprint():
+    narrow = pd.DataFrame({"Adj": pd.Series([-1, 5, 100], dtype="int8")})
+    wide = pd.DataFrame({"Adj": pd.Series([-1, 5, 100], dtype="int16")})
+    assert (row_fingerprints(narrow, ["Adj"]) == row_fingerprints(wide, ["Adj"])).all()
+
+
+def test_unchanged_rows_stay_unchanged_when_the_column_range_grows():
+    # Day 1 fits int8 after clean_data; on day 2 one new row pushes the column to int16
+    day1 = pd.DataFrame({"Deal Id": [1, 2, 3], "Adj": [-1, 5, 100]})
+    day2 = pd.DataFrame({"Deal Id": [1, 2, 3, 4], "Adj": [-1, 5, 100, 1000]})
+    handler = CSVHandler()
+    day1, day2 = handler.clean_data(day1), handler.clean_data(day2)
+    assert day1["Adj"].dtype != day2["Adj"].dtype
+
+    _, state = reconcile_incremental(ReconEngine(day1, day1), "Deal Id", MAPPING)
+    result, _ = reconcile_incremental(ReconEngine(day2, day2), "Deal Id", MAPPING, state=state)
+    assert result["summary"]["changed_since_last_run"] == 1
+
+
+if __name__ == "__main__":
+    test_integer_width_does_not_change_the_fingerprint()
+    test_unchanged_rows_stay_unchanged_when_the_column_range_grows()
+    print("Success")
@@ -0,0 +1,57 @@
+import os
+import pandas as pd
+from src.core.fuzzy import KEY_WINDOW, _char_codes, find_probable_matches
+
+
+def reference_score(a: str, b: str) -> float:
+    """Shared head + tail over the longer key, on the full strings (no token bonus)."""
+    a, b = a.strip().lower(), b.strip().lower()
+    prefix = len(os.path.commonprefix([a, b]))
+    suffix = len(os.path.commonprefix([a[::-1], b[::-1]]))
+    return min(prefix + suffix, min(len(a), len(b))) / max(len(a), len(b), 1)
+
+
+def test_long_keys_are_scored_on_their_full_length():
+    key = "NATIONALSOCIALSECURITYFUND-UGANDA_TZ_FX_Corporate_A1"
+    other = key[:-2] + "Z9"
+    matches = find_probable_matches([key], [other])
+    assert len(matches) == 1
+    assert matches[0]["score"] < 1.0
+    assert matches[0]["score"] == round(reference_score(key, other), 3)
+
+
+def test_scores_match_the_reference():
+    only_a = ["ACME CORP", "CPTY_ACME_LONDON_" + "X" * 60 + "_001", "BOOK7+USD+FX_SWAP_NEAR_LEG_2025-03-14"]
+    only_b = ["ACNE CORP", "CPTY_ACME_LONDON_" + "X" * 60 + "_002", "BOOK7+USD+FX_SWAP_NEAR_LEG_2025-03-15"]
+    matches = find_probable_matches(only_a, only_b, min_score=0.5)
+    assert len(matches) == 3
+    for m in matches:
+        assert m["score"] == round(reference_score(m["key_a"], m["key_b"]), 3)
+        assert m["score"] < 1.0
+
+
+def test_one_very_long_key_does_not_widen_the_code_matrix():
+    long_a = "BOOK_" + "X" * 300 + "_A1"
+    long_b = "BOOK_" + "X" * 300 + "_B2"
+    codes, rev_codes = _char_codes(pd.Series([long_a, long_b, "699296"], dtype=object))
+    assert codes.shape[1] == rev_codes.shape[1] == KEY_WINDOW
+    # Pairs agreeing on a whole window are still scored on their full strings
+    matches = find_probable_matches([long_a, "ACME CORP"], [long_b, "ACNE CORP"], min_score=0.5)
+    scores = {m["key_a"]: m["score"] for m in matches}
+    assert scores[long_a] == round(reference_score(long_a, long_b), 3)
+
+
+def test_adjacent_numeric_ids_are_not_suggested():
+    only_a = [str(i) for i in range(12345, 12445, 2)]
+    only_b = [str(i) for i in range(12346, 12446, 2)]
+    assert find_probable_matches(only_a, only_b) == []
+    # Padding of a numeric id is still found
+    assert find_probable_matches(["0699296"], ["699296"])[0]["key_b"] == "699296"
+
+
+if __name__ == "__main__":
+    test_long_keys_are_scored_on_their_full_length()
+    test_scores_match_the_reference()
+    test_one_very_long_key_does_not_widen_the_code_matrix()
+    test_adjacent_numeric_ids_are_not_suggested()
+    print("Success")
@@ -0,0 +1,63 @@
+import pandas as pd
+from src.core.incremental import reconcile_incremental
+from src.core.partition import SpillReconciler
+from src.core.reconciler import ReconEngine
+
+MAPPING = {"Deal Id": "Deal Id", "Trade Date": "Trade Date", "Notional": "Notional"}
+
+
+def make_day():
+    # Day-first dates; only the 25-12-2025 rows say so
+    dates = [f"{(i % 12) + 1:02d}-{(i % 11) + 1:02d}-2025" if i % 10 else "25-12-2025" for i in range(100)]
+    df = pd.DataFrame({"Deal Id": range(1, 101), "Trade Date": dates, "Notional": [1000.0 * i for i in range(100)]})
+    return df, df.copy()
+
+
+def breaks_of(result) -> list:
+    return sorted(result.breaks[["key", "column"]].itertuples(index=False, name=None))
+
+
+def test_incremental_equals_full_run():
+    df_a, df_b = make_day()
+    _, state = reconcile_incremental(ReconEngine(df_a, df_b), "Deal Id", MAPPING)
+
+    # Day 2: one B date is written in another format; the full run compares that column as text
+    df_b.loc[60, "Trade Date"] = "25 December 2025"
+    incremental, _ = reconcile_incremental(ReconEngine(df_a, df_b), "Deal Id", MAPPING, state=state)
+    full = ReconEngine(df_a, df_b).reconcile("Deal Id", MAPPING)
+    spill = SpillReconciler(num_partitions=4).reconcile([df_a], [df_b], "Deal Id", MAPPING)
+
+    assert incremental["summary"]["mismatches"] == full["summary"]["mismatches"] == spill["summary"]["mismatches"] == 1
+    assert breaks_of(incremental) == breaks_of(full) == breaks_of(spill)
+
+
+def test_incremental_breaks_keep_the_full_run_order():
+    df_a, df_b = make_day()
+    # Day 1 breaks on two keys, both reused on day 2
+    df_b.loc[[10, 50], "Notional"] += 1
+    df_b.loc[50, "Trade Date"] = "01-01-2025"
+    _, state = reconcile_incremental(ReconEngine(df_a, df_b), "Deal Id", MAPPING)
+
+    # Day 2: a new break between them
+    df_b.loc[30, ["Trade Date", "Notional"]] = ["02-02-2025", 1.0]
+    incremental, _ = reconcile_incremental(ReconEngine(df_a, df_b), "Deal Id", MAPPING, state=state)
+    full = ReconEngine(df_a, df_b).reconcile("Deal Id", MAPPING)
+
+    order = full.breaks[["key", "column"]].astype(object).values.tolist()
+    assert [k for k, _ in order] == ["11", "31", "31", "51", "51"]
+    assert incremental.breaks[["key", "column"]].astype(object).values.tolist() == order
+
+
+def test_layout_change_runs_a_full_comparison():
+    df_a, df_b = make_day()
+    _, state = reconcile_incremental(ReconEngine(df_a, df_b), "Deal Id", MAPPING)
+    df_b["Book"] = "B1"
+    result, _ = reconcile_incremental(ReconEngine(df_a, df_b), "Deal Id", MAPPING, state=state)
+    assert result["summary"]["changed_since_last_run"] == 100
+
+
+if __name__ == "__main__":
+    test_incremental_equals_full_run()
+    test_incremental_breaks_keep_the_full_run_order()
+    test_layout_change_runs_a_full_comparison()
+    print("Success")
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import pandas as pd
+from src.core.coordinator import ReconCoordinator
+from src.core.ingest_cache import IngestionCache
+
+
+def coordinator_with_cache(cache_dir: str) -> ReconCoordinator:
+    coordinator = ReconCoordinator()
+    coordinator.ingest_cache = IngestionCache(cache_dir=cache_dir)
+    return coordinator
+
+
+def test_projected_read_reuses_the_cached_full_parse():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "a.csv")
+        pd.DataFrame({"Deal Id": [1, 2, 3], "Ccy": ["USD", "EUR", "USD"], "Notional": [1.5, 2.5, 3.5],
+                      "Book": ["B1", "B2", "B3"]}).to_csv(path, index=False)
+        columns = ["Deal Id", "Notional"]
+
+        # Desktop/batch auto_map: the full file first, then the projected run read
+        coordinator = coordinator_with_cache(os.path.join(tmp, "cache"))
+        coordinator.read_file(path)
+        projected = coordinator.read_file(path, columns)
+        assert coordinator.ingest_cache.stats["misses"] == 1
+
+        # Same frame as a projected parse of the file
+        fresh = coordinator_with_cache(os.path.join(tmp, "cache2"))
+        pd.testing.assert_frame_equal(projected, fresh.read_file(path, columns))
+
+        # The disk tier is used as well (new process, empty memory tier)
+        restarted = coordinator_with_cache(os.path.join(tmp, "cache"))
+        restarted.read_file(path, columns)
+        assert restarted.ingest_cache.stats["misses"] == 0
+        assert restarted.ingest_cache.stats["disk_hits"] == 1
+
+
+def test_frames_larger_than_the_disk_limit_are_not_written():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = IngestionCache(cache_dir=os.path.join(tmp, "cache"), disk_limit_mb=1)
+        path = os.path.join(tmp, "big.csv")
+        open(path, "w").close()
+        big = pd.DataFrame({"Deal Id": range(200000), "Book": ["TZ_FX_Corporate"] * 200000})
+        cache.read(path, lambda: big)
+        # Not written (and evicted again) at all
+        assert cache.stats["evictions"] == 0
+        assert not os.path.exists(cache.cache_dir) or os.listdir(cache.cache_dir) == []
+        small = os.path.join(tmp, "small.csv")
+        open(small, "w").close()
+        cache.read(small, lambda: big.head(10))
+        assert len(os.listdir(cache.cache_dir)) == 1
+
+
+def test_new_cleaning_rules_do_not_reuse_old_entries():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "a.csv")
+        pd.DataFrame({"Deal Id": [1, 2, 3], "Notional": [1.5, 2.5, 3.5]}).to_csv(path, index=False)
+        coordinator_with_cache(os.path.join(tmp, "cache")).read_file(path)
+
+        upgraded = coordinator_with_cache(os.path.join(tmp, "cache"))
+        upgraded.csv_handler.cache_version += 1
+        upgraded.read_file(path)
+        assert upgraded.ingest_cache.stats["misses"] == 1
+        assert upgraded.ingest_cache.stats["disk_hits"] == 0
+
+
+if __name__ == "__main__":
+    test_projected_read_reuses_the_cached_full_parse()
+    test_frames_larger_than_the_disk_limit_are_not_written()
+    test_new_cleaning_rules_do_not_reuse_old_entries()
+    print("Success")
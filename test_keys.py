@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+from src.core.keys import normalize_key, normalize_key_column
+
+EDGE_CASES = [
+    "1e400", "-1e400", "1e-400", "-0", "0", "-0.0", "nan", "NaN", "None", " 007 ", "00123", "0.50", "1_000",
+    "12345678901234567890", "+5", "5.", ".5", "inf", "-Infinity", "1e308", "0x10", "1,000", "", " ", " x y ",
+    "699451", "699451.0", "ABC-001",
+]
+
+
+def assert_same_as_scalar(series: pd.Series):
+    expected = [normalize_key(v) for v in series]
+    assert normalize_key_column(series).tolist() == expected
+
+
+def test_text_edge_cases_match_normalize_key():
+    assert_same_as_scalar(pd.Series(EDGE_CASES, dtype=object))
+    assert_same_as_scalar(pd.Series(EDGE_CASES, dtype="str"))
+    assert_same_as_scalar(pd.Series(EDGE_CASES + [None, np.nan], dtype=object))
+
+
+def test_numeric_and_mixed_columns_match_normalize_key():
+    assert_same_as_scalar(pd.Series([-0.0, 0.0, 1.5, np.inf, -np.inf, np.nan, 2.0 ** 63, 1e300, 699451.0]))
+    assert_same_as_scalar(pd.Series([1, -1, 0, 2 ** 62], dtype="int64"))
+    assert_same_as_scalar(pd.Series([1, "1e400", 2.5, None, "007", True], dtype=object))
+
+
+if __name__ == "__main__":
+    test_text_edge_cases_match_normalize_key()
+    test_numeric_and_mixed_columns_match_normalize_key()
+    print("Success")
@@ -0,0 +1,49 @@
+import itertools
+import numpy as np
+import pandas as pd
+from src.core.multiway import MultiSourceReconciler
+from src.core.reconciler import ReconEngine
+
+MAPPING = {"Id": "Id", "Amt": "Amt", "Ccy": "Ccy"}
+
+
+def make_sources(n: int = 300):
+    """Three copies of one book, each with its own few wrong cells and missing keys (never two wrong on one cell)."""
+    rng = np.random.default_rng(3)
+    base = pd.DataFrame({"Id": np.arange(n), "Amt": rng.normal(1e5, 1e4, n).round(2),
+                         "Ccy": rng.choice(["USD", "EUR", "ZAR"], n)})
+    sources = [base.copy() for _ in range(3)]
+    cells = rng.permutation(n)
+    for s, df in enumerate(sources):
+        wrong_amt, wrong_ccy = cells[s * 20:s * 20 + 10], cells[s * 20 + 10:s * 20 + 20]
+        df.loc[wrong_amt, "Amt"] += 5
+        df.loc[wrong_ccy, "Ccy"] = "GBP"
+    # Keys missing from one source each
+    return [df.drop(index=cells[100 + s * 5:105 + s * 5]).reset_index(drop=True) for s, df in enumerate(sources)]
+
+
+def test_consensus_agrees_with_pairwise_recons():
+    sources = make_sources()
+    names = ["FO", "BO", "CUST"]
+    result = MultiSourceReconciler().reconcile(sources, names, "Id", [MAPPING, MAPPING])
+    assert set(result.breaks["status"]) == {"VALUE BREAK"}
+
+    for (i, a), (j, b) in itertools.combinations(enumerate(names), 2):
+        pairwise = ReconEngine(sources[i], sources[j]).reconcile("Id", MAPPING)
+        expected = {(str(k), c) for k, c in zip(pairwise.breaks["key"], pairwise.breaks["column"])}
+
+        # A pair disagrees on a consensus break when exactly one of the two is the odd one out
+        both = result.breaks[result.breaks[a].notna() & result.breaks[b].notna()]
+        odd = both["disagreeing"].str.split(", ")
+        disagree = odd.map(lambda s: (a in s) != (b in s))
+        found = {(str(k), c) for k, c in zip(both["key"][disagree], both["column"][disagree])}
+        assert found == expected and len(expected) > 0, (a, b)
+
+        present = result.presence
+        assert sorted(pairwise.only_in_a) == sorted(present["key"][present[a] & ~present[b]])
+        assert sorted(pairwise.only_in_b) == sorted(present["key"][~present[a] & present[b]])
+
+
+if __name__ == "__main__":
+    test_consensus_agrees_with_pairwise_recons()
+    print("Success")
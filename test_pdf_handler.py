@@ -1,11 +1,53 @@
-import sys
 import os
+import tempfile
+import warnings
+import pandas as pd
+from src.handlers import base_handler
 from src.handlers.pdf_handler import PDFHandler
 
-handler = PDFHandler()
-df1 = handler.read("sample_native.pdf")
-print("Native:")
-print(df1)
-df2 = handler.read("sample_scanned.pdf")
-print("Scanned:")
-print(df2)
+warnings.filterwarnings("ignore")
+import fitz  # noqa: E402
+
+
+def write_table_pdf(path: str, pages: int = 3, rows_per_page: int = 10):
+    """Ruled Trade Id / Amount / Ccy table over several pages, header on the first page only."""
+    doc = fitz.open()
+    row_id = 0
+    for page_no in range(pages):
+        page = doc.new_page()
+        rows = ([["Trade Id", "Amount", "Ccy"]] if page_no == 0 else [])
+        rows += [[str(100 + row_id + i), f"{(row_id + i) * 1.5:.2f}", "USD"] for i in range(rows_per_page)]
+        row_id += rows_per_page
+        x0, y0, w, h = 50, 50, 120, 20
+        for r, row in enumerate(rows):
+            for c, v in enumerate(row):
+                page.insert_text((x0 + c * w + 5, y0 + r * h + 14), v)
+        for r in range(len(rows) + 1):
+            page.draw_line((x0, y0 + r * h), (x0 + 3 * w, y0 + r * h))
+        for c in range(4):
+            page.draw_line((x0 + c * w, y0), (x0 + c * w, y0 + len(rows) * h))
+    doc.save(path)
+
+
+def test_chunks_are_cleaned_like_read():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trades.pdf")
+        write_table_pdf(path)
+        handler = PDFHandler()
+        # A PDF page holds far fewer rows than CATEGORY_MIN_ROWS, lower it so cleaning shows in the dtypes
+        min_rows, base_handler.CATEGORY_MIN_ROWS = base_handler.CATEGORY_MIN_ROWS, 5
+        try:
+            full = handler.read(path)
+            chunks = list(handler.read_chunks(path, 5))
+        finally:
+            base_handler.CATEGORY_MIN_ROWS = min_rows
+        assert [len(c) for c in chunks] == [10, 10, 10]
+        assert isinstance(full["Ccy"].dtype, pd.CategoricalDtype)
+        for chunk in chunks:
+            assert isinstance(chunk["Ccy"].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(full, pd.concat(chunks, ignore_index=True))
+
+
+if __name__ == "__main__":
+    test_chunks_are_cleaned_like_read()
+    print("Success")
@@ -0,0 +1,17 @@
+import pandas as pd
+from src.core.result import ReconResult
+
+
+def test_result_leaves_the_callers_breaks_untouched():
+    breaks = pd.DataFrame({"key": ["1", "2"], "occurrence": [0, 0], "column": ["Notional", "Ccy"],
+                           "val_a": [10.0, "USD"], "val_b": [11.0, "EUR"]})
+    before = breaks.copy()
+    result = ReconResult("Deal Id", 2, 2, 2, breaks)
+    pd.testing.assert_frame_equal(breaks, before)
+    assert isinstance(result.breaks["column"].dtype, pd.CategoricalDtype)
+    assert result.mismatches == 2
+
+
+if __name__ == "__main__":
+    test_result_leaves_the_callers_breaks_untouched()
+    print("Success")